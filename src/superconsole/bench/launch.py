@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import platform as host_platform
+import statistics
+import stat
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from ..services import env_probe, game_launcher
+from ..services.emulator_supervisor import EmulatorSupervisor
+from ..services.launch_timing import STAGES, LaunchTiming
+from ..services.library_db import connect, init_db, mark_played, record_launch_stats, upsert_games
+from .suite import RESULTS_VERSION
+
+# End-to-end launch_game benchmark without real emulators: every registry entry
+# is pointed at a tiny shell script that just exits, so the whole
+# pipeline (mark_played, config patching, path handling, Popen, exit tracking)
+# runs on a plain Linux box. Config dirs the registry patches are created next
+# to the stubs so that work is measured too.
+
+STUB_SCRIPT = "#!/bin/sh\nexit 0\n"
+
+
+def _write_stub(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(STUB_SCRIPT, encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+def _stub_plans(root: Path) -> dict[str, Any]:
+    plans = {}
+    for name, plan in game_launcher.PLANS.items():
+        exe = root / plan.emulator / "emulator.sh"
+        if not exe.exists():
+            _write_stub(exe)
+            # What the default registry patches, so config work is part of the run.
+            for sub in ("Config", "User/Config", "inis"):
+                (exe.parent / sub).mkdir(parents=True, exist_ok=True)
+            (exe.parent / "inis" / "PCSX2.ini").touch()
+        plans[name] = dataclasses.replace(plan, exe=exe)
+    return plans
+
+
+@contextmanager
+def stub_emulators(root: Path):
+    """Swaps the launcher's plans (and the probed facts) for stubs under `root`."""
+    saved = (game_launcher.PLANS, game_launcher.EMULATOR_PATHS, env_probe._facts)
+    plans = _stub_plans(root)
+    game_launcher.PLANS = plans
+    game_launcher.EMULATOR_PATHS = {p: plan.exe for p, plan in plans.items()}
+    env_probe._facts = env_probe.EnvFacts(
+        wsl=False, user_profile=None, autohotkey=None,
+        emulators={p: True for p in plans},
+    )
+    try:
+        yield plans
+    finally:
+        game_launcher.PLANS, game_launcher.EMULATOR_PATHS, env_probe._facts = saved
+
+
+def _summary(values_ms: list[float]) -> dict[str, Any]:
+    runs = [v / 1000.0 for v in values_ms]  # seconds, like the library stages
+    return {"min": min(runs), "median": statistics.median(runs), "max": max(runs), "runs": runs}
+
+
+def run_launch(repeat: int = 3, platforms: list[str] | None = None) -> dict[str, Any]:
+    """Launches every platform `repeat` times against stubs; per-stage timings."""
+    supervisor = EmulatorSupervisor()  # private instance; the app's stays untouched
+    rows: list[dict[str, Any]] = []
+    quiet = [logging.getLogger(n) for n in ("superconsole.services.emulator_supervisor",
+                                            "superconsole.services.game_launcher")]
+    levels = [lg.level for lg in quiet]
+    for lg in quiet:
+        lg.setLevel(logging.WARNING)  # one INFO line per stub launch otherwise
+    with tempfile.TemporaryDirectory(prefix="superconsole-launch-") as tmp:
+        root = Path(tmp)
+        con = connect(root / "bench.sqlite3")
+        init_db(con)
+        try:
+            with stub_emulators(root / "emulators") as plans:
+                targets = sorted(platforms or plans)
+                roms = []
+                for p in targets:
+                    rom = root / "roms" / p / "game.rom"
+                    rom.parent.mkdir(parents=True, exist_ok=True)
+                    rom.write_bytes(b"\0" * 1024)
+                    roms.append({
+                        "platform": p, "title": p, "game_dir": p, "launch_target": str(rom),
+                        "launch_type": "file", "cover_path": None, "mtime": 0, "size": 1024,
+                    })
+                upsert_games(con, roms)
+                ids = {r["platform"]: r["id"] for r in con.execute("SELECT id, platform FROM games")}
+
+                for _ in range(max(1, repeat)):
+                    for p in targets:
+                        timing = LaunchTiming(p, ids[p])
+                        mark_played(con, ids[p])
+                        timing.mark("mark_played")
+                        proc = game_launcher.launch_game(p, str(root / "roms" / p / "game.rom"), timing=timing)
+                        done = threading.Event()
+                        session = supervisor.track(proc, p, on_exit=lambda _s: done.set(), timing=timing)
+                        if not done.wait(10):
+                            proc.kill()
+                            raise RuntimeError(f"stub emulator for {p} did not exit")
+                        rows.append(timing.row(session.first_event_at, session.first_event))
+                record_launch_stats(con, rows)
+        finally:
+            con.close()
+            for lg, level in zip(quiet, levels):
+                lg.setLevel(level)
+
+    stages = {f"launch_{s}": _summary([r[f"{s}_ms"] or 0.0 for r in rows]) for s in STAGES}
+    stages["launch_first_output"] = _summary([r["first_output_ms"] or 0.0 for r in rows])
+    stages["launch_total"] = _summary([r["total_ms"] for r in rows])
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "games": len(rows),
+            "platforms": len(targets),
+            "repeat": repeat,
+            "stub": STUB_SCRIPT.splitlines()[-1],
+            "python": sys.version.split()[0],
+            "host": host_platform.platform(),
+            "cpus": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "stages": stages,
+    }
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Latency injection for filesystem metadata calls, to approximate the WSL
+# /mnt/<drive> (9p/drvfs) mount where every stat or directory listing is a
+# round trip to Windows. Only paths under `roots` are slowed down, so the DB
+# and Python's own imports are unaffected.
+
+_PATCHED = ("stat", "lstat", "scandir", "listdir")
+
+
+@contextmanager
+def slow_fs(roots: list[Path], latency_ms: float):
+    if latency_ms <= 0:
+        yield None
+        return
+
+    prefixes = tuple(os.fspath(r) for r in roots)
+    delay = latency_ms / 1000.0
+    originals = {name: getattr(os, name) for name in _PATCHED}
+    calls = {"count": 0}
+
+    def _wrap(fn):
+        def wrapper(path=".", *args, **kwargs):
+            p = path if isinstance(path, int) else os.fspath(path)
+            if isinstance(p, str) and p.startswith(prefixes):
+                calls["count"] += 1
+                time.sleep(delay)
+            return fn(path, *args, **kwargs)
+        return wrapper
+
+    for name, fn in originals.items():
+        setattr(os, name, _wrap(fn))
+    try:
+        yield calls
+    finally:
+        for name, fn in originals.items():
+            setattr(os, name, fn)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from ..paths import PLACEHOLDER_COVER
+from ..services.library_db import connect, init_db, list_games, list_platforms
+from ..services.library_state import load_all_state
+from ..services.library_sync import sync_library
+from ..services.rom_scanner import scan_roms, ScanConfig
+from .slowfs import slow_fs
+
+RESULTS_VERSION = 1
+REGRESSION_THRESHOLD = 0.10  # median more than 10% slower than baseline
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    runs = []
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return {"min": min(runs), "median": statistics.median(runs), "max": max(runs), "runs": runs}
+
+
+def run_stages(cfg: ScanConfig, repeat: int = 3, slow_fs_ms: float = 0.0) -> dict[str, Any]:
+    """
+    Times scan -> sync (cold, then warm with nothing changed) -> load against a
+    scratch DB. With `slow_fs_ms`, metadata calls under the ROM and image roots
+    get that much added latency.
+    """
+    stages: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="superconsole-bench-") as tmp:
+        con = connect(Path(tmp) / "bench.sqlite3")
+        init_db(con)
+        try:
+            with slow_fs([cfg.roms_root, cfg.images_root], slow_fs_ms):
+                stages["scan"] = _time(lambda: scan_roms(cfg), repeat)
+                stages["sync_cold"] = _time(lambda: sync_library(con, cfg), 1)
+                stages["sync_warm"] = _time(lambda: sync_library(con, cfg), repeat)
+            stages["load"] = _time(lambda: load_all_state(con), repeat)
+            games = len(list_games(con))
+            platforms = len(list_platforms(con))
+        finally:
+            con.close()
+
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "games": games,
+            "platforms": platforms,
+            "repeat": repeat,
+            "slow_fs_ms": slow_fs_ms,
+            "python": sys.version.split()[0],
+            "host": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "stages": stages,
+    }
+
+
+def run_synthetic(size: int, repeat: int = 3, slow_fs_ms: float = 0.0, workdir: Path | None = None) -> dict[str, Any]:
+    from .synth import generate
+
+    def _run(root: Path) -> dict[str, Any]:
+        t0 = time.perf_counter()
+        lib = generate(root, size)
+        generated = time.perf_counter() - t0
+        cfg = ScanConfig(
+            roms_root=lib.roms_root, images_root=lib.images_root, placeholder_cover=PLACEHOLDER_COVER,
+            digest_cache=root / "folder_digests.json", header_cache=root / "rom_headers.json", dats_dir=None,
+        )
+        results = run_stages(cfg, repeat=repeat, slow_fs_ms=slow_fs_ms)
+        results["meta"]["synthetic"] = {"games": lib.games, "per_platform": lib.per_platform, "generate_s": generated}
+        return results
+
+    if workdir is not None:
+        workdir.mkdir(parents=True, exist_ok=True)
+        return _run(workdir)
+    with tempfile.TemporaryDirectory(prefix="superconsole-synth-") as tmp:
+        return _run(Path(tmp))
+
+
+def save_results(path: Path, results: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float = REGRESSION_THRESHOLD) -> list[dict[str, Any]]:
+    """Per-stage median ratios against a baseline results file; `regressed` past the threshold."""
+    out = []
+    for stage, r in results["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        if not base or not base.get("median"):
+            continue
+        ratio = r["median"] / base["median"]
+        out.append({
+            "stage": stage,
+            "median": r["median"],
+            "baseline": base["median"],
+            "ratio": ratio,
+            "regressed": ratio > 1.0 + threshold,
+        })
+    return out
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+# Synthetic ROM/cover trees for benchmarks. Every platform layout the scanner
+# special-cases is represented, and covers are spread over the three lookup
+# paths find_cover takes (exact name, GC/Wii disc ID, fuzzy cleaned title)
+# plus games with no cover at all.
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+# platform -> relative share of the library
+PLATFORM_WEIGHTS = {
+    "nes": 14, "snes": 12, "gba": 10, "gb": 5, "gbc": 5, "n64": 8,
+    "ps1": 12, "ps2": 10, "ps3": 4, "gamecube": 8, "wii": 6, "wiiu": 3,
+    "xbox": 2, "xbox360": 1,
+}
+
+_CART_EXT = {"nes": ".nes", "snes": ".sfc", "gba": ".gba", "gb": ".gb", "gbc": ".gbc", "n64": ".z64"}
+_DISC_EXT = {"ps2": ".iso", "xbox": ".iso", "xbox360": ".iso"}
+_REGIONS = ("USA", "Europe", "Japan", "USA, Europe")
+_REGION_CODE = {"USA": "E", "Europe": "P", "Japan": "J", "USA, Europe": "E"}
+_WORDS = (
+    "super", "mega", "star", "dragon", "quest", "racing", "legend", "shadow", "fighter",
+    "kart", "island", "galaxy", "tennis", "soccer", "ninja", "castle", "robot", "ocean",
+    "crystal", "thunder", "dungeon", "pilot", "rally", "saga", "hero", "puzzle", "storm",
+)
+
+# Smallest valid PNG (1x1 transparent); enough for anything that opens covers.
+_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6300010000000500010d0a2db40000000049454e44ae426082"
+)
+
+
+@dataclass(frozen=True)
+class SyntheticLibrary:
+    roms_root: Path
+    images_root: Path
+    games: int
+    per_platform: dict[str, int]
+
+
+def _title(rng: random.Random, n: int) -> str:
+    words = rng.sample(_WORDS, rng.randint(1, 3))
+    return " ".join(w.title() for w in words) + f" {n}"
+
+
+def _disc_id(platform: str, n: int, region: str) -> str:
+    # GameCube IDs start with G, Wii with R; 3 chars of game code + region + 2-digit maker
+    prefix = "G" if platform == "gamecube" else "R"
+    code = "".join(chr(ord("A") + (n // 26 ** i) % 26) for i in range(2))
+    return f"{prefix}{code}{_REGION_CODE[region]}01"
+
+
+def _write(path: Path, data: bytes = b"\0" * 16) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _cover(images_root: Path, platform: str, stem: str) -> None:
+    _write(images_root / platform / "covers" / f"{stem}.png", _PNG)
+
+
+def generate(root: Path, games: int, seed: int = 1234) -> SyntheticLibrary:
+    """Builds `root/roms` and `root/images` with `games` games spread across all layouts."""
+    rng = random.Random(seed)
+    roms_root = root / "roms"
+    images_root = root / "images"
+    total_weight = sum(PLATFORM_WEIGHTS.values())
+    per_platform = {
+        p: max(1, games * w // total_weight) for p, w in PLATFORM_WEIGHTS.items()
+    }
+
+    for platform, count in per_platform.items():
+        (images_root / platform / "covers").mkdir(parents=True, exist_ok=True)
+        for n in range(count):
+            region = rng.choice(_REGIONS)
+            title = _title(rng, n)
+            folder = f"{title} ({region})"
+            disc_id = _disc_id(platform, n, region) if platform in {"gamecube", "wii"} else None
+            if disc_id:
+                folder = f"{folder} [{disc_id}]"
+            game_dir = roms_root / platform / folder
+
+            if platform in _CART_EXT:
+                _write(game_dir / f"{folder}{_CART_EXT[platform]}")
+            elif platform in _DISC_EXT:
+                _write(game_dir / f"{folder}{_DISC_EXT[platform]}")
+            elif platform == "ps1":
+                tracks = rng.randint(1, 3)
+                lines = []
+                for t in range(1, tracks + 1):
+                    bin_name = f"{folder} (Track {t}).bin"
+                    _write(game_dir / bin_name)
+                    lines.append(f'FILE "{bin_name}" BINARY\n  TRACK {t:02d} MODE2/2352\n    INDEX 01 00:00:00')
+                _write(game_dir / f"{folder}.cue", "\n".join(lines).encode())
+            elif platform == "ps3":
+                _write(game_dir / "PS3_GAME" / "USRDIR" / "EBOOT.BIN")
+            elif platform == "wiiu":
+                if n % 4:
+                    _write(game_dir / "meta" / "meta.xml", b"<menu></menu>")
+                _write(game_dir / "code" / f"game{n}.rpx")
+                _write(game_dir / "content" / "data.bin")
+            elif platform == "gamecube":
+                _write(game_dir / f"{disc_id}{rng.choice(('.iso', '.rvz'))}")
+            elif platform == "wii":
+                _write(game_dir / f"{disc_id}.wbfs")
+                for chunk in range(1, rng.randint(1, 3)):
+                    _write(game_dir / f"{disc_id}.wbf{chunk}")
+
+            # cover distribution: 50% exact, 25% fuzzy (or disc ID for GC/Wii), 25% none
+            roll = rng.random()
+            if roll < 0.5:
+                _cover(images_root, platform, folder)
+            elif roll < 0.75:
+                if disc_id:
+                    _cover(images_root, platform, disc_id)
+                else:
+                    # same cleaned title, different tags/separators -> only the fuzzy pass finds it
+                    _cover(images_root, platform, title.replace(" ", "_") + " [!]")
+
+    return SyntheticLibrary(
+        roms_root=roms_root,
+        images_root=images_root,
+        games=sum(per_platform.values()),
+        per_platform=per_platform,
+    )
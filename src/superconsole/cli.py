@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Headless subcommands. Nothing in here (or anything it imports) may pull in Kivy:
+# these run from cron on the NAS host and on boxes without a display.
+# main.py builds the parser on every start, UI included, so the scanner / sync /
+# DAT services are imported by the commands that use them, not up here.
+
+from .paths import ROMS_DIR, IMAGES_DIR, DB_PATH, DATS_DIR, PLACEHOLDER_COVER
+from .services.library_db import (
+    connect,
+    init_db,
+    list_games,
+    library_generation,
+)
+
+
+def add_subcommands(subparsers) -> None:
+    def _library_args(p: argparse.ArgumentParser, db: bool = True) -> None:
+        p.add_argument("--roms", type=Path, default=ROMS_DIR, help="ROMs root (default: data/roms)")
+        p.add_argument("--images", type=Path, default=IMAGES_DIR, help="images root (default: data/images)")
+        p.add_argument("--rpcs3-games", type=Path, default=None, metavar="DIR",
+                       help="RPCS3 dev_hdd0/game folder with installed PS3 games")
+        if db:
+            p.add_argument("--db", type=Path, default=DB_PATH, help="library DB (default: data/db)")
+        p.add_argument("--json", action="store_true", help="machine-readable output")
+
+    p = subparsers.add_parser("scan", help="scan ROM folders and print what was found (no DB writes)")
+    _library_args(p, db=False)
+
+    p = subparsers.add_parser("sync", help="scan and write the result into the library DB")
+    _library_args(p)
+
+    p = subparsers.add_parser("list", help="list games in the library DB")
+    _library_args(p)
+    p.add_argument("--platform", default=None)
+    p.add_argument("--favorites", action="store_true")
+    p.add_argument("--limit", type=int, default=0)
+
+    p = subparsers.add_parser("search", help="search game titles in the library DB")
+    _library_args(p)
+    p.add_argument("text")
+    p.add_argument("--platform", default=None)
+    p.add_argument("--limit", type=int, default=0)
+
+    p = subparsers.add_parser("stats", help="library DB statistics")
+    _library_args(p)
+
+    p = subparsers.add_parser("dats", help="import No-Intro/Redump DATs and identify games in the library DB")
+    _library_args(p)
+    p.add_argument("--dats", type=Path, default=DATS_DIR, help="DAT folder (default: data/dats)")
+
+    p = subparsers.add_parser("bench", help="time scan, sync and load against a scratch DB")
+    _library_args(p, db=False)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--synthetic", choices=("1k", "10k", "100k"), default=None,
+                   help="benchmark a generated library instead of --roms/--images")
+    p.add_argument("--workdir", type=Path, default=None,
+                   help="where to generate the synthetic library (default: a temp dir)")
+    p.add_argument("--slow-fs", type=float, default=0.0, metavar="MS",
+                   help="add MS of latency to every stat/listdir under the library roots")
+    p.add_argument("--launch", action="store_true",
+                   help="benchmark launch_game end to end against stub emulators instead")
+    p.add_argument("--out", type=Path, default=None, help="write results JSON here")
+    p.add_argument("--baseline", type=Path, default=None, help="compare against an earlier results JSON")
+
+
+def _scan_config(args):
+    from .services.rom_scanner import ScanConfig
+    return ScanConfig(
+        roms_root=args.roms,
+        images_root=args.images,
+        placeholder_cover=PLACEHOLDER_COVER,
+        rpcs3_dev_hdd0_game=args.rpcs3_games,
+    )
+
+
+def _emit(args, payload, lines) -> None:
+    if args.json:
+        json.dump(payload, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+        return
+    for line in lines:
+        print(line)
+
+
+def _open_db(path: Path):
+    con = connect(path)
+    init_db(con)
+    return con
+
+
+def cmd_scan(args) -> int:
+    from .services.rom_scanner import scan_roms
+
+    t0 = time.perf_counter()
+    games = scan_roms(_scan_config(args))
+    elapsed = time.perf_counter() - t0
+    per_platform: dict[str, int] = {}
+    for g in games:
+        per_platform[g.platform] = per_platform.get(g.platform, 0) + 1
+    _emit(
+        args,
+        {"count": len(games), "seconds": elapsed, "platforms": per_platform,
+         "games": [{"platform": g.platform, "title": g.title, "launch_target": str(g.launch_target),
+                    "serial": g.serial, "region": g.region} for g in games]},
+        [f"{p:<12} {n}" for p, n in sorted(per_platform.items())]
+        + [f"{len(games)} games in {elapsed:.2f}s"],
+    )
+    return 0
+
+
+def cmd_sync(args) -> int:
+    from .services.library_sync import sync_library
+
+    con = _open_db(args.db)
+    try:
+        t0 = time.perf_counter()
+        changes = sync_library(con, _scan_config(args))
+        elapsed = time.perf_counter() - t0
+    finally:
+        con.close()
+    _emit(
+        args,
+        {"count": changes.count, "seconds": elapsed, "added": changes.added,
+         "updated": changes.updated, "removed": changes.removed},
+        [f"{changes.count} games, +{len(changes.added)} ~{len(changes.updated)} -{len(changes.removed)} "
+         f"in {elapsed:.2f}s"],
+    )
+    return 0
+
+
+def _print_rows(args, rows) -> int:
+    if args.limit:
+        rows = rows[:args.limit]
+    _emit(
+        args,
+        [dict(r) for r in rows],
+        [f"{r['id']:>6}  {r['platform']:<10} {r['title']}" for r in rows],
+    )
+    return 0
+
+
+def cmd_list(args) -> int:
+    con = _open_db(args.db)
+    try:
+        return _print_rows(args, list_games(con, platform=args.platform, favorites_only=args.favorites))
+    finally:
+        con.close()
+
+
+def cmd_search(args) -> int:
+    con = _open_db(args.db)
+    try:
+        return _print_rows(args, list_games(con, platform=args.platform, search=args.text))
+    finally:
+        con.close()
+
+
+def _median_launch_ms(con) -> float | None:
+    totals = sorted(r[0] for r in con.execute("SELECT total_ms FROM launch_stats"))
+    if not totals:
+        return None
+    mid = len(totals) // 2
+    value = totals[mid] if len(totals) % 2 else (totals[mid - 1] + totals[mid]) / 2
+    return round(value, 1)
+
+
+def cmd_stats(args) -> int:
+    from .services.dat_index import duplicate_count
+
+    con = _open_db(args.db)
+    try:
+        per_platform = {
+            r[0]: r[1]
+            for r in con.execute("SELECT platform, COUNT(*) FROM games GROUP BY platform ORDER BY platform")
+        }
+        totals = con.execute(
+            """
+            SELECT COUNT(*), SUM(favorite), SUM(hidden),
+                   SUM(last_played IS NOT NULL), SUM(play_count), SUM(playtime_seconds)
+            FROM games
+            """
+        ).fetchone()
+        stats = {
+            "games": totals[0],
+            "favorites": totals[1] or 0,
+            "hidden": totals[2] or 0,
+            "played": totals[3] or 0,
+            "launches": totals[4] or 0,
+            "hours_played": round((totals[5] or 0) / 3600, 1),
+            "platforms": per_platform,
+            "identified": con.execute("SELECT COUNT(*) FROM games WHERE dat_title IS NOT NULL").fetchone()[0],
+            "duplicates": duplicate_count(con),
+            "launch_ms_median": _median_launch_ms(con),
+            "generation": library_generation(con),
+            "db_bytes": args.db.stat().st_size if args.db.exists() else 0,
+        }
+    finally:
+        con.close()
+    _emit(
+        args,
+        stats,
+        [f"{p:<12} {n}" for p, n in per_platform.items()]
+        + [f"{k:<12} {v}" for k, v in stats.items() if k != "platforms"],
+    )
+    return 0
+
+
+def cmd_dats(args) -> int:
+    from .services.dat_index import duplicate_count, identify_games, import_dats
+
+    con = _open_db(args.db)
+    try:
+        t0 = time.perf_counter()
+        imported = import_dats(con, args.dats)
+        retitled = identify_games(con, args.roms)
+        elapsed = time.perf_counter() - t0
+        identified = con.execute("SELECT COUNT(*) FROM games WHERE dat_title IS NOT NULL").fetchone()[0]
+        duplicates = duplicate_count(con)
+    finally:
+        con.close()
+    _emit(
+        args,
+        {**imported, "retitled": retitled, "identified": identified, "duplicates": duplicates, "seconds": elapsed},
+        [f"DATs: {imported['imported']} imported ({imported['roms']} roms), {imported['unchanged']} unchanged, "
+         f"{imported['removed']} removed",
+         f"{identified} games identified ({len(retitled)} changed), {duplicates} duplicates in {elapsed:.2f}s"],
+    )
+    return 0
+
+
+def cmd_bench(args) -> int:
+    from .bench.suite import run_stages, run_synthetic, save_results, compare
+    from .bench.synth import SIZES
+
+    if args.launch:
+        from .bench.launch import run_launch
+        results = run_launch(repeat=args.repeat)
+    elif args.synthetic:
+        results = run_synthetic(SIZES[args.synthetic], repeat=args.repeat,
+                                slow_fs_ms=args.slow_fs, workdir=args.workdir)
+    else:
+        results = run_stages(_scan_config(args), repeat=args.repeat, slow_fs_ms=args.slow_fs)
+    if args.out:
+        save_results(args.out, results)
+
+    comparison = []
+    if args.baseline:
+        comparison = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")))
+        results["comparison"] = comparison
+
+    meta = results["meta"]
+    lines = [f"{meta['games']} games on {meta['platforms']} platforms"]
+    lines += [
+        f"{stage:<10} min {r['min']*1000:9.1f} ms  median {r['median']*1000:9.1f} ms"
+        for stage, r in results["stages"].items()
+    ]
+    lines += [
+        f"{c['stage']:<10} {c['ratio']:5.2f}x baseline" + ("  REGRESSION" if c["regressed"] else "")
+        for c in comparison
+    ]
+    _emit(args, results, lines)
+    return 1 if any(c["regressed"] for c in comparison) else 0
+
+
+def run(args) -> int:
+    handlers = {
+        "scan": cmd_scan,
+        "sync": cmd_sync,
+        "list": cmd_list,
+        "search": cmd_search,
+        "stats": cmd_stats,
+        "dats": cmd_dats,
+        "bench": cmd_bench,
+    }
+    return handlers[args.command](args)
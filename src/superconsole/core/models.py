@@ -9,3 +9,9 @@ class Game:
     game_dir: Path          
     launch_target: Path     
     cover_path: Path        
+    archive_member: str | None = None  # ROM inside launch_target when it's a .zip
+    mtime: int | None = None           # fingerprint over every file the game needs
+    size: int | None = None            # (rom_files.fingerprint)
+    serial: str | None = None          # from the ROM header (rom_headers): game code / disc ID / title ID
+    region: str | None = None
+    internal_title: str | None = None  # title stored in the header, which may be truncated or upper-case
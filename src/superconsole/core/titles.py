@@ -1,10 +1,43 @@
 from __future__ import annotations
 import re
+from functools import lru_cache
 
 _TAGS_RE = re.compile(r"(\[[^\]]*\]|\([^)]*\))")  # [..] or (..)
+_DIGITS_RE = re.compile(r"\d+")
+_ARTICLES = ("the ", "a ", "an ")
+_TRAILING_ARTICLES = (", the", ", a", ", an")  # No-Intro style: "Legend of Zelda, The"
 
+@lru_cache(maxsize=1 << 16)
 def clean_title(name: str) -> str:
+    # Memoized: the cover index and sort keys clean the same names over and over.
     name = _TAGS_RE.sub("", name)
     name = name.replace("_", " ").replace(".", " ")
     name = re.sub(r"\s+", " ", name).strip()
     return name.lower()
+
+def sort_key(title: str) -> str:
+    """
+    Cleaned title without a leading/trailing article, digit runs zero-padded so
+    "Mega Man 10" sorts after "Mega Man 9". Stored in games.sort_key at sync.
+    """
+    key = clean_title(title)
+    for article in _TRAILING_ARTICLES:
+        if key.endswith(article):
+            key = key[: -len(article)]
+            break
+    for article in _ARTICLES:
+        if key.startswith(article):
+            key = key[len(article):]
+            break
+    key = _DIGITS_RE.sub(lambda m: m.group().zfill(8), key)
+    return key or title.lower()
+
+def title_letter(key: str) -> str:
+    """First-letter bucket of a sort key: A-Z, or # for anything else."""
+    c = key[:1].upper()
+    return c if "A" <= c <= "Z" else "#"
+
+def title_columns(title: str) -> tuple[str, str, str]:
+    """(title_norm, sort_key, letter) for a display title."""
+    key = sort_key(title)
+    return clean_title(title), key, title_letter(key)
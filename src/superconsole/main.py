@@ -1,15 +1,48 @@
 from __future__ import annotations
+from . import startup  # first, so the timeline starts before the heavy imports
+import argparse
 import logging
+import os
+import sys
+from pathlib import Path
 
 from .logging_setup import setup_logging
-from .validate import validate_or_raise
-from .state import AppState
-from .ui.app import SuperConsoleApp
+from . import tracing
 
-def main() -> int:
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="superconsole")
+    parser.add_argument(
+        "--trace", nargs="?", const="", default=None, metavar="FILE",
+        help="write a Chrome trace of scan/sync/load/launch spans at exit",
+    )
+    # Without a command the launcher UI starts; commands run headless (no Kivy).
+    from .cli import add_subcommands
+    add_subcommands(parser.add_subparsers(dest="command", metavar="command"))
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
     setup_logging(logging.INFO)
+    if args.trace is not None:
+        tracing.enable(Path(args.trace) if args.trace else None)
+    else:
+        tracing.enable_from_env()
+
+    if args.command:
+        from .cli import run
+        return run(args)
+
+    from .validate import validate_or_raise
     validate_or_raise()
 
+    # Our flags are handled above; keep Kivy from parsing sys.argv on import.
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    from .state import AppState
+    from .ui.app import SuperConsoleApp
+    startup.mark("imports")
+
     state = AppState()
     SuperConsoleApp(state=state).run()
     return 0
@@ -13,6 +13,11 @@ IMAGES_DIR=DATA_DIR / "images" # Images
 BIOS_DIR=DATA_DIR / "bios" # BIOS files
 EMULATORS_DIR=DATA_DIR / "emulators" # Emulators
 VIDEOS_DIR=DATA_DIR / "videos" # Videos
+CACHE_DIR=DATA_DIR / "cache" # Snapshots, index caches
+DATS_DIR=DATA_DIR / "dats" # No-Intro / Redump DAT files
+DB_PATH=DATA_DIR / "db" / "superconsole.sqlite3" # Library DB
+
+PLACEHOLDER_COVER=PROJECT_ROOT / "src" / "superconsole" / "ui" / "assets" / "default_cover.png"
 
 def is_symlink(path:Path) -> bool:
     """Check if a given path is a symlink."""
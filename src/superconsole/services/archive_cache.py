@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from pathlib import Path, PurePosixPath
+
+from ..paths import CACHE_DIR
+from ..tracing import traced
+
+# Zipped cartridge ROMs are indexed from the archive's member list and only
+# extracted when launched. Extractions live under data/cache/archives/<key>/,
+# where the key covers the archive's path, mtime, size and the member, so a
+# changed zip never serves a stale ROM. Entries are evicted least recently used
+# once the cache is over budget; a hit just bumps the entry's mtime.
+
+log = logging.getLogger(__name__)
+
+ARCHIVE_EXTS = {".zip"}
+ARCHIVE_CACHE_DIR = CACHE_DIR / "archives"
+ARCHIVE_CACHE_MB = int(os.environ.get("SUPERCONSOLE_ARCHIVE_CACHE_MB", "2048"))
+
+_lock = threading.Lock()
+
+
+def list_members(archive: Path) -> list[str]:
+    """File members of `archive` (central directory only, nothing is extracted)."""
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            return [i.filename for i in zf.infolist() if not i.is_dir()]
+    except (zipfile.BadZipFile, OSError) as e:
+        log.warning("Skipping unreadable archive %s: %s", archive, e)
+        return []
+
+
+def _cache_key(archive: Path, member: str) -> str:
+    st = archive.stat()
+    raw = f"{archive.resolve()}|{st.st_mtime_ns}|{st.st_size}|{member}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+
+
+def _entry_size(entry: Path) -> int:
+    return sum(f.stat().st_size for f in entry.iterdir() if f.is_file())
+
+
+def _evict(root: Path, budget: int, keep: Path) -> None:
+    entries = []
+    for entry in root.iterdir():
+        if entry.is_dir() and not entry.name.startswith("."):
+            try:
+                entries.append((entry.stat().st_mtime, _entry_size(entry), entry))
+            except OSError:
+                continue
+    total = sum(size for _, size, _ in entries)
+    for _mtime, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= budget:
+            break
+        if entry == keep:
+            continue
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+        log.info("Archive cache: evicted %s (%d MB)", entry.name, size // (1 << 20))
+
+
+@traced("archive_extract")
+def extract(
+    archive: Path,
+    member: str,
+    cache_dir: Path = ARCHIVE_CACHE_DIR,
+    budget_mb: int = ARCHIVE_CACHE_MB,
+) -> Path:
+    """Path of `member` extracted from `archive`, from the cache when possible."""
+    name = PurePosixPath(member).name
+    with _lock:
+        entry = cache_dir / _cache_key(archive, member)
+        target = entry / name
+        if target.is_file():
+            os.utime(entry)  # LRU bump
+            return target
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix=".extract-", dir=cache_dir))
+        try:
+            with zipfile.ZipFile(archive) as zf, zf.open(member) as src, (tmp / name).open("wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            os.replace(tmp, entry)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        log.info("Archive cache: extracted %s from %s", name, archive.name)
+        _evict(cache_dir, budget_mb << 20, keep=entry)
+        return target
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+from ..tracing import traced
+
+# Emulator config files (Dolphin.ini, PCSX2.ini, Project64.cfg) get the same few
+# keys forced on every launch. Patch each file in one read/write, leave the file
+# alone when it already has the values, and skip even the read when the file's
+# mtime/size hasn't moved since we last saw it satisfied.
+
+log = logging.getLogger(__name__)
+
+Edit = tuple[str, str, str]  # (section, key, value)
+
+# path -> (mtime_ns, size, edits known to be satisfied at that mtime/size)
+_known: dict[str, tuple[int, int, frozenset[Edit]]] = {}
+_lock = threading.Lock()
+
+
+def _section_name(stripped: str) -> str | None:
+    if stripped.startswith("[") and stripped.endswith("]"):
+        return stripped[1:-1].strip().lower()
+    return None
+
+
+def apply_edits(
+    lines: list[str],
+    edits: Iterable[Edit],
+    sep: str = "=",
+) -> tuple[list[str], bool]:
+    """Returns (new lines, changed). Sections/keys match case-insensitively."""
+    wanted: dict[str, dict[str, tuple[str, str]]] = {}
+    section_order: list[str] = []
+    for section, key, value in edits:
+        s = section.lower()
+        if s not in wanted:
+            wanted[s] = {}
+            section_order.append(section)
+        wanted[s][key.lower()] = (key, value)
+
+    out: list[str] = []
+    changed = False
+    seen_sections: set[str] = set()
+    written: set[tuple[str, str]] = set()
+    current: str | None = None
+
+    def _flush(section: str | None) -> None:
+        nonlocal changed
+        if section not in wanted:
+            return
+        for k, (key, value) in wanted[section].items():
+            if (section, k) not in written:
+                out.append(f"{key}{sep}{value}")
+                written.add((section, k))
+                changed = True
+
+    for line in lines:
+        stripped = line.strip()
+        name = _section_name(stripped)
+        if name is not None:
+            _flush(current)
+            current = name
+            seen_sections.add(name)
+            out.append(line)
+            continue
+
+        if current in wanted and stripped and not stripped.startswith(";") and "=" in stripped:
+            k, _, v = stripped.partition("=")
+            k = k.strip().lower()
+            if k in wanted[current]:
+                key, value = wanted[current][k]
+                if v.strip() != value:
+                    line = f"{key}{sep}{value}"
+                    changed = True
+                written.add((current, k))
+        out.append(line)
+    _flush(current)
+
+    for section in section_order:
+        s = section.lower()
+        if s in seen_sections:
+            continue
+        out.append(f"[{section}]")
+        changed = True
+        _flush(s)
+    return out, changed
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@traced("config_patch")
+def patch_config(
+    path: Path,
+    edits: Iterable[Edit],
+    *,
+    sep: str = "=",
+    create: bool = True,
+    sanitize: Callable[[list[str]], list[str]] | None = None,
+) -> bool:
+    """Applies all `edits` to `path` in one pass; returns True if the file was written.
+
+    `sanitize` runs over the lines first (e.g. dropping junk the emulator
+    chokes on); its changes count as a change like any edit.
+    """
+    edits = list(dict.fromkeys(edits))
+    edit_set = frozenset(edits)
+    key = str(path)
+    with _lock:
+        stat = _stat(path)
+        known = _known.get(key)
+        if stat is not None and known is not None and known[:2] == stat and edit_set <= known[2]:
+            return False
+
+        if stat is None:
+            if not create:
+                return False
+            text, newline = "", "\n"
+        else:
+            with path.open("r", encoding="utf-8", errors="ignore", newline="") as f:
+                text = f.read()
+            newline = "\r\n" if "\r\n" in text else "\n"
+
+        lines = text.splitlines()
+        changed = False
+        if sanitize is not None:
+            cleaned = sanitize(lines)
+            changed = cleaned != lines
+            lines = cleaned
+        lines, edited = apply_edits(lines, edits, sep=sep)
+        changed = changed or edited
+
+        if changed:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8", newline="") as f:
+                f.write(newline.join(lines) + newline)
+            log.debug("Patched %s (%d edits)", path, len(edits))
+            stat = _stat(path)
+
+        if stat is not None:
+            satisfied = edit_set
+            if known is not None and known[:2] == stat:
+                satisfied = satisfied | known[2]
+            _known[key] = (stat[0], stat[1], satisfied)
+        return changed
@@ -1,15 +1,78 @@
 from __future__ import annotations
+import os
 from pathlib import Path
 import re
 from ..core.titles import clean_title
+from ..tracing import traced
 
 COVER_EXTS = (".png", ".jpg", ".jpeg", ".webp")
 
-def find_cover(platform: str, game_folder_name: str, images_root: Path, placeholder: Path) -> Path:
+
+class CoverIndex:
+    """
+    The cover folders of each platform, listed once and turned into lookups
+    (exact stem, upper-cased stem for disc IDs / serials, cleaned title), so a
+    scan matches covers with dictionary hits instead of stat'ing candidates.
+    Build one per scan; it doesn't notice covers added afterwards.
+    """
+
+    def __init__(self, images_root: Path):
+        self.images_root = images_root
+        self._platforms: dict[str, tuple[dict[str, Path], dict[str, Path], dict[str, Path]]] = {}
+
+    def _lookups(self, platform: str):
+        lookups = self._platforms.get(platform)
+        if lookups is not None:
+            return lookups
+        exact: dict[str, Path] = {}
+        upper: dict[str, Path] = {}
+        cleaned: dict[str, Path] = {}
+        # Same precedence as the stat path: covers/ first, then extension order.
+        for base_dir in (self.images_root / platform / "covers", self.images_root / platform):
+            try:
+                names = [e.name for e in os.scandir(base_dir) if e.is_file()]
+            except OSError:
+                continue
+            files = sorted(
+                (os.path.splitext(n) for n in names if os.path.splitext(n)[1].lower() in COVER_EXTS),
+                key=lambda se: COVER_EXTS.index(se[1].lower()),
+            )
+            for stem, ext in files:
+                path = base_dir / f"{stem}{ext}"
+                exact.setdefault(stem, path)
+                upper.setdefault(stem.upper(), path)
+                cleaned.setdefault(clean_title(stem), path)
+        lookups = self._platforms[platform] = (exact, upper, cleaned)
+        return lookups
+
+    def find(self, platform: str, game_folder_name: str, placeholder: Path, serial: str | None = None) -> Path:
+        exact, upper, cleaned = self._lookups(platform)
+        hit = exact.get(game_folder_name)
+        if hit is None:
+            code = serial or (_extract_disc_id(game_folder_name) if platform.lower() in {"gamecube", "wii"} else None)
+            hit = upper.get(code.upper()) if code else None
+        if hit is None:
+            hit = cleaned.get(clean_title(game_folder_name))
+        return hit or placeholder
+
+
+@traced("find_cover")
+def find_cover(
+    platform: str,
+    game_folder_name: str,
+    images_root: Path,
+    placeholder: Path,
+    serial: str | None = None,
+    index: CoverIndex | None = None,
+) -> Path:
     """
     Looks in: IMAGES/<platform>/covers/<game_folder_name>.(png/jpg/...)
-    Falls back to fuzzy match on cleaned title if exact not found.
+    then a cover named after the game's serial / disc ID (from its header, or
+    guessed from the folder name for GameCube/Wii), then a fuzzy match on the
+    cleaned title. With `index` (a scan) these are dictionary lookups.
     """
+    if index is not None:
+        return index.find(platform, game_folder_name, placeholder, serial)
     covers_dir = images_root / platform / "covers"
     platform_dir = images_root / platform
     if not covers_dir.exists() and not platform_dir.exists():
@@ -26,17 +89,18 @@ def find_cover(platform: str, game_folder_name: str, images_root: Path, placehol
             if p.exists():
                 return p
 
-    # 1b) platform codes for GameCube/Wii (IDs stored in covers dir)
-    if platform.lower() in {"gamecube", "wii"}:
+    # 1b) serial / disc ID (GameCube/Wii IDs may also come from the folder name)
+    code = serial
+    if code is None and platform.lower() in {"gamecube", "wii"}:
         code = _extract_disc_id(game_folder_name)
-        if code:
-            for base_dir in search_dirs:
-                if not base_dir.exists():
-                    continue
-                for ext in COVER_EXTS:
-                    p = base_dir / f"{code}{ext}"
-                    if p.exists():
-                        return p
+    if code:
+        for base_dir in search_dirs:
+            if not base_dir.exists():
+                continue
+            for ext in COVER_EXTS:
+                p = base_dir / f"{code}{ext}"
+                if p.exists():
+                    return p
 
     # 2) fuzzy match (optional, but helps)
     target_clean = clean_title(game_folder_name)
@@ -51,6 +115,21 @@ def find_cover(platform: str, game_folder_name: str, images_root: Path, placehol
     return placeholder
 
 
+def warm_covers(paths, chunk_size: int = 1 << 16) -> None:
+    """
+    Reads cover files once so the OS page cache holds them before the UI
+    decodes them (the images root usually sits on a slow /mnt mount).
+    Meant to run on a background thread; missing files are skipped.
+    """
+    for p in paths:
+        try:
+            with open(p, "rb") as f:
+                while f.read(chunk_size):
+                    pass
+        except OSError:
+            continue
+
+
 def _extract_disc_id(name: str) -> str | None:
     candidates = re.findall(r"[A-Za-z0-9]{6}", name)
     if not candidates:
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import xml.etree.ElementTree as ET
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ..paths import DATS_DIR, ROMS_DIR
+from ..tracing import traced
+from .library_db import _bump_generation, refresh_title_keys, utc_now_iso
+from .rom_files import cue_tracks
+
+# Identifies games against No-Intro / Redump DAT files dropped into data/dats/.
+#
+# Import: each DAT (Logiqx XML, often tens of MB) is streamed with iterparse
+# into dat_roms, one row per <rom>. A DAT whose size/mtime are unchanged is not
+# even hashed; one whose SHA-1 is unchanged is not re-imported.
+#
+# Matching: by (size, CRC32), both indexed. The size lookup comes first and
+# needs no file reads, so games with no candidate are never hashed. CRCs come
+# from the zip central directory for zipped ROMs, otherwise from reading the
+# file (up to DAT_HASH_MB; larger disc images match on size alone when every
+# candidate of that size is the same game). The CRC is kept in games.crc32
+# until the game's fingerprint changes. iNES headers are skipped, as No-Intro
+# hashes headerless NES ROMs. A cue sheet is matched through its first track.
+#
+# games.dat_stamp records which set of DATs a game was last checked against,
+# so an unchanged library with unchanged DATs does nothing.
+
+log = logging.getLogger(__name__)
+
+DAT_EXTS = {".dat", ".xml"}
+DAT_HASH_MB = int(os.environ.get("SUPERCONSOLE_DAT_HASH_MB", "256"))
+DAT_WORKERS = int(os.environ.get("SUPERCONSOLE_DAT_WORKERS", "4"))
+_BATCH = 5000
+
+_TAGS = re.compile(r"\(([^)]*)\)")
+_REGIONS = {
+    "World", "USA", "Europe", "Japan", "Asia", "Australia", "Brazil", "Canada", "China",
+    "France", "Germany", "Hong Kong", "Italy", "Korea", "Netherlands", "Russia", "Spain",
+    "Sweden", "Taiwan", "UK",
+}
+
+
+def dat_region(game_name: str) -> str | None:
+    """'Super Mario World (USA)' -> 'USA'; the first tag made only of region names."""
+    for tag in _TAGS.findall(game_name):
+        parts = [p.strip() for p in tag.split(",")]
+        if parts and all(p in _REGIONS for p in parts):
+            return ", ".join(parts)
+    return None
+
+
+# -- import ------------------------------------------------------------------
+
+def _sha1(path: Path) -> str:
+    h = hashlib.sha1()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _parse_dat(con: sqlite3.Connection, path: Path, name: str) -> tuple[str | None, int]:
+    system = None
+    rows: list[tuple] = []
+    count = 0
+    for _event, elem in ET.iterparse(path, events=("end",)):
+        tag = elem.tag
+        if tag == "name" and system is None:
+            system = (elem.text or "").strip() or None  # <header><name>
+        elif tag in ("game", "machine"):
+            game = elem.get("name") or ""
+            region = dat_region(game)
+            for rom in elem.iter("rom"):
+                try:
+                    size = int(rom.get("size") or "")
+                except ValueError:
+                    continue
+                crc = rom.get("crc")
+                sha1 = rom.get("sha1")
+                rows.append((name, game, region, rom.get("name") or "", size,
+                             crc.lower() if crc else None, sha1.lower() if sha1 else None))
+            elem.clear()  # keeps memory flat on big DATs
+            if len(rows) >= _BATCH:
+                con.executemany("INSERT INTO dat_roms VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                count += len(rows)
+                rows.clear()
+    if rows:
+        con.executemany("INSERT INTO dat_roms VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        count += len(rows)
+    return system, count
+
+
+@traced("import_dats")
+def import_dats(con: sqlite3.Connection, dats_dir: Path = DATS_DIR) -> dict[str, int]:
+    """Brings dat_roms in line with the DAT files in `dats_dir`."""
+    stats = {"imported": 0, "unchanged": 0, "removed": 0, "roms": 0}
+    known = {r["name"]: r for r in con.execute("SELECT name, sha1, size, mtime FROM dat_files")}
+    present: set[str] = set()
+    files = sorted(p for p in dats_dir.iterdir() if p.is_file() and p.suffix.lower() in DAT_EXTS) \
+        if dats_dir.is_dir() else []
+    for path in files:
+        name = path.name
+        present.add(name)
+        st = path.stat()
+        old = known.get(name)
+        if old is not None and old["size"] == st.st_size and old["mtime"] == st.st_mtime_ns:
+            stats["unchanged"] += 1
+            continue
+        digest = _sha1(path)
+        if old is not None and old["sha1"] == digest:
+            con.execute("UPDATE dat_files SET size = ?, mtime = ? WHERE name = ?", (st.st_size, st.st_mtime_ns, name))
+            stats["unchanged"] += 1
+            continue
+        con.execute("DELETE FROM dat_roms WHERE dat = ?", (name,))
+        try:
+            system, count = _parse_dat(con, path, name)
+        except ET.ParseError as e:
+            log.warning("Skipping unreadable DAT %s: %s", name, e)
+            con.execute("DELETE FROM dat_roms WHERE dat = ?", (name,))
+            con.execute("DELETE FROM dat_files WHERE name = ?", (name,))
+            continue
+        con.execute(
+            "INSERT OR REPLACE INTO dat_files (name, sha1, size, mtime, system, roms, imported_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (name, digest, st.st_size, st.st_mtime_ns, system, count, utc_now_iso()),
+        )
+        log.info("Imported DAT %s (%s, %d roms)", name, system or "?", count)
+        stats["imported"] += 1
+        stats["roms"] += count
+    for name in set(known) - present:
+        con.execute("DELETE FROM dat_roms WHERE dat = ?", (name,))
+        con.execute("DELETE FROM dat_files WHERE name = ?", (name,))
+        stats["removed"] += 1
+    con.commit()
+    return stats
+
+
+def dat_stamp(con: sqlite3.Connection) -> str:
+    """Identifies the imported set of DATs; '' when there are none."""
+    digests = [r[0] for r in con.execute("SELECT sha1 FROM dat_files ORDER BY name")]
+    return hashlib.sha1("|".join(digests).encode("ascii")).hexdigest()[:16] if digests else ""
+
+
+# -- matching ------------------------------------------------------------------
+
+def _hash_source(row: sqlite3.Row, roms_root: Path) -> tuple[Path, str | None] | None:
+    """(file, zip member) whose content identifies a game, or None if it can't be matched."""
+    if row["launch_type"] != "file":
+        return None
+    target = Path(row["launch_target"])
+    if not target.is_absolute():
+        target = roms_root / target
+    member = row["archive_member"]
+    if member:
+        return target, member
+    if target.suffix.lower() == ".cue":
+        tracks = cue_tracks(target)
+        return (tracks[0], None) if tracks else None
+    return target, None
+
+
+def _size_and_skip(path: Path, member: str | None) -> tuple[int, int, int | None]:
+    """(content size, header bytes to skip, CRC from the zip directory when usable)."""
+    if member:
+        with zipfile.ZipFile(path) as zf:
+            info = zf.getinfo(member)
+            if member.lower().endswith(".nes"):
+                with zf.open(member) as f:
+                    skip = 16 if f.read(4) == b"NES\x1a" else 0
+                return info.file_size - skip, skip, None if skip else info.CRC
+            return info.file_size, 0, info.CRC
+    size = path.stat().st_size
+    if path.suffix.lower() == ".nes":
+        with path.open("rb") as f:
+            if f.read(4) == b"NES\x1a":
+                return size - 16, 16, None
+    return size, 0, None
+
+
+def _crc32_stream(f, skip: int) -> str:
+    crc = 0
+    if skip:
+        f.read(skip)
+    for chunk in iter(lambda: f.read(1 << 20), b""):
+        crc = zlib.crc32(chunk, crc)
+    return f"{crc & 0xFFFFFFFF:08x}"
+
+
+def _crc32(path: Path, member: str | None, skip: int) -> str:
+    if member:
+        with zipfile.ZipFile(path) as zf, zf.open(member) as f:
+            return _crc32_stream(f, skip)
+    with path.open("rb") as f:
+        return _crc32_stream(f, skip)
+
+
+def _probe(row: sqlite3.Row, roms_root: Path) -> tuple[Path, str | None, int, int, int | None] | None:
+    """(file, member, content size, skip, zip CRC) for a game; None if it can't be matched."""
+    source = _hash_source(row, roms_root)
+    if source is None:
+        return None
+    path, member = source
+    try:
+        return (path, member, *_size_and_skip(path, member))
+    except (OSError, KeyError, zipfile.BadZipFile) as e:
+        log.debug("DAT match skipped for %s: %s", path, e)
+        return None
+
+
+def _crc_or_none(path: Path, member: str | None, skip: int) -> str | None:
+    try:
+        return _crc32(path, member, skip)
+    except (OSError, KeyError, zipfile.BadZipFile) as e:
+        log.debug("DAT hash failed for %s: %s", path, e)
+        return None
+
+
+@traced("identify_games")
+def identify_games(
+    con: sqlite3.Connection,
+    roms_root: Path = ROMS_DIR,
+    workers: int = DAT_WORKERS,
+) -> list[int]:
+    """Matches games not yet checked against the current DATs; returns ids whose DAT title changed."""
+    stamp = dat_stamp(con)
+    rows = list(con.execute(
+        "SELECT id, launch_type, launch_target, archive_member, crc32, dat_title FROM games"
+        " WHERE dat_stamp IS NOT ?",
+        (stamp,),
+    ))
+    if not rows:
+        return []
+    results = [{"id": r["id"], "crc32": r["crc32"], "dat_title": None, "dat_region": None} for r in rows]
+
+    if stamp:
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="dat-match") as pool:
+            # Sizes first (stat / zip directory only) ...
+            probes = list(pool.map(lambda r: _probe(r, roms_root), rows))
+            sizes = sorted({p[2] for p in probes if p is not None})
+            candidates: dict[int, list[tuple[str, str | None, str | None]]] = {}
+            for i in range(0, len(sizes), 800):
+                chunk = sizes[i:i + 800]
+                marks = ",".join("?" * len(chunk))
+                for d in con.execute(
+                    f"SELECT size, game, region, crc FROM dat_roms WHERE size IN ({marks})", chunk
+                ):
+                    candidates.setdefault(d["size"], []).append((d["game"], d["region"], d["crc"]))
+
+            # ... then CRCs, only for games some DAT entry has the size of.
+            for res, probe in zip(results, probes):
+                if probe is not None and res["crc32"] is None and probe[4] is not None:
+                    res["crc32"] = f"{probe[4]:08x}"
+            to_hash = [
+                (res, probe) for res, probe in zip(results, probes)
+                if probe is not None and probe[2] in candidates and res["crc32"] is None
+                and probe[2] <= DAT_HASH_MB << 20
+            ]
+            for (res, _), crc in zip(to_hash, pool.map(lambda rp: _crc_or_none(rp[1][0], rp[1][1], rp[1][3]), to_hash)):
+                res["crc32"] = crc
+
+        for res, probe in zip(results, probes):
+            if probe is None or probe[2] not in candidates:
+                continue
+            found = candidates[probe[2]]
+            if res["crc32"] is not None:
+                hits = [c for c in found if c[2] == res["crc32"]]
+            elif probe[2] > DAT_HASH_MB << 20 and len({c[0] for c in found}) == 1:
+                hits = found  # too big to hash: the size alone names one game
+            else:
+                hits = []
+            if hits:
+                res["dat_title"], res["dat_region"] = hits[0][0], hits[0][1]
+
+    changed = [r["id"] for r, res in zip(rows, results) if r["dat_title"] != res["dat_title"]]
+    con.executemany(
+        "UPDATE games SET crc32 = :crc32, dat_title = :dat_title, dat_region = :dat_region, dat_stamp = :stamp,"
+        " sort_key = CASE WHEN dat_title IS :dat_title THEN sort_key END"
+        " WHERE id = :id",
+        [{**res, "stamp": stamp} for res in results],
+    )
+    if changed:
+        refresh_title_keys(con)
+        _bump_generation(con)  # titles shown in the UI changed
+    con.commit()
+    return changed
+
+
+def duplicate_count(con: sqlite3.Connection) -> int:
+    """Games that are another copy of an identified game on the same platform."""
+    row = con.execute(
+        "SELECT COUNT(*) - COUNT(DISTINCT platform || '|' || dat_title) FROM games WHERE dat_title IS NOT NULL"
+    ).fetchone()
+    return int(row[0] or 0)
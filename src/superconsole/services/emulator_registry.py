@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import logging
+import string
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from ..paths import EMULATORS_DIR
+from .config_patch import patch_config
+
+# Which emulator runs which platform, with what arguments and which config keys
+# forced before launch. Read from the packaged emulators.toml plus an optional
+# data/emulators/emulators.toml override, compiled once into LaunchPlans; a
+# launch is then a dict lookup and a template fill.
+
+log = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY = Path(__file__).resolve().parents[1] / "emulators.toml"
+USER_REGISTRY = EMULATORS_DIR / "emulators.toml"
+
+PLACEHOLDERS = {"exe", "exe_dir", "rom", "emulators_dir", "user_profile"}
+# The profile is only probed for config patches; a launch must never wait on it.
+ARG_PLACEHOLDERS = PLACEHOLDERS - {"user_profile"}
+FULLSCREEN_TOKEN = "{fullscreen}"
+
+
+def _project64_plugin(lines: list[str]) -> list[str]:
+    # Project64 refuses to start with bare (no "=") lines under [Plugin].
+    out: list[str] = []
+    in_plugin = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            in_plugin = stripped[1:-1].strip().lower() == "plugin"
+            out.append(line)
+            continue
+        if in_plugin:
+            if stripped and "=" not in stripped and not stripped.startswith(";"):
+                continue
+        out.append(line)
+    return out
+
+
+SANITIZERS: dict[str, Callable[[list[str]], list[str]]] = {
+    "project64_plugin": _project64_plugin,
+}
+
+
+class RegistryError(ValueError):
+    pass
+
+
+def _fill(template: str, values: dict[str, str]) -> str | None:
+    """Template with placeholders filled; None when a value isn't known (e.g. no profile)."""
+    try:
+        return template.format_map(values)
+    except KeyError:
+        return None
+
+
+@dataclass(frozen=True)
+class ConfigPatch:
+    files: tuple[str, ...]  # first existing wins when there is more than one
+    edits: tuple[tuple[str, str, str], ...]
+    requires: str | None = None
+    create: bool = True
+    sep: str = "="
+    sanitize: str | None = None
+
+    def apply(self, values: dict[str, str]) -> bool:
+        if self.requires:
+            required = _fill(self.requires, values)
+            if required is None or not Path(required).exists():
+                return False
+        candidates = [Path(f) for f in (_fill(t, values) for t in self.files) if f]
+        if len(self.files) > 1:
+            candidates = [c for c in candidates if c.exists()][:1]
+        sanitize = SANITIZERS[self.sanitize] if self.sanitize else None
+        written = False
+        for path in candidates:
+            written |= patch_config(path, self.edits, sep=self.sep, create=self.create, sanitize=sanitize)
+        return written
+
+
+@dataclass(frozen=True)
+class LaunchPlan:
+    platform: str
+    emulator: str
+    exe: Path
+    args: tuple[str, ...]  # templates, fullscreen flags already expanded
+    fullscreen: tuple[str, ...]
+    configs: tuple[ConfigPatch, ...]
+
+    def values(self, rom: Path | None = None, user_profile: str | None = None) -> dict[str, str]:
+        values = {
+            "exe": str(self.exe),
+            "exe_dir": str(self.exe.parent),
+            "emulators_dir": str(EMULATORS_DIR),
+        }
+        if rom is not None:
+            values["rom"] = str(rom)
+        if user_profile:
+            values["user_profile"] = user_profile
+        return values
+
+    def command(self, rom: Path) -> list[str]:
+        values = self.values(rom)
+        return [str(self.exe), *(a.format_map(values) for a in self.args)]
+
+    def apply_configs(self, user_profile: str | None = None) -> None:
+        values = self.values(user_profile=user_profile)
+        for cfg in self.configs:
+            cfg.apply(values)
+
+
+def _check_template(where: str, template: str, allowed: set[str] = PLACEHOLDERS) -> None:
+    for _, field, _, _ in string.Formatter().parse(template):
+        if field is not None and field not in allowed:
+            if field in PLACEHOLDERS:
+                raise RegistryError(f"{where}: placeholder {{{field}}} is not available here")
+            raise RegistryError(f"{where}: unknown placeholder {{{field}}}")
+
+
+def _compile_config(name: str, raw: dict) -> ConfigPatch:
+    where = f"emulators.{name}.config"
+    files = raw.get("file")
+    if isinstance(files, str):
+        files = [files]
+    if not files or not all(isinstance(f, str) for f in files):
+        raise RegistryError(f"{where}: 'file' must be a path or a list of paths")
+    edits = raw.get("edits") or []
+    if not all(isinstance(e, list) and len(e) == 3 for e in edits):
+        raise RegistryError(f"{where}: 'edits' must be [section, key, value] triples")
+    sanitize = raw.get("sanitize")
+    if sanitize is not None and sanitize not in SANITIZERS:
+        raise RegistryError(f"{where}: unknown sanitize {sanitize!r}")
+    for t in [*files, raw.get("requires") or ""]:
+        _check_template(where, t)
+    return ConfigPatch(
+        files=tuple(files),
+        edits=tuple((str(s), str(k), str(v)) for s, k, v in edits),
+        requires=raw.get("requires"),
+        create=bool(raw.get("create", len(files) == 1)),
+        sep=str(raw.get("sep", "=")),
+        sanitize=sanitize,
+    )
+
+
+def _compile_emulator(name: str, raw: dict, emulators_dir: Path) -> list[LaunchPlan]:
+    where = f"emulators.{name}"
+    exe = raw.get("exe")
+    platforms = raw.get("platforms")
+    if not isinstance(exe, str) or not exe:
+        raise RegistryError(f"{where}: missing 'exe'")
+    if not platforms or not all(isinstance(p, str) for p in platforms):
+        raise RegistryError(f"{where}: 'platforms' must be a list of names")
+    fullscreen = tuple(str(a) for a in raw.get("fullscreen", []))
+    args: list[str] = []
+    for a in raw.get("args", ["{rom}", FULLSCREEN_TOKEN]):
+        if a == FULLSCREEN_TOKEN:
+            args.extend(fullscreen)
+            continue
+        _check_template(where, str(a), ARG_PLACEHOLDERS)
+        args.append(str(a))
+    configs = tuple(_compile_config(name, c) for c in raw.get("config", []))
+    exe_path = Path(exe)
+    if not exe_path.is_absolute():
+        exe_path = emulators_dir / exe_path
+    return [
+        LaunchPlan(normalize_platform(p), name, exe_path, tuple(args), fullscreen, configs)
+        for p in platforms
+    ]
+
+
+def normalize_platform(platform: str) -> str:
+    return platform.strip().lower().replace("-", "")
+
+
+def _read(path: Path) -> dict:
+    with path.open("rb") as f:
+        return tomllib.load(f).get("emulators", {})
+
+
+def load_registry(
+    default: Path = DEFAULT_REGISTRY,
+    override: Path | None = USER_REGISTRY,
+    emulators_dir: Path = EMULATORS_DIR,
+) -> dict[str, LaunchPlan]:
+    """platform -> LaunchPlan. A broken override entry is logged and skipped."""
+    plans: dict[str, LaunchPlan] = {}
+    for name, raw in _read(default).items():
+        for plan in _compile_emulator(name, raw, emulators_dir):
+            plans[plan.platform] = plan
+
+    if override is not None and override.exists():
+        try:
+            user = _read(override)
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            log.error("Ignoring emulator registry %s: %s", override, e)
+            user = {}
+        for name, raw in user.items():
+            try:
+                compiled = _compile_emulator(name, raw, emulators_dir)
+            except RegistryError as e:
+                log.error("Ignoring %s entry: %s", override, e)
+                continue
+            # A user entry replaces the default of the same name entirely.
+            plans = {p: plan for p, plan in plans.items() if plan.emulator != name}
+            for plan in compiled:
+                plans[plan.platform] = plan
+    return plans
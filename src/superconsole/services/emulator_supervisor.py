@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import logging
+import os
+import selectors
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+
+# One thread watches every emulator we launched, instead of a thread per launch
+# blocked in proc.wait(). On Linux/WSL each process is a pidfd in a selector
+# (readable when it exits); the WSL launch helper also reports the Windows PID
+# on stdout, which is read through the same selector. Where neither works
+# (native Windows) the loop falls back to polling.
+#
+# Finished sessions queue up until the app drains them into the DB in one go.
+
+log = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.5
+
+
+@dataclass
+class Session:
+    proc: subprocess.Popen
+    platform: str
+    game_id: int | None = None
+    title: str = ""
+    exe_name: str = ""
+    on_exit: Callable[["Session"], None] | None = None
+    started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    started: float = field(default_factory=time.monotonic)
+    windows_pid: int | None = None  # the real emulator when launched through the WSL helper
+    timing: object | None = None  # LaunchTiming, carried along for the app's batched writes
+    first_event: str | None = None  # "output" or "exit", whichever we saw first
+    first_event_at: float | None = None  # perf_counter()
+    ended_at: str | None = None
+    seconds: float = 0.0
+    exit_code: int | None = None
+    _pidfd: int | None = None
+    _buffer: bytes = b""
+
+    @property
+    def running(self) -> bool:
+        return self.ended_at is None
+
+
+class EmulatorSupervisor:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: list[Session] = []
+        self._pending: list[Session] = []
+        self._finished: list[Session] = []
+        self._thread: threading.Thread | None = None
+        self._wake_event = threading.Event()
+        self._selector: selectors.BaseSelector | None = None
+        self._wake_r = self._wake_w = None
+        if os.name != "nt":
+            # select() on Windows only takes sockets; there we poll instead.
+            self._selector = selectors.DefaultSelector()
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+    def track(
+        self,
+        proc: subprocess.Popen,
+        platform: str,
+        *,
+        game_id: int | None = None,
+        title: str = "",
+        exe_name: str = "",
+        on_exit: Callable[[Session], None] | None = None,
+        timing: object | None = None,
+    ) -> Session:
+        """Watches `proc`; `on_exit(session)` runs on the supervisor thread when it ends.
+
+        A process started with stdout=PIPE is taken to be the WSL launch helper:
+        its first stdout line is the Windows PID of the emulator it started.
+        """
+        session = Session(proc, platform, game_id, title, exe_name, on_exit, timing=timing)
+        with self._lock:
+            self._pending.append(session)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="emulator-supervisor", daemon=True)
+                self._thread.start()
+        self._wake()
+        return session
+
+    def active(self) -> list[Session]:
+        with self._lock:
+            return [s for s in (*self._sessions, *self._pending) if s.running]
+
+    def drain_finished(self) -> list[Session]:
+        with self._lock:
+            finished, self._finished = self._finished, []
+        return finished
+
+    def terminate(self, session: Session) -> bool:
+        """Kills one tracked emulator; False if there was nothing we could target."""
+        if not session.running:
+            return False
+        try:
+            if session.windows_pid is not None:
+                subprocess.Popen(["cmd.exe", "/c", "taskkill", "/PID", str(session.windows_pid), "/T", "/F"])
+            if session.proc.poll() is None:
+                session.proc.terminate()
+            return True
+        except Exception:
+            log.exception("Failed to terminate %s", session.title or session.platform)
+            return False
+
+    def _wake(self) -> None:
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass
+        self._wake_event.set()
+
+    def _register(self, session: Session) -> bool:
+        """Adds `session` to the selector; False means it has to be polled."""
+        if self._selector is None:
+            return False
+        if session.proc.stdout is not None:
+            os.set_blocking(session.proc.stdout.fileno(), False)
+            self._selector.register(session.proc.stdout.fileno(), selectors.EVENT_READ, session)
+            return True
+        try:
+            session._pidfd = os.pidfd_open(session.proc.pid)
+        except (AttributeError, OSError):
+            return False
+        self._selector.register(session._pidfd, selectors.EVENT_READ, session)
+        return True
+
+    def _read_helper(self, session: Session, fd: int) -> bool:
+        """Consumes helper output; True once it hit EOF (the emulator exited)."""
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            return False
+        except OSError:
+            data = b""
+        if not data:
+            return True
+        self._first_event(session, "output")
+        session._buffer += data
+        while b"\n" in session._buffer:
+            line, session._buffer = session._buffer.split(b"\n", 1)
+            if session.windows_pid is None and line.strip().isdigit():
+                session.windows_pid = int(line.strip())
+                log.info("Tracking %s as Windows PID %d", session.exe_name or session.platform, session.windows_pid)
+        return False
+
+    @staticmethod
+    def _first_event(session: Session, kind: str) -> None:
+        if session.first_event is None:
+            session.first_event = kind
+            session.first_event_at = time.perf_counter()
+
+    def _finish(self, session: Session) -> None:
+        self._first_event(session, "exit")
+        try:
+            session.exit_code = session.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            session.exit_code = None
+        try:
+            if session.proc.stdout is not None:
+                session.proc.stdout.close()
+            if session._pidfd is not None:
+                os.close(session._pidfd)
+        except OSError:
+            log.debug("Closing %s's handles failed", session.title or session.platform, exc_info=True)
+        session._pidfd = None
+        session.ended_at = datetime.now(timezone.utc).isoformat()
+        session.seconds = time.monotonic() - session.started
+        with self._lock:
+            self._sessions.remove(session)
+            self._finished.append(session)
+        log.info("%s exited after %.0fs (code %s)", session.title or session.platform,
+                 session.seconds, session.exit_code)
+        if session.on_exit is not None:
+            try:
+                session.on_exit(session)
+            except Exception:
+                log.exception("on_exit callback failed")
+
+    def _run(self) -> None:
+        try:
+            self._loop()
+        except Exception:
+            log.exception("Emulator supervisor stopped")
+        finally:
+            # The next track() starts a fresh thread instead of queueing for a dead one.
+            with self._lock:
+                self._thread = None
+
+    def _unregister(self, fd: int) -> None:
+        try:
+            self._selector.unregister(fd)
+        except (KeyError, ValueError, OSError):
+            pass
+
+    def _loop(self) -> None:
+        # One session's failure (a bad fd, a close() error) must not stop the
+        # watch on the others; a session that can't be watched falls back to polling.
+        polled: list[Session] = []
+        while True:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                self._sessions.extend(pending)
+            for session in pending:
+                try:
+                    registered = self._register(session)
+                except Exception:
+                    log.exception("Could not watch %s; polling it", session.title or session.platform)
+                    registered = False
+                if not registered:
+                    polled.append(session)
+
+            timeout = POLL_INTERVAL if polled else None
+            if self._selector is None:
+                self._wake_event.wait(timeout)
+                self._wake_event.clear()
+                events = []
+            else:
+                events = self._selector.select(timeout)
+
+            for key, _mask in events:
+                session = key.data
+                if session is None:  # wake pipe
+                    try:
+                        while os.read(self._wake_r, 512):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                try:
+                    if session.proc.stdout is not None and key.fd == session.proc.stdout.fileno():
+                        if not self._read_helper(session, key.fd):
+                            continue
+                    self._selector.unregister(key.fd)
+                except Exception:
+                    log.exception("Watching %s failed; polling it", session.title or session.platform)
+                    self._unregister(key.fd)
+                    polled.append(session)
+                    continue
+                self._finish_safely(session)
+
+            for session in [s for s in polled if s.proc.poll() is not None]:
+                polled.remove(session)
+                self._finish_safely(session)
+
+    def _finish_safely(self, session: Session) -> None:
+        try:
+            self._finish(session)
+        except Exception:
+            log.exception("Finishing %s failed", session.title or session.platform)
+
+supervisor = EmulatorSupervisor()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from ..paths import CACHE_DIR, EMULATORS_DIR
+from ..tracing import traced
+from .wsl_paths import is_wsl, to_wsl_path
+
+# Facts about the machine that launches need but that are slow to find out
+# (cmd.exe round trips on WSL, stats on a Windows mount). Resolved once in the
+# background at startup and cached in data/cache/env.json; launches only read
+# the memoized result.
+#
+# The disk cache is keyed on the emulator folders' mtimes plus a few env vars,
+# so adding/removing an emulator (or moving to another machine) re-probes.
+
+log = logging.getLogger(__name__)
+
+ENV_CACHE_VERSION = 3
+ENV_CACHE_PATH = CACHE_DIR / "env.json"
+
+DEFAULT_AHK_EXE = r"C:\Program Files\AutoHotkey\v2\AutoHotkey.exe"
+
+
+@dataclass(frozen=True)
+class EnvFacts:
+    wsl: bool
+    user_profile: str | None  # in host form (a /mnt/... path under WSL)
+    autohotkey: str | None  # Windows path under WSL, host path otherwise
+    powershell: str | None = None  # WSL only: runs the launch helper that reports the game's PID
+    emulators: dict[str, bool] = field(default_factory=dict)  # platform -> exe exists
+
+    def emulator_exists(self, platform: str) -> bool:
+        return self.emulators.get(platform, False)
+
+
+_facts: EnvFacts | None = None
+_lock = threading.Lock()
+# Cleared while a background probe is pending; set by its worker when done, so
+# a reader never races the worker to the lock.
+_background_done = threading.Event()
+_background_done.set()
+
+
+def _emulator_paths() -> dict[str, Path]:
+    from .game_launcher import PLANS  # game_launcher imports us
+    return {platform: plan.exe for platform, plan in PLANS.items()}
+
+
+def _cache_key(exes: dict[str, Path]) -> dict:
+    dirs = sorted({str(p.parent) for p in exes.values()} | {str(EMULATORS_DIR)})
+    mtimes = {}
+    for d in dirs:
+        try:
+            mtimes[d] = os.stat(d).st_mtime_ns
+        except OSError:
+            mtimes[d] = None
+    return {
+        "version": ENV_CACHE_VERSION,
+        "wsl": is_wsl(),
+        "env": {k: os.environ.get(k) for k in ("USERPROFILE", "PATH", "WSL_DISTRO_NAME")},
+        "dirs": mtimes,
+    }
+
+
+def _cmd_output(args: list[str]) -> str | None:
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, timeout=10)
+    except Exception:
+        log.debug("Probe command failed: %s", args, exc_info=True)
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _resolve_user_profile(wsl: bool) -> str | None:
+    if not wsl:
+        return os.environ.get("USERPROFILE")
+    profile = _cmd_output(["cmd.exe", "/c", "echo", "%USERPROFILE%"])
+    if not profile or "%" in profile:
+        return None
+    return to_wsl_path(profile) or _cmd_output(["wslpath", "-u", profile])
+
+
+def _resolve_autohotkey(wsl: bool) -> str | None:
+    if wsl:
+        found = _cmd_output(["cmd.exe", "/c", "where", "AutoHotkey.exe"])
+        return found.splitlines()[0].strip() if found else DEFAULT_AHK_EXE
+    return shutil.which("AutoHotkey.exe") or shutil.which("AutoHotkey") or DEFAULT_AHK_EXE
+
+
+@traced("env_probe")
+def _probe(exes: dict[str, Path]) -> EnvFacts:
+    wsl = is_wsl()
+    return EnvFacts(
+        wsl=wsl,
+        user_profile=_resolve_user_profile(wsl),
+        autohotkey=_resolve_autohotkey(wsl),
+        powershell=shutil.which("powershell.exe") if wsl else None,
+        emulators={platform: exe.exists() for platform, exe in exes.items()},
+    )
+
+
+def _load_cached(path: Path, key: dict) -> EnvFacts | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("key") != key:
+        return None
+    try:
+        return EnvFacts(**data["facts"])
+    except (KeyError, TypeError):
+        return None
+
+
+def _save_cached(path: Path, key: dict, facts: EnvFacts) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"key": key, "facts": asdict(facts)}, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        log.warning("Could not write environment cache %s", path)
+
+
+def probe(force: bool = False, cache_path: Path = ENV_CACHE_PATH) -> EnvFacts:
+    """Resolves the facts (from the disk cache when still valid) and memoizes them."""
+    global _facts
+    with _lock:
+        exes = _emulator_paths()
+        key = _cache_key(exes)
+        facts = None if force else _load_cached(cache_path, key)
+        if facts is None:
+            facts = _probe(exes)
+            _save_cached(cache_path, key, facts)
+            log.info("Environment probed: %d/%d emulators present",
+                     sum(facts.emulators.values()), len(facts.emulators))
+            missing = sorted(p for p, ok in facts.emulators.items() if not ok)
+            if missing:
+                log.info("No emulator installed for: %s", ", ".join(missing))
+        _facts = facts
+        return facts
+
+
+def start_background_probe(on_done=None) -> None:
+    def worker():
+        try:
+            facts = probe()
+        except Exception:
+            log.exception("Environment probe failed")
+            return
+        finally:
+            _background_done.set()
+        if on_done is not None:
+            on_done(facts)
+
+    _background_done.clear()
+    threading.Thread(target=worker, name="env-probe", daemon=True).start()
+
+
+def facts(timeout: float = 5.0) -> EnvFacts:
+    """The memoized facts; waits for a running background probe, else probes now."""
+    if _facts is not None:
+        return _facts
+    if not _background_done.is_set():
+        _background_done.wait(timeout)
+        if _facts is not None:
+            return _facts
+    return probe()
+
+
+def invalidate() -> None:
+    """Forget the facts (e.g. after a launch found them stale); the next read re-probes."""
+    global _facts
+    with _lock:
+        _facts = None
+        try:
+            ENV_CACHE_PATH.unlink()
+        except OSError:
+            pass
@@ -1,60 +1,41 @@
 from __future__ import annotations
 
+import base64
 import subprocess
 from pathlib import Path
-import os
-import configparser
 import logging
 
 from ..paths import EMULATORS_DIR, ROMS_DIR
+from ..tracing import traced
+from . import archive_cache, env_probe
+from .emulator_registry import LaunchPlan, load_registry, normalize_platform
+from .launch_timing import LaunchTiming
+from .staging import staging_cache
+# is_wsl stays importable from here; app.py and older callers use this module.
+from .wsl_paths import is_wsl, to_windows_paths
 
 
-def _exe(path: Path) -> Path:
-    return path
+# Compiled once at import; everything per-launch is a lookup into PLANS.
+PLANS = load_registry()
 
+# Derived views for callers that predate the registry.
+EMULATOR_PATHS = {p: plan.exe for p, plan in PLANS.items()}
+FULLSCREEN_ARGS = {p: list(plan.fullscreen) for p, plan in PLANS.items()}
 
-EMULATOR_PATHS = {
-    "nes": _exe(EMULATORS_DIR / "Mesen" / "Mesen_2.1.0_Windows" / "Mesen.exe"),
-    "snes": _exe(EMULATORS_DIR / "Bsnes" / "bsnes" / "bsnes.exe"),
-    "gba": _exe(EMULATORS_DIR / "mGBA" / "mGBA" / "mGBA.exe"),
-    "gb": _exe(EMULATORS_DIR / "mGBA" / "mGBA" / "mGBA.exe"),
-    "gbc": _exe(EMULATORS_DIR / "mGBA" / "mGBA" / "mGBA.exe"),
-    "n64": _exe(EMULATORS_DIR / "Mupen64" / "mupen64plus-ui-console.exe"),
-    "ps1": _exe(EMULATORS_DIR / "DuckStation" / "Duckstation" / "duckstation-qt-x64-ReleaseLTCG.exe"),
-    "ps2": _exe(EMULATORS_DIR / "PCSX2" / "pcsx2-qt.exe"),
-    "ps3": _exe(EMULATORS_DIR / "RPCS3" / "rpcs3.exe"),
-    "gamecube": _exe(EMULATORS_DIR / "Dolphin" / "Dolphin-x64" / "Dolphin.exe"),
-    "wii": _exe(EMULATORS_DIR / "Dolphin" / "Dolphin-x64" / "Dolphin.exe"),
-    "wiiu": _exe(EMULATORS_DIR / "Cemu" / "Cemu" / "Cemu.exe"),
-    "xbox": _exe(EMULATORS_DIR / "Xemu" / "xemu.exe"),
-    "xbox360": _exe(EMULATORS_DIR / "Xenia" / "xenia.exe"),
-}
 
-FULLSCREEN_ARGS = {
-    "nes": ["--fullscreen"],
-    "snes": ["--fullscreen"],
-    "gba": ["-f"],
-    "gb": ["-f"],
-    "gbc": ["-f"],
-    "n64": [],
-    "ps1": ["-fullscreen"],
-    "ps2": [],
-    "ps3": ["--fullscreen"],
-    "wiiu": ["-f"],
-    "xbox": ["-fullscreen"],
-    "xbox360": ["--fullscreen"],
-}
+def _normalize_platform(platform: str) -> str:
+    return normalize_platform(platform)
 
 
-def _normalize_platform(platform: str) -> str:
-    return platform.strip().lower().replace("-", "")
+def _plan(platform: str) -> LaunchPlan:
+    plan = PLANS.get(_normalize_platform(platform))
+    if plan is None:
+        raise ValueError(f"Unsupported platform: {platform}")
+    return plan
 
 
 def get_emulator_exe(platform: str) -> Path:
-    p = _normalize_platform(platform)
-    if p not in EMULATOR_PATHS:
-        raise ValueError(f"Unsupported platform: {platform}")
-    return EMULATOR_PATHS[p]
+    return _plan(platform).exe
 
 
 def _resolve_launch_target(launch_target: str) -> Path:
@@ -67,246 +48,94 @@ def _resolve_launch_target(launch_target: str) -> Path:
         return p
 
 
-def is_wsl() -> bool:
-    return bool(os.environ.get("WSL_DISTRO_NAME")) or "microsoft" in Path("/proc/version").read_text().lower()
-
-
-def _to_windows_path(path: Path) -> str:
-    try:
-        result = subprocess.run(
-            ["wslpath", "-w", str(path)],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return result.stdout.strip()
-    except Exception:
-        return str(path)
-
-
-def _to_windows_path_cmd(path: Path) -> str:
-    try:
-        result = subprocess.run(
-            ["cmd.exe", "/c", "wslpath", "-w", str(path)],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        return result.stdout.strip()
-    except Exception:
-        return _to_windows_path(path)
-
-
 def _build_args(platform: str, launch_target: Path) -> list[str]:
-    p = _normalize_platform(platform)
-    fs_args = FULLSCREEN_ARGS.get(p, [])
-
-    if p in {"gamecube", "wii"}:
-        return [str(EMULATOR_PATHS[p]), "-b", "-e", str(launch_target), *fs_args]
-
-    if p == "n64":
-        base_dir = EMULATORS_DIR / "Mupen64"
-        return [
-            str(EMULATOR_PATHS[p]),
-            "--corelib", str(base_dir / "mupen64plus.dll"),
-            "--configdir", str(base_dir),
-            "--datadir", str(base_dir),
-            "--plugindir", str(base_dir),
-            "--fullscreen",
-            str(launch_target),
-        ]
-
-    if p == "wiiu":
-        return [str(EMULATOR_PATHS[p]), "-g", str(launch_target), *fs_args]
-
-    # Default: exe + rom path
-    return [str(EMULATOR_PATHS[p]), str(launch_target), *fs_args]
-
-
-def launch_game(platform: str, launch_target: str) -> subprocess.Popen:
-    p = _normalize_platform(platform)
-    if p not in EMULATOR_PATHS:
-        raise ValueError(f"Unsupported platform: {platform}")
-
-    exe = EMULATOR_PATHS[p]
-    if not exe.exists():
-        raise FileNotFoundError(f"Missing emulator for {platform}: {exe}")
-
-    if p in {"gamecube", "wii"}:
-        _ensure_dolphin_fullscreen(exe)
-    if p == "ps2":
-        _ensure_pcsx2_fullscreen(exe)
-    if p == "n64":
-        _ensure_project64_fullscreen(exe)
+    return _plan(platform).command(launch_target)
+
+
+def _ps_quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _wsl_helper_command(powershell: str, exe_win: str, exe_dir_win: str, args_win: list[str]) -> list[str]:
+    """powershell.exe that starts the emulator, prints its PID, then waits for it.
+
+    The helper is an ordinary Linux-side child, so the supervisor can watch it
+    like any other process; its exit is the emulator's exit.
+    """
+    script = f"$p = Start-Process -FilePath {_ps_quote(exe_win)} -WorkingDirectory {_ps_quote(exe_dir_win)}"
+    if args_win:
+        script += f" -ArgumentList {_ps_quote(subprocess.list2cmdline(args_win))}"
+    script += " -PassThru; [Console]::Out.WriteLine($p.Id); [Console]::Out.Flush(); $p.WaitForExit()"
+    encoded = base64.b64encode(script.encode("utf-16-le")).decode("ascii")
+    return [powershell, "-NoProfile", "-NonInteractive", "-EncodedCommand", encoded]
+
+
+def exit_is_observable(proc: subprocess.Popen) -> bool:
+    """False for WSL launches through `cmd.exe start`, which returns straight away."""
+    return not (is_wsl() and proc.stdout is None)
+
+
+@traced("launch_game")
+def launch_game(
+    platform: str,
+    launch_target: str,
+    timing: LaunchTiming | None = None,
+    archive_member: str | None = None,
+) -> subprocess.Popen:
+    timing = timing or LaunchTiming(platform)
+    plan = _plan(platform)
+    p = plan.platform
+    exe = plan.exe
+    facts = env_probe.facts()
+    if not facts.emulator_exists(p):
+        # Only the miss path touches the disk; an emulator installed since the
+        # probe ran makes the cached facts stale.
+        if not exe.exists():
+            raise FileNotFoundError(f"Missing emulator for {platform}: {exe}")
+        env_probe.invalidate()
+
+    plan.apply_configs(user_profile=facts.user_profile)
+    timing.mark("config")
 
     target_path = _resolve_launch_target(launch_target)
-    args = _build_args(platform, target_path)
+    if archive_member:
+        # Emulators get a plain file; repeat launches hit the extraction cache.
+        target_path = archive_cache.extract(target_path, archive_member)
+    elif (cache := staging_cache()) is not None:
+        target_path = cache.staged_path(target_path) or target_path
+    args = plan.command(target_path)
 
     # If we're in WSL launching Windows emulators, pass Windows paths for ROMs
     # and use cmd.exe start to hand focus to the Windows shell.
     if is_wsl() and exe.suffix.lower() == ".exe":
-        exe_win = _to_windows_path_cmd(exe)
-        exe_dir_win = _to_windows_path_cmd(exe.parent)
-        args_win = [
-            _to_windows_path_cmd(Path(a)) if a.startswith("/") else a
-            for a in args[1:]
-        ]
-        cmd = ["cmd.exe", "/c", "start", "", "/D", exe_dir_win, exe_win, *args_win]
+        # One translation pass for every path argument (mount-table lookups,
+        # at most one wslpath process for anything off the Windows drives).
+        path_idx = [i for i, a in enumerate(args[1:], 1) if a.startswith("/")]
+        converted = to_windows_paths([exe, exe.parent, *(args[i] for i in path_idx)])
+        exe_win, exe_dir_win = converted[0], converted[1]
+        args_win = list(args[1:])
+        for i, win in zip(path_idx, converted[2:]):
+            args_win[i - 1] = win
+        timing.mark("paths")
         wsl_cwd = EMULATORS_DIR.resolve()
         if not wsl_cwd.exists():
             wsl_cwd = Path("/mnt/c")
-        logging.getLogger(__name__).info("Launch (WSL): %s", cmd)
-        return subprocess.Popen(cmd, cwd=str(wsl_cwd))
-    return subprocess.Popen(args, cwd=str(exe.parent))
-
-
-def _ensure_dolphin_fullscreen(exe: Path) -> None:
-    # Portable Dolphin keeps config under the exe parent.
-    config_dir = exe.parent / "User" / "Config"
-    dolphin_ini = config_dir / "Dolphin.ini"
-    gfx_ini = config_dir / "GFX.ini"
-    if not config_dir.exists():
-        return
-
-    _set_ini_value(dolphin_ini, "Interface", "StartFullscreen", "True")
-    _set_ini_value(dolphin_ini, "Interface", "Fullscreen", "True")
-    _set_ini_value(dolphin_ini, "Display", "Fullscreen", "True")
-    _set_ini_value(gfx_ini, "Settings", "Fullscreen", "True")
-
-
-def _ensure_project64_fullscreen(exe: Path) -> None:
-    config_dir = exe.parent / "Config"
-    cfg = config_dir / "Project64.cfg"
-    if not config_dir.exists():
-        return
-    _sanitize_project64_cfg(cfg)
-    _set_cfg_value(cfg, "Settings", "Start Full Screen", "1")
-    _set_cfg_value(cfg, "Settings", "Start Fullscreen", "1")
-    _set_cfg_value(cfg, "Settings", "Fullscreen", "1")
-    _set_cfg_value(cfg, "Settings", "Full Screen", "1")
-    _set_cfg_value(cfg, "Main Window", "Full Screen", "1")
-
-
-def _ensure_pcsx2_fullscreen(exe: Path) -> None:
-    paths = []
-    portable_ini = exe.parent / "portable.ini"
-    if portable_ini.exists():
-        paths.append(exe.parent / "inis" / "PCSX2.ini")
-    else:
-        paths.append(exe.parent / "inis" / "PCSX2.ini")
-
-    user_cfg = _default_pcsx2_ini_path()
-    if user_cfg:
-        paths.append(user_cfg)
-
-    for cfg in paths:
-        if cfg and cfg.exists():
-            _set_cfg_value(cfg, "UI", "StartFullscreen", "true")
-            _set_cfg_value(cfg, "UI", "Fullscreen", "true")
-            _set_cfg_value(cfg, "GS", "Fullscreen", "true")
-            _set_cfg_value(cfg, "GS", "StartFullscreen", "true")
-            return
-
-
-def _default_pcsx2_ini_path() -> Path | None:
-    if not is_wsl():
-        profile = os.environ.get("USERPROFILE")
-        if not profile:
-            return None
-        return Path(profile) / "Documents" / "PCSX2" / "inis" / "PCSX2.ini"
-
+        if facts.powershell:
+            cmd = _wsl_helper_command(facts.powershell, exe_win, exe_dir_win, args_win)
+            logging.getLogger(__name__).info("Launch (WSL helper): %s %s", exe_win, args_win)
+            proc = subprocess.Popen(cmd, cwd=str(wsl_cwd), stdout=subprocess.PIPE, stdin=subprocess.DEVNULL)
+        else:
+            cmd = ["cmd.exe", "/c", "start", "", "/D", exe_dir_win, exe_win, *args_win]
+            logging.getLogger(__name__).info("Launch (WSL): %s", cmd)
+            proc = subprocess.Popen(cmd, cwd=str(wsl_cwd))
+        timing.mark("popen")
+        return proc
+
+    timing.mark("paths")
     try:
-        profile = subprocess.run(
-            ["cmd.exe", "/c", "echo", "%USERPROFILE%"],
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout.strip()
-        if not profile:
-            return None
-        wsl_path = subprocess.run(
-            ["wslpath", "-u", profile],
-            check=True,
-            capture_output=True,
-            text=True,
-        ).stdout.strip()
-        return Path(wsl_path) / "Documents" / "PCSX2" / "inis" / "PCSX2.ini"
-    except Exception:
-        return None
-
-
-def _sanitize_project64_cfg(path: Path) -> None:
-    if not path.exists():
-        return
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    out: list[str] = []
-    in_plugin = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("[") and stripped.endswith("]"):
-            in_plugin = stripped[1:-1].strip().lower() == "plugin"
-            out.append(line)
-            continue
-        if in_plugin:
-            if stripped and "=" not in stripped and not stripped.startswith(";"):
-                continue
-        out.append(line)
-    path.write_text("\n".join(out) + "\n", encoding="utf-8")
-
-
-def _set_cfg_value(path: Path, section: str, key: str, value: str) -> None:
-    if not path.exists():
-        path.write_text(f"[{section}]\n{key}={value}\n", encoding="utf-8")
-        return
-
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    out: list[str] = []
-    in_section = False
-    section_found = False
-    key_written = False
-
-    def _emit_key():
-        nonlocal key_written
-        if not key_written:
-            out.append(f"{key}={value}")
-            key_written = True
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("[") and stripped.endswith("]"):
-            if in_section:
-                _emit_key()
-            in_section = stripped[1:-1].strip().lower() == section.lower()
-            if in_section:
-                section_found = True
-            out.append(line)
-            continue
-
-        if in_section and stripped and not stripped.startswith(";"):
-            k = stripped.split("=", 1)[0].strip()
-            if k.lower() == key.lower():
-                out.append(f"{key}={value}")
-                key_written = True
-                continue
-        out.append(line)
-
-    if in_section:
-        _emit_key()
-    if not section_found:
-        out.append(f"[{section}]")
-        out.append(f"{key}={value}")
-
-    path.write_text("\n".join(out) + "\n", encoding="utf-8")
-
-
-def _set_ini_value(path: Path, section: str, key: str, value: str) -> None:
-    config = configparser.ConfigParser()
-    config.optionxform = str
-    if path.exists():
-        config.read(path, encoding="utf-8")
-    if not config.has_section(section):
-        config.add_section(section)
-    config.set(section, key, value)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        config.write(f)
+        proc = subprocess.Popen(args, cwd=str(exe.parent))
+    except FileNotFoundError:
+        env_probe.invalidate()  # emulator removed since the probe ran
+        raise
+    timing.mark("popen")
+    return proc
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+# Where a launch spends its time, from the click to the emulator's first sign
+# of life. Each stage is the time since the previous mark, in ms:
+#
+#   mark_played   DB bookkeeping in the app
+#   config        emulator config patching
+#   paths         launch target / argument / WSL path translation (plus zip
+#                 extraction on an archive cache miss, staged-copy check)
+#   popen         starting the process
+#   first_output  Popen -> first helper output (WSL PID line) or exit, whichever
+#                 the supervisor sees first
+#
+# Rows go to the rolling launch_stats table (library_db.record_launch_stats).
+
+STAGES = ("mark_played", "config", "paths", "popen")
+
+
+class LaunchTiming:
+    def __init__(self, platform: str, game_id: int | None = None):
+        self.platform = platform
+        self.game_id = game_id
+        self.at = datetime.now(timezone.utc).isoformat()
+        self.t0 = time.perf_counter()
+        self._last = self.t0
+        self.stages: dict[str, float] = {}
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + (now - self._last) * 1000.0
+        self._last = now
+
+    @property
+    def launched_at(self) -> float:
+        """perf_counter() when Popen returned (the last mark)."""
+        return self._last
+
+    def row(self, first_event_at: float | None = None, first_event: str | None = None) -> dict[str, Any]:
+        return {
+            "at": self.at,
+            "platform": self.platform,
+            "game_id": self.game_id,
+            **{f"{s}_ms": self.stages.get(s) for s in STAGES},
+            "first_output_ms": (first_event_at - self.launched_at) * 1000.0 if first_event_at else None,
+            "first_event": first_event,
+            "total_ms": (self.launched_at - self.t0) * 1000.0,
+        }
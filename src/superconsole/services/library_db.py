@@ -4,6 +4,9 @@ import sqlite3
 from pathlib import Path
 from datetime import datetime, timezone
 
+from ..core.titles import clean_title, title_columns
+from ..tracing import traced
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -33,6 +36,12 @@ def init_db(con: sqlite3.Connection) -> None:
             launch_target TEXT    NOT NULL,
             launch_type   TEXT    NOT NULL CHECK (launch_type IN ('file','dir')),
             cover_path    TEXT,
+            archive_member TEXT,  -- ROM inside launch_target when that is an archive
+
+            -- what the ROM header says (services/rom_headers.py)
+            serial        TEXT,
+            region        TEXT,
+            internal_title TEXT,
 
             -- filesystem fingerprint for incremental updates
             mtime         INTEGER,
@@ -57,15 +66,127 @@ def init_db(con: sqlite3.Connection) -> None:
 
         CREATE INDEX IF NOT EXISTS idx_games_last_played
         ON games(last_played);
+
+        -- one row per emulator run, written when it exits
+        CREATE TABLE IF NOT EXISTS play_sessions (
+            id          INTEGER PRIMARY KEY,
+            game_id     INTEGER REFERENCES games(id) ON DELETE SET NULL,
+            platform    TEXT    NOT NULL,
+            started_at  TEXT    NOT NULL,
+            ended_at    TEXT    NOT NULL,
+            seconds     INTEGER NOT NULL,
+            exit_code   INTEGER
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_play_sessions_game
+        ON play_sessions(game_id);
+
+        -- No-Intro / Redump DATs and their ROM entries (see services/dat_index.py)
+        CREATE TABLE IF NOT EXISTS dat_files (
+            name         TEXT PRIMARY KEY,
+            sha1         TEXT    NOT NULL,
+            size         INTEGER NOT NULL,
+            mtime        INTEGER NOT NULL,
+            system       TEXT,
+            roms         INTEGER NOT NULL,
+            imported_at  TEXT    NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS dat_roms (
+            dat     TEXT    NOT NULL,
+            game    TEXT    NOT NULL,
+            region  TEXT,
+            rom     TEXT    NOT NULL,
+            size    INTEGER NOT NULL,
+            crc     TEXT,
+            sha1    TEXT
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_dat_roms_size_crc
+        ON dat_roms(size, crc);
+
+        CREATE INDEX IF NOT EXISTS idx_dat_roms_sha1
+        ON dat_roms(sha1);
+
+        CREATE INDEX IF NOT EXISTS idx_dat_roms_dat
+        ON dat_roms(dat);
+
+        -- rolling per-launch timing breakdown (see services/launch_timing.py)
+        CREATE TABLE IF NOT EXISTS launch_stats (
+            id               INTEGER PRIMARY KEY,
+            at               TEXT    NOT NULL,
+            platform         TEXT    NOT NULL,
+            game_id          INTEGER,
+            mark_played_ms   REAL,
+            config_ms        REAL,
+            paths_ms         REAL,
+            popen_ms         REAL,
+            first_output_ms  REAL,
+            first_event      TEXT,
+            total_ms         REAL    NOT NULL
+        );
         """
     )
     _ensure_cover_path_column(con)
+    _ensure_column(con, "games", "playtime_seconds", "INTEGER NOT NULL DEFAULT 0")
+    _ensure_column(con, "games", "archive_member", "TEXT")
+    for column in ("serial", "region", "internal_title"):
+        _ensure_column(con, "games", column, "TEXT")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_games_serial ON games(serial)")
+    # DAT identification (dat_index): content CRC, canonical name/region, DAT set checked against
+    for column in ("crc32", "dat_title", "dat_region", "dat_stamp"):
+        _ensure_column(con, "games", column, "TEXT")
+    # Display-title keys, computed once at sync (core.titles.title_columns)
+    for column in ("title_norm", "sort_key", "letter"):
+        _ensure_column(con, "games", column, "TEXT")
+    con.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS idx_games_sort_key ON games(sort_key);
+        CREATE INDEX IF NOT EXISTS idx_games_platform_sort_key ON games(platform, sort_key);
+        DROP INDEX IF EXISTS idx_games_platform_letter;
+        """
+    )
+    if refresh_title_keys(con):
+        _bump_generation(con)  # rows from before these columns existed
     con.commit()
 
 
+def library_generation(con: sqlite3.Connection) -> int:
+    """
+    Change counter for the library, stored in PRAGMA user_version.
+    Write helpers for scanned / identified data bump it, so cached views (the
+    on-disk snapshot) can be validated with a single header read. Play and
+    favorite bookkeeping don't: a launch would otherwise invalidate the
+    snapshot every session. The app re-reads those two short lists instead.
+    """
+    return int(con.execute("PRAGMA user_version").fetchone()[0])
+
+
+def _bump_generation(con: sqlite3.Connection) -> None:
+    # PRAGMA values can't be bound as parameters; the value is always an int we computed.
+    con.execute(f"PRAGMA user_version = {library_generation(con) + 1}")
+
+
 from typing import Iterable, Optional, Any, Sequence
 
 
+def refresh_title_keys(con: sqlite3.Connection) -> int:
+    """
+    Fills title_norm/sort_key/letter for rows whose display title changed
+    (writers reset sort_key to NULL for that); returns how many were filled.
+    The caller commits.
+    """
+    rows = con.execute(
+        "SELECT id, COALESCE(dat_title, title) FROM games WHERE sort_key IS NULL"
+    ).fetchall()
+    con.executemany(
+        "UPDATE games SET title_norm = ?, sort_key = ?, letter = ? WHERE id = ?",
+        [(*title_columns(title), gid) for gid, title in rows],
+    )
+    return len(rows)
+
+
+@traced("upsert_games")
 def upsert_games(
     con: sqlite3.Connection,
     rows: list[dict[str, Any]],
@@ -77,28 +198,52 @@ def upsert_games(
     con.executemany(
         """
         INSERT INTO games (
-            platform, title, game_dir, launch_target, launch_type, cover_path, mtime, size
+            platform, title, game_dir, launch_target, launch_type, archive_member, cover_path, mtime, size,
+            serial, region, internal_title
         ) VALUES (
-            :platform, :title, :game_dir, :launch_target, :launch_type, :cover_path, :mtime, :size
+            :platform, :title, :game_dir, :launch_target, :launch_type, :archive_member, :cover_path, :mtime, :size,
+            :serial, :region, :internal_title
         )
         ON CONFLICT(platform, game_dir) DO UPDATE SET
-            title         = excluded.title,
-            launch_target = excluded.launch_target,
-            launch_type   = excluded.launch_type,
-            cover_path    = excluded.cover_path,
-            mtime         = excluded.mtime,
-            size          = excluded.size
+            title          = excluded.title,
+            launch_target  = excluded.launch_target,
+            launch_type    = excluded.launch_type,
+            archive_member = excluded.archive_member,
+            cover_path     = excluded.cover_path,
+            mtime          = excluded.mtime,
+            size           = excluded.size,
+            serial         = excluded.serial,
+            region         = excluded.region,
+            internal_title = excluded.internal_title,
+            -- a different file on disk needs hashing and identifying again
+            crc32          = CASE WHEN games.mtime IS excluded.mtime AND games.size IS excluded.size
+                                   AND games.launch_target IS excluded.launch_target
+                                   AND games.archive_member IS excluded.archive_member
+                              THEN games.crc32 END,
+            dat_stamp      = CASE WHEN games.mtime IS excluded.mtime AND games.size IS excluded.size
+                                   AND games.launch_target IS excluded.launch_target
+                                   AND games.archive_member IS excluded.archive_member
+                              THEN games.dat_stamp END,
+            -- recomputed by refresh_title_keys below when the title changed
+            sort_key       = CASE WHEN games.title IS excluded.title THEN games.sort_key END
         """,
-        rows,
+        [{"archive_member": None, "serial": None, "region": None, "internal_title": None, **r} for r in rows],
     )
+    refresh_title_keys(con)
+    _bump_generation(con)
     con.commit()
 
 
 def _ensure_cover_path_column(con: sqlite3.Connection) -> None:
-    cols = {row[1] for row in con.execute("PRAGMA table_info(games)").fetchall()}
-    if "cover_path" in cols:
+    _ensure_column(con, "games", "cover_path", "TEXT")
+
+
+def _ensure_column(con: sqlite3.Connection, table: str, column: str, decl: str) -> None:
+    # Older DBs predate some columns; table/column/decl are our own constants.
+    cols = {row[1] for row in con.execute(f"PRAGMA table_info({table})").fetchall()}
+    if column in cols:
         return
-    con.execute("ALTER TABLE games ADD COLUMN cover_path TEXT;")
+    con.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl};")
 
 
 def delete_missing_games(con: sqlite3.Connection, platform: str, present_game_dirs: Sequence[str]) -> None:
@@ -108,6 +253,7 @@ def delete_missing_games(con: sqlite3.Connection, platform: str, present_game_di
     """
     if not present_game_dirs:
         con.execute("DELETE FROM games WHERE platform = ?", (platform,))
+        _bump_generation(con)
         con.commit()
         return
 
@@ -120,6 +266,19 @@ def delete_missing_games(con: sqlite3.Connection, platform: str, present_game_di
             f"DELETE FROM games WHERE platform = ? AND game_dir NOT IN ({placeholders})",
             (platform, *chunk),
         )
+    _bump_generation(con)
+    con.commit()
+
+
+def delete_games(con: sqlite3.Connection, game_ids: Sequence[int]) -> None:
+    if not game_ids:
+        return
+    chunk_size = 800
+    for i in range(0, len(game_ids), chunk_size):
+        chunk = game_ids[i:i+chunk_size]
+        placeholders = ",".join(["?"] * len(chunk))
+        con.execute(f"DELETE FROM games WHERE id IN ({placeholders})", tuple(chunk))
+    _bump_generation(con)
     con.commit()
 
 
@@ -140,13 +299,28 @@ def list_games(
         q += " AND favorite = 1"
 
     if search:
-        q += " AND title LIKE ?"
-        params.append(f"%{search}%")
+        # title_norm is the cleaned display title; the folder name stays searchable too
+        q += " AND (title_norm LIKE ? OR title LIKE ?)"
+        params.extend((f"%{clean_title(search)}%", f"%{search}%"))
 
-    q += " ORDER BY title COLLATE NOCASE"
+    q += " ORDER BY sort_key, title COLLATE NOCASE"
     return list(con.execute(q, params))
 
 
+def list_games_by_ids(con: sqlite3.Connection, game_ids: Sequence[int]) -> list[sqlite3.Row]:
+    """Visible rows for the given ids (hidden games are left out, like list_games)."""
+    out: list[sqlite3.Row] = []
+    chunk_size = 800
+    for i in range(0, len(game_ids), chunk_size):
+        chunk = game_ids[i:i+chunk_size]
+        placeholders = ",".join(["?"] * len(chunk))
+        out.extend(con.execute(
+            f"SELECT * FROM games WHERE hidden = 0 AND id IN ({placeholders}) ORDER BY sort_key, title COLLATE NOCASE",
+            tuple(chunk),
+        ))
+    return out
+
+
 def list_platforms(con: sqlite3.Connection) -> list[str]:
     rows = con.execute(
         "SELECT DISTINCT platform FROM games WHERE hidden = 0 ORDER BY platform COLLATE NOCASE"
@@ -160,7 +334,7 @@ def list_favorites(con: sqlite3.Connection, limit: int = 20) -> list[sqlite3.Row
             """
             SELECT * FROM games
             WHERE hidden = 0 AND favorite = 1
-            ORDER BY title COLLATE NOCASE
+            ORDER BY sort_key, title COLLATE NOCASE
             LIMIT ?
             """,
             (limit,),
@@ -218,4 +392,57 @@ def update_cover_paths(con: sqlite3.Connection, updates: Sequence[tuple[int, str
     if not updates:
         return
     con.executemany("UPDATE games SET cover_path = ? WHERE id = ?", updates)
+    _bump_generation(con)
+    con.commit()
+
+
+def record_play_sessions(con: sqlite3.Connection, sessions: Sequence[dict[str, Any]]) -> None:
+    """
+    Writes finished sessions (game_id, platform, started_at, ended_at, seconds,
+    exit_code) and adds their time to games.playtime_seconds, in one transaction.
+    Playtime isn't part of the cached library views, so no generation bump.
+    """
+    if not sessions:
+        return
+    con.executemany(
+        """
+        INSERT INTO play_sessions (game_id, platform, started_at, ended_at, seconds, exit_code)
+        VALUES (:game_id, :platform, :started_at, :ended_at, :seconds, :exit_code)
+        """,
+        sessions,
+    )
+    con.executemany(
+        "UPDATE games SET playtime_seconds = playtime_seconds + ? WHERE id = ?",
+        [(s["seconds"], s["game_id"]) for s in sessions if s.get("game_id")],
+    )
+    con.commit()
+
+
+LAUNCH_STATS_KEEP = 500
+
+
+def record_launch_stats(
+    con: sqlite3.Connection,
+    rows: Sequence[dict[str, Any]],
+    keep: int = LAUNCH_STATS_KEEP,
+) -> None:
+    """Appends LaunchTiming rows and trims the table to the newest `keep`."""
+    if not rows:
+        return
+    con.executemany(
+        """
+        INSERT INTO launch_stats (
+            at, platform, game_id, mark_played_ms, config_ms, paths_ms, popen_ms,
+            first_output_ms, first_event, total_ms
+        ) VALUES (
+            :at, :platform, :game_id, :mark_played_ms, :config_ms, :paths_ms, :popen_ms,
+            :first_output_ms, :first_event, :total_ms
+        )
+        """,
+        rows,
+    )
+    con.execute(
+        "DELETE FROM launch_stats WHERE id <= (SELECT MAX(id) FROM launch_stats) - ?",
+        (keep,),
+    )
     con.commit()
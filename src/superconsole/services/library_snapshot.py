@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import pickle
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+# Binary snapshot of the hydrated library (what the UI shows right after a DB load).
+# Layout: fixed header + pickled payload. The header carries the DB generation
+# (PRAGMA user_version, see library_db.library_generation) so a stale snapshot is
+# detected without touching the payload.
+SNAPSHOT_MAGIC = b"SCSNAP\x00\x01"
+SNAPSHOT_VERSION = 3
+_HEADER = struct.Struct("<8sIqQ")  # magic, format version, db generation, payload length
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LibrarySnapshot:
+    generation: int
+    images_root: str
+    count: int
+    games: list[dict[str, Any]]
+    platforms: list[str]
+    favorites: list[dict[str, Any]]
+    recent_played: list[dict[str, Any]]
+    recent_added: list[dict[str, Any]]
+    platform_games: dict[str, list[dict[str, Any]]]
+
+
+def snapshot_path(project_root: Path) -> Path:
+    return project_root / "data" / "cache" / "library.snapshot"
+
+
+def save_snapshot(path: Path, snap: LibrarySnapshot) -> None:
+    payload = pickle.dumps(
+        {
+            "images_root": snap.images_root,
+            "count": snap.count,
+            "games": snap.games,
+            "platforms": snap.platforms,
+            "favorites": snap.favorites,
+            "recent_played": snap.recent_played,
+            "recent_added": snap.recent_added,
+            "platform_games": snap.platform_games,
+        },
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, snap.generation, len(payload))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        f.write(payload)
+    # atomic swap so a crash mid-write never leaves a torn snapshot behind
+    os.replace(tmp, path)
+
+
+def load_snapshot(path: Path, generation: int, images_root: Path) -> LibrarySnapshot | None:
+    """
+    Memory-maps the snapshot and returns it only if it was taken at `generation`
+    and against the same images root (cover paths are stored absolute).
+    Any mismatch or corruption returns None; callers fall back to a DB load.
+    """
+    try:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, snap_gen, length = _HEADER.unpack_from(mm, 0)
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                    return None
+                if snap_gen != generation:
+                    return None
+                if _HEADER.size + length > size:
+                    return None
+                with memoryview(mm)[_HEADER.size:_HEADER.size + length] as view:
+                    data = pickle.loads(view)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        log.warning("Ignoring unreadable library snapshot: %s", path, exc_info=True)
+        return None
+
+    if data.get("images_root") != str(images_root):
+        return None
+
+    return LibrarySnapshot(
+        generation=snap_gen,
+        images_root=data["images_root"],
+        count=data["count"],
+        games=data["games"],
+        platforms=data["platforms"],
+        favorites=data["favorites"],
+        recent_played=data["recent_played"],
+        recent_added=data["recent_added"],
+        platform_games=data["platform_games"],
+    )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from ..core.titles import sort_key
+from ..paths import IMAGES_DIR, PLACEHOLDER_COVER
+from ..tracing import traced
+from .covers import find_cover
+from .library_db import (
+    list_games,
+    list_platforms,
+    list_favorites,
+    list_recently_played,
+    list_recently_added,
+    update_cover_paths,
+)
+
+# Hydrated library views, as the UI shows them. Kept free of Kivy so the CLI
+# and benchmarks load the library exactly the way the app does.
+
+LoadedLibrary = tuple[
+    int,                                # rom count
+    list[dict[str, Any]],               # all games
+    list[str],                          # platforms
+    list[dict[str, Any]],               # favorites
+    list[dict[str, Any]],               # recently played
+    list[dict[str, Any]],               # recently added
+    dict[str, list[dict[str, Any]]],    # games per platform
+]
+
+
+def resolve_cover_path(cover_path: str | None) -> str:
+    if not cover_path:
+        return str(PLACEHOLDER_COVER)
+    p = Path(cover_path)
+    if not p.is_absolute():
+        return str(IMAGES_DIR / p)
+    return str(p)
+
+
+def title_sort_key(game: dict) -> tuple[str, str]:
+    # Same order as the DB's ORDER BY sort_key, title COLLATE NOCASE, for patched lists.
+    title = game.get("title", "")
+    return game.get("sort_key") or sort_key(title), title.lower()
+
+
+@traced("hydrate_rows")
+def hydrate_rows(rows, updates: dict[int, str]) -> list[dict[str, Any]]:
+    """Rows -> UI dicts. Covers missing in the DB are looked up and queued in `updates`."""
+    games = []
+    for r in rows:
+        cover_path = r["cover_path"]
+        if not cover_path:
+            cover = find_cover(
+                r["platform"],
+                Path(r["game_dir"]).name,
+                IMAGES_DIR,
+                PLACEHOLDER_COVER,
+            )
+            cover_path = resolve_cover_path(str(cover))
+            updates[r["id"]] = cover_path
+        else:
+            cover_path = resolve_cover_path(cover_path)
+        games.append({
+            "id": r["id"],
+            "title": r["dat_title"] or r["title"],  # canonical DAT name once identified
+            "sort_key": r["sort_key"],
+            "letter": r["letter"],
+            "cover_path": cover_path,
+            "platform": r["platform"],
+            "launch_target": r["launch_target"],
+            "launch_type": r["launch_type"],
+            "archive_member": r["archive_member"],
+            "favorite": r["favorite"],
+            "last_played": r["last_played"],
+            "date_added": r["date_added"],
+        })
+    return games
+
+
+@traced("load_all_state")
+def load_all_state(con: sqlite3.Connection) -> LoadedLibrary:
+    updates: dict[int, str] = {}
+    rows = list_games(con)
+    games = hydrate_rows(rows, updates)
+    platforms = list_platforms(con)
+    favorites = hydrate_rows(list_favorites(con), updates)
+    recent_played = hydrate_rows(list_recently_played(con), updates)
+    recent_added = hydrate_rows(list_recently_added(con), updates)
+    # Per-platform pages share the dicts of the full list (same ORDER BY, so
+    # grouping keeps the per-platform order) instead of hydrating twice.
+    platform_games: dict[str, list[dict[str, Any]]] = {platform: [] for platform in platforms}
+    for game in games:
+        platform_games.setdefault(game["platform"], []).append(game)
+
+    if updates:
+        update_cover_paths(con, [(gid, path) for gid, path in updates.items()])
+
+    return len(rows), games, platforms, favorites, recent_played, recent_added, platform_games
@@ -1,55 +1,128 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from .rom_scanner import scan_roms, ScanConfig
-from .library_db import upsert_games, delete_missing_games
+from .library_db import upsert_games, delete_games
+from .dat_index import identify_games, import_dats
 from ..core.models import Game
+from ..tracing import traced
 
 
-def _file_fingerprint(path: Path) -> tuple[int | None, int | None]:
-    try:
-        st = path.stat()
-        return int(st.st_mtime), int(st.st_size)
-    except OSError:
-        return None, None
+# Columns the scanner owns; a difference in any of them makes a row "updated".
+_SCANNED_COLUMNS = (
+    "title", "launch_target", "launch_type", "archive_member", "cover_path", "mtime", "size",
+    "serial", "region", "internal_title",
+)
 
 
-def sync_library(con, cfg: ScanConfig) -> int:
+@dataclass(frozen=True)
+class LibraryChanges:
+    """What a sync changed in the games table, by row id."""
+    count: int                                    # games found on disk
+    added: list[int] = field(default_factory=list)
+    updated: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.updated or self.removed)
+
+
+def _existing_rows(con) -> dict[tuple[str, str], dict[str, Any]]:
+    cols = ", ".join(("id", "platform", "game_dir", *_SCANNED_COLUMNS))
+    return {
+        (r["platform"], r["game_dir"]): dict(r)
+        for r in con.execute(f"SELECT {cols} FROM games")
+    }
+
+
+@traced("sync_library")
+def sync_library(con, cfg: ScanConfig) -> LibraryChanges:
     games: list[Game] = scan_roms(cfg)
+    existing = _existing_rows(con)
 
-    rows: list[dict[str, Any]] = []
-    present_by_platform: dict[str, list[str]] = {}
+    changed_rows: list[dict[str, Any]] = []
+    added_keys: list[tuple[str, str]] = []
+    updated: list[int] = []
+    present: set[tuple[str, str]] = set()
 
     for g in games:
-        # store paths relative to ROMS root
-        game_dir_rel = str(g.game_dir.relative_to(cfg.roms_root))
-        launch_rel = str(g.launch_target.relative_to(cfg.roms_root)) if g.launch_target.is_absolute() else str(g.launch_target)
+        # store paths relative to ROMS root (installed RPCS3 games live outside it and stay absolute)
+        game_dir_rel = _rom_path_rel(g.game_dir, cfg.roms_root)
+        launch_rel = _rom_path_rel(g.launch_target, cfg.roms_root)
         cover_rel = _cover_path_rel(g.cover_path, cfg.images_root)
 
-        # fingerprint: if launch_target is a folder (WiiU), fingerprint the folder itself (mtime changes on updates)
-        mtime, size = _file_fingerprint(g.launch_target)
+        # The scanner fingerprints every file the game needs (cue + bins, split
+        # wbfs, a folder game's whole tree) while it has the listing at hand.
+        mtime, size = g.mtime, g.size
 
-        rows.append({
+        row = {
             "platform": g.platform,
             "title": g.title,
             "game_dir": game_dir_rel,
             "launch_target": launch_rel,
             "launch_type": "dir" if g.launch_target.is_dir() else "file",
+            "archive_member": g.archive_member,
             "cover_path": cover_rel,
             "mtime": mtime,
             "size": size,
-        })
-        present_by_platform.setdefault(g.platform, []).append(game_dir_rel)
+            "serial": g.serial,
+            "region": g.region,
+            "internal_title": g.internal_title,
+        }
+        key = (g.platform, game_dir_rel)
+        present.add(key)
+
+        old = existing.get(key)
+        if old is None:
+            added_keys.append(key)
+            changed_rows.append(row)
+        elif any(old[c] != row[c] for c in _SCANNED_COLUMNS):
+            updated.append(old["id"])
+            changed_rows.append(row)
 
-    upsert_games(con, rows)
+    # Only write what changed; an unchanged library leaves the generation alone.
+    if changed_rows:
+        upsert_games(con, changed_rows)
 
-    # delete missing per platform
-    for platform, present in present_by_platform.items():
-        delete_missing_games(con, platform, present)
+    # delete missing, but only for platforms the scan saw (same rule as before)
+    scanned_platforms = {g.platform for g in games}
+    removed = [
+        row["id"] for key, row in existing.items()
+        if key[0] in scanned_platforms and key not in present
+    ]
+    delete_games(con, removed)
 
-    return len(games)
+    if cfg.dats_dir is not None:
+        # Unchanged DATs are skipped and only unidentified games are looked at,
+        # so this is a few stats on a warm sync.
+        import_dats(con, cfg.dats_dir)
+        renamed = identify_games(con, cfg.roms_root)
+        # New games are reported as added already; retitled old ones count as updated.
+        old_ids = {row["id"] for row in existing.values()} - set(removed) - set(updated)
+        updated.extend(i for i in renamed if i in old_ids)
+
+    added: list[int] = []
+    if added_keys:
+        ids = {
+            (r["platform"], r["game_dir"]): r["id"]
+            for r in con.execute("SELECT id, platform, game_dir FROM games")
+        }
+        added = [ids[k] for k in added_keys if k in ids]
+
+    return LibraryChanges(count=len(games), added=added, updated=updated, removed=removed)
+
+
+def _rom_path_rel(path: Path, roms_root: Path) -> str:
+    if path.is_absolute():
+        try:
+            return str(path.relative_to(roms_root))
+        except ValueError:
+            return str(path)
+    return str(path)
 
 
 def _cover_path_rel(cover_path: Path, images_root: Path) -> str:
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from ..paths import ROMS_DIR
+from .rom_files import constituent_files
+from .staging import staging_cache
+from .wsl_paths import is_wsl
+
+# Warms the OS cache for a game while the launcher is still busy, so the
+# emulator's first reads of a cold disk don't wait on it. Requested when a card
+# is hovered and again on press; one worker thread, and a newer request cancels
+# whatever is still being read (the pointer moved on).
+#
+# On native Linux posix_fadvise(WILLNEED) is enough: the kernel reads ahead in
+# the background. Under WSL the emulator is a Windows process reading the file
+# through Windows, so the Linux page cache is no help; plain sequential reads
+# through the drvfs/9p mount go through the host's file cache instead. Reads
+# stop after READAHEAD_MB per game (spread over a cue's tracks in order).
+
+log = logging.getLogger(__name__)
+
+READAHEAD_MB = int(os.environ.get("SUPERCONSOLE_READAHEAD_MB", "64"))
+CHUNK = 1 << 20
+_RECENT = 32  # targets warmed lately; hovering back over a card is free
+
+
+def _resolve(launch_target: str) -> Path:
+    p = Path(launch_target)
+    return p if p.is_absolute() else ROMS_DIR / p
+
+
+def _use_fadvise() -> bool:
+    return hasattr(os, "posix_fadvise") and not is_wsl()
+
+
+class ReadAhead:
+    def __init__(self, budget_bytes: int = READAHEAD_MB << 20, fadvise: bool | None = None):
+        self.budget = budget_bytes
+        self.fadvise = _use_fadvise() if fadvise is None else fadvise
+        self._cond = threading.Condition()
+        self._pending: Path | None = None
+        self._generation = 0
+        self._recent: OrderedDict[Path, None] = OrderedDict()
+        self._worker: threading.Thread | None = None
+
+    def request(self, launch_target: str, archive_member: str | None = None) -> None:
+        """Warm `launch_target` (and its companions) in the background."""
+        if archive_member or self.budget <= 0:
+            return  # zipped ROMs launch from the extraction cache
+        target = _resolve(launch_target)
+        with self._cond:
+            if target in self._recent or target == self._pending:
+                return
+            self._pending = target
+            self._generation += 1
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="rom-readahead", daemon=True)
+                self._worker.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                target, generation = self._pending, self._generation
+                self._pending = None
+            try:
+                if self.warm(target, lambda: self._generation != generation):
+                    with self._cond:
+                        self._recent[target] = None
+                        while len(self._recent) > _RECENT:
+                            self._recent.popitem(last=False)
+            except Exception:
+                log.debug("Read-ahead failed for %s", target, exc_info=True)
+
+    def warm(self, target: Path, cancelled=lambda: False) -> bool:
+        """Reads ahead up to the budget; False if cancelled part way."""
+        cache = staging_cache()
+        if cache is not None:
+            target = cache.staged_path(target, touch=False) or target
+        if target.is_dir():
+            return True  # folder games: nothing obvious to read first
+        left = self.budget
+        for f in constituent_files(target):
+            if left <= 0:
+                break
+            if cancelled():
+                return False
+            fd = os.open(f, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                if self.fadvise:
+                    os.posix_fadvise(fd, 0, left, os.POSIX_FADV_WILLNEED)
+                    left -= os.fstat(fd).st_size
+                    continue
+                while left > 0:
+                    if cancelled():
+                        return False
+                    n = len(os.read(fd, min(CHUNK, left)))
+                    if n == 0:
+                        break
+                    left -= n
+            finally:
+                os.close(fd)
+        return True
+
+
+readahead = ReadAhead()
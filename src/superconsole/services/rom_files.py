@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+
+# The files behind one launch target. A PS1 .cue is a few hundred bytes; the
+# game is in the .bin tracks it names. A split Wii dump is the .wbfs plus
+# .wbf1..wbf3 next to it. Anything that copies, prefetches or fingerprints a
+# game needs the whole set, not just the launch target.
+
+_CUE_FILE = re.compile(r'^\s*FILE\s+(?:"([^"]+)"|(\S+))', re.IGNORECASE | re.MULTILINE)
+SPLIT_EXTS = (".wbf1", ".wbf2", ".wbf3")
+
+
+_cue_names: dict[str, tuple[tuple[int, int], list[str]]] = {}
+
+
+def _cue_file_names(cue: Path) -> list[str]:
+    """FILE names in `cue`; parsed once per cue version."""
+    st = cue.stat()
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _cue_names.get(str(cue))
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    text = cue.read_bytes().decode("latin-1")
+    names = [m.group(1) or m.group(2) for m in _CUE_FILE.finditer(text)]
+    _cue_names[str(cue)] = (version, names)
+    return names
+
+
+def cue_tracks(cue: Path, listing: list[str] | None = None) -> list[Path]:
+    """Track files referenced by `cue`, resolved next to it.
+
+    Cue sheets are often authored on Windows, so a name that doesn't exist as
+    written is matched case-insensitively against `listing` (the folder's file
+    names; listed here when not given).
+    """
+    try:
+        names = _cue_file_names(cue)
+    except OSError:
+        return []
+    if not names:
+        return []
+    if listing is None:
+        try:
+            listing = [p.name for p in cue.parent.iterdir()]
+        except OSError:
+            listing = []
+    by_lower = {n.lower(): n for n in listing}
+    tracks: list[Path] = []
+    for name in names:
+        name = Path(name.replace("\\", "/")).name
+        actual = name if name in listing else by_lower.get(name.lower())
+        if actual is not None:
+            tracks.append(cue.parent / actual)
+    return list(dict.fromkeys(tracks))
+
+
+def split_chunks(wbfs: Path, listing: list[str] | None = None) -> list[Path]:
+    """The .wbf1..wbf3 chunks that belong to `wbfs`, in order."""
+    if listing is None:
+        try:
+            listing = [p.name for p in wbfs.parent.iterdir()]
+        except OSError:
+            listing = []
+    present = {n.lower(): n for n in listing}
+    chunks = []
+    for ext in SPLIT_EXTS:
+        name = present.get((wbfs.stem + ext).lower())
+        if name is not None:
+            chunks.append(wbfs.parent / name)
+    return chunks
+
+
+def constituent_files(target: Path, listing: list[str] | None = None) -> list[Path]:
+    """`target` followed by the other files it needs (for file launch targets)."""
+    ext = target.suffix.lower()
+    if ext == ".cue":
+        return [target, *cue_tracks(target, listing)]
+    if ext == ".wbfs":
+        return [target, *split_chunks(target, listing)]
+    return [target]
+
+
+class FolderDigests:
+    """Per-directory (mtime_ns, files size, files newest mtime, subdirs), persisted as JSON."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._dirs: dict[str, list] = {}
+        self._seen: dict[str, list] = {}
+        if path is not None:
+            try:
+                self._dirs = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._dirs = {}
+
+    def digest(self, root: Path) -> tuple[int, int]:
+        """(newest mtime in seconds, total size) of every file under `root`."""
+        newest, size = self._walk(root)
+        return newest // 1_000_000_000, size
+
+    def _walk(self, root: Path) -> tuple[int, int]:
+        key = os.fspath(root)
+        mtime_ns = os.stat(key).st_mtime_ns
+        entry = self._dirs.get(key)
+        if entry is None or entry[0] != mtime_ns:
+            size, newest, subdirs = 0, mtime_ns, []
+            with os.scandir(key) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        subdirs.append(e.name)
+                    elif e.is_file():
+                        st = e.stat()
+                        size += st.st_size
+                        newest = max(newest, st.st_mtime_ns)
+            entry = [mtime_ns, size, newest, sorted(subdirs)]
+        self._seen[key] = entry
+        newest, size = entry[2], entry[1]
+        for name in entry[3]:
+            try:
+                sub_newest, sub_size = self._walk(root / name)
+            except OSError:
+                continue  # removed since; the parent's mtime catches it next time
+            newest = max(newest, sub_newest)
+            size += sub_size
+        return newest, size
+
+    def save(self) -> None:
+        """Writes the directories visited since load (others are gone or out of scope)."""
+        if self.path is None or not self._seen:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self._seen), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def fingerprint(
+    target: Path,
+    listing: list[str] | None = None,
+    folder: Path | None = None,
+    digests: FolderDigests | None = None,
+) -> tuple[int | None, int | None]:
+    """(mtime, size) of a launch target with everything it needs.
+
+    `folder` is the game folder when the whole tree counts (folder games);
+    `listing` is the target's directory listing when the caller has one.
+    """
+    try:
+        if folder is not None:
+            return (digests or FolderDigests()).digest(folder)
+        mtime, size = 0, 0
+        for f in constituent_files(target, listing):
+            st = f.stat()
+            mtime = max(mtime, int(st.st_mtime))
+            size += st.st_size
+        return mtime, size
+    except OSError:
+        return None, None
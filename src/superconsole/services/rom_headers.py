@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from ..paths import CACHE_DIR
+from ..tracing import traced
+
+# Reads what the ROM itself says about the game: internal title, serial / disc
+# ID and region. Only the header bytes are read (pread at known offsets, never
+# the whole image), headers are parsed on a thread pool during the scan, and
+# results are cached by the game's fingerprint so an unchanged library reads
+# nothing at all.
+#
+#   iNES           magic at 0; region from flags 9 / NES 2.0 byte 12 (no title)
+#   SNES           internal header at 0x7FC0 (LoROM) / 0xFFC0 (HiROM), +0x200
+#                  with a copier header; picked by the checksum complement
+#   GB / GBC       0x134 title, 0x14A destination, 0x14D header checksum
+#   GBA            0xA0 title, 0xAC game code, 0xB2 fixed 0x96
+#   N64            0x20 title, 0x3B game ID; .z64/.v64/.n64 byte orders
+#   GameCube/Wii   ID6 + title at the disc header: 0 for ISO/GCM, 0x200 in a
+#                  WBFS container, 0x58 in RVZ/WIA (the stored disc header copy)
+#   PS3            PARAM.SFO: TITLE, TITLE_ID, CATEGORY
+
+log = logging.getLogger(__name__)
+
+HEADER_CACHE = CACHE_DIR / "rom_headers.json"
+HEADER_CACHE_VERSION = 1
+HEADER_WORKERS = int(os.environ.get("SUPERCONSOLE_HEADER_WORKERS", "8"))
+
+
+@dataclass(frozen=True)
+class RomHeader:
+    format: str
+    title: str | None = None
+    serial: str | None = None      # GBA/N64 game code, GC/Wii ID6, PS3 title ID
+    region: str | None = None
+    category: str | None = None    # PS3 SFO category (DG, HG, GD, ...)
+
+
+# -- reading ---------------------------------------------------------------
+
+Reader = Callable[[int, int], bytes]
+
+
+def _file_reader(fd: int) -> Reader:
+    if hasattr(os, "pread"):
+        return lambda offset, n: os.pread(fd, n, offset)
+
+    def read(offset: int, n: int) -> bytes:  # Windows: no pread
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, n)
+
+    return read
+
+
+def _bytes_reader(data: bytes) -> Reader:
+    return lambda offset, n: data[offset:offset + n]
+
+
+def _text(raw: bytes, encoding: str = "ascii") -> str | None:
+    text = raw.split(b"\0", 1)[0].decode(encoding, "replace").strip()
+    return text or None
+
+
+# -- parsers ---------------------------------------------------------------
+
+def parse_ines(read: Reader, size: int) -> RomHeader | None:
+    h = read(0, 16)
+    if len(h) < 16 or h[:4] != b"NES\x1a":
+        return None
+    if h[7] & 0x0C == 0x08:  # NES 2.0: 0 NTSC, 1 PAL, 2 multi, 3 Dendy
+        region = {0: "NTSC", 1: "PAL", 2: "World", 3: "Dendy"}[h[12] & 0x03]
+    else:
+        region = "PAL" if h[9] & 0x01 else "NTSC"
+    return RomHeader(format="ines", region=region)
+
+
+_SNES_REGIONS = {
+    0x00: "Japan", 0x01: "USA", 0x02: "Europe", 0x03: "Sweden", 0x06: "France",
+    0x07: "Netherlands", 0x08: "Spain", 0x09: "Germany", 0x0A: "Italy",
+    0x0B: "China", 0x0D: "Korea", 0x0F: "Canada", 0x10: "Brazil", 0x11: "Australia",
+}
+
+
+def parse_snes(read: Reader, size: int) -> RomHeader | None:
+    skip = 0x200 if size % 1024 == 512 else 0
+    best = None
+    for base in (0x7FC0, 0xFFC0):
+        h = read(skip + base, 0x20)
+        if len(h) < 0x20:
+            continue
+        complement, checksum = struct.unpack_from("<HH", h, 0x1C)
+        score = (complement ^ checksum == 0xFFFF) * 2 + all(0x20 <= b < 0x7F for b in h[:21])
+        if best is None or score > best[0]:
+            best = (score, h)
+    if best is None or best[0] == 0:
+        return None
+    h = best[1]
+    return RomHeader(
+        format="snes",
+        title=_text(h[:21], "shift_jis"),
+        region=_SNES_REGIONS.get(h[0x19]),
+    )
+
+
+def parse_gb(read: Reader, size: int) -> RomHeader | None:
+    h = read(0x134, 0x1A)  # 0x134..0x14D
+    if len(h) < 0x1A:
+        return None
+    x = 0
+    for b in h[:0x19]:
+        x = (x - b - 1) & 0xFF
+    if x != h[0x19]:
+        return None
+    cgb = h[0x0F] in (0x80, 0xC0)
+    return RomHeader(
+        format="gbc" if cgb else "gb",
+        title=_text(h[:11] if cgb else h[:16]),
+        region="Japan" if h[0x16] == 0 else "World",
+    )
+
+
+_CODE_REGIONS = {
+    "A": "World", "B": "Brazil", "C": "China", "D": "Germany", "E": "USA",
+    "F": "France", "H": "Netherlands", "I": "Italy", "J": "Japan", "K": "Korea",
+    "N": "Canada", "P": "Europe", "R": "Russia", "S": "Spain", "U": "Australia",
+    "W": "Taiwan", "X": "Europe", "Y": "Europe",
+}
+
+
+def parse_gba(read: Reader, size: int) -> RomHeader | None:
+    h = read(0xA0, 0x20)
+    if len(h) < 0x20 or h[0x12] != 0x96:
+        return None
+    code = _text(h[0x0C:0x10])
+    return RomHeader(
+        format="gba",
+        title=_text(h[:12]),
+        serial=code,
+        region=_CODE_REGIONS.get(code[3]) if code and len(code) == 4 else None,
+    )
+
+
+def _n64_order(raw: bytes, magic: bytes) -> bytes:
+    if magic == b"\x37\x80\x40\x12":  # .v64: byte-swapped halfwords
+        return bytes(b for i in range(0, len(raw) - 1, 2) for b in (raw[i + 1], raw[i]))
+    if magic == b"\x40\x12\x37\x80":  # .n64: little-endian words
+        return b"".join(raw[i:i + 4][::-1] for i in range(0, len(raw) - 3, 4))
+    return raw
+
+
+def parse_n64(read: Reader, size: int) -> RomHeader | None:
+    raw = read(0, 0x40)
+    if len(raw) < 0x40:
+        return None
+    magic = raw[:4]
+    if magic not in (b"\x80\x37\x12\x40", b"\x37\x80\x40\x12", b"\x40\x12\x37\x80"):
+        return None
+    h = _n64_order(raw, magic)
+    code = h[0x3B:0x3F].decode("ascii", "replace")
+    return RomHeader(
+        format="n64",
+        title=_text(h[0x20:0x34], "shift_jis"),
+        serial=code if code.isalnum() else None,
+        region=_CODE_REGIONS.get(code[3]),
+    )
+
+
+_WII_MAGIC = b"\x5D\x1C\x9E\xA3"  # at 0x18
+_GC_MAGIC = b"\xC2\x33\x9F\x3D"   # at 0x1C
+
+
+def _disc_header_offset(read: Reader) -> int:
+    magic = read(0, 4)
+    if magic == b"WBFS":
+        return 0x200
+    if magic in (b"WIA\x01", b"RVZ\x01"):
+        return 0x58
+    return 0
+
+
+def parse_disc(read: Reader, size: int) -> RomHeader | None:
+    base = _disc_header_offset(read)
+    h = read(base, 0x60)
+    if len(h) < 0x60:
+        return None
+    if h[0x18:0x1C] == _WII_MAGIC:
+        fmt = "wii"
+    elif h[0x1C:0x20] == _GC_MAGIC:
+        fmt = "gamecube"
+    else:
+        return None
+    id6 = h[:6].decode("ascii", "replace")
+    return RomHeader(
+        format=fmt,
+        title=_text(h[0x20:0x60], "utf-8"),
+        serial=id6 if id6.isalnum() else None,
+        region=_CODE_REGIONS.get(id6[3]),
+    )
+
+
+_SFO_REGIONS = {"U": "USA", "E": "Europe", "J": "Japan", "A": "Asia", "H": "Asia", "K": "Korea"}
+
+
+def parse_sfo_bytes(data: bytes) -> dict[str, str | int]:
+    """Key -> value for every entry of a PARAM.SFO; {} if it isn't one."""
+    if len(data) < 0x14 or data[:4] != b"\0PSF":
+        return {}
+    key_table, data_table, count = struct.unpack_from("<III", data, 8)
+    out: dict[str, str | int] = {}
+    for i in range(count):
+        pos = 0x14 + i * 16
+        if pos + 16 > len(data):
+            break
+        key_off, fmt, length, _max_len, data_off = struct.unpack_from("<HHIII", data, pos)
+        key = _text(data[key_table + key_off:key_table + key_off + 64])
+        raw = data[data_table + data_off:data_table + data_off + length]
+        if key is None:
+            continue
+        if fmt == 0x0404 and len(raw) >= 4:
+            out[key] = struct.unpack_from("<I", raw)[0]
+        else:
+            out[key] = _text(raw, "utf-8") or ""
+    return out
+
+
+def parse_sfo(read: Reader, size: int) -> RomHeader | None:
+    sfo = parse_sfo_bytes(read(0, min(size, 64 * 1024)))
+    if not sfo:
+        return None
+    title_id = str(sfo.get("TITLE_ID") or "") or None
+    return RomHeader(
+        format="sfo",
+        title=str(sfo.get("TITLE") or "") or None,
+        serial=title_id,
+        region=_SFO_REGIONS.get(title_id[2]) if title_id and len(title_id) > 2 else None,
+        category=str(sfo.get("CATEGORY") or "") or None,
+    )
+
+
+PARSERS: dict[str, Callable[[Reader, int], RomHeader | None]] = {
+    ".nes": parse_ines,
+    ".sfc": parse_snes, ".smc": parse_snes,
+    ".gb": parse_gb, ".gbc": parse_gb,
+    ".gba": parse_gba,
+    ".z64": parse_n64, ".n64": parse_n64, ".v64": parse_n64,
+    ".iso": parse_disc, ".gcm": parse_disc, ".wbfs": parse_disc, ".rvz": parse_disc, ".wia": parse_disc,
+    ".sfo": parse_sfo,
+}
+
+# Enough of a zipped ROM for every cartridge header above (SNES HiROM + copier header).
+_ZIP_PREFIX = 0x10200
+
+
+def _param_sfo(target: Path) -> Path | None:
+    # PS3 folder games launch EBOOT.BIN; the SFO sits two levels up.
+    if target.name.upper() == "EBOOT.BIN" and target.parent.name.upper() == "USRDIR":
+        sfo = target.parent.parent / "PARAM.SFO"
+        return sfo if sfo.is_file() else None
+    return None
+
+
+def read_header(target: Path, archive_member: str | None = None) -> RomHeader | None:
+    """The header of one launch target; None when the format is unknown or the bytes don't match."""
+    sfo = _param_sfo(target)
+    if sfo is not None:
+        target = sfo
+    name = archive_member or target.name
+    parser = PARSERS.get(os.path.splitext(name)[1].lower())
+    if parser is None or target.is_dir():
+        return None
+    try:
+        if archive_member:
+            with zipfile.ZipFile(target) as zf:
+                size = zf.getinfo(archive_member).file_size
+                with zf.open(archive_member) as f:
+                    return parser(_bytes_reader(f.read(_ZIP_PREFIX)), size)
+        fd = os.open(target, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            return parser(_file_reader(fd), os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+    except (OSError, KeyError, zipfile.BadZipFile, struct.error) as e:
+        log.debug("Header read failed for %s: %s", target, e)
+        return None
+
+
+# -- cache + batch -----------------------------------------------------------
+
+class HeaderCache:
+    """Parsed headers keyed by launch target, valid while its fingerprint matches."""
+
+    def __init__(self, path: Path | None = HEADER_CACHE):
+        self.path = path
+        self._entries: dict[str, list] = {}
+        self._seen: dict[str, list] = {}
+        if path is not None:
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+                if payload.get("version") == HEADER_CACHE_VERSION:
+                    self._entries = payload["entries"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                self._entries = {}
+
+    @staticmethod
+    def _key(target: Path, archive_member: str | None) -> str:
+        return f"{target}|{archive_member}" if archive_member else str(target)
+
+    def get(self, target: Path, archive_member: str | None, fingerprint) -> tuple[bool, RomHeader | None]:
+        key = self._key(target, archive_member)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != list(fingerprint):
+            return False, None
+        self._seen[key] = entry
+        return True, RomHeader(**entry[1]) if entry[1] else None
+
+    def put(self, target: Path, archive_member: str | None, fingerprint, header: RomHeader | None) -> None:
+        key = self._key(target, archive_member)
+        entry = [list(fingerprint), asdict(header) if header else None]
+        self._entries[key] = entry
+        self._seen[key] = entry
+
+    def save(self) -> None:
+        """Writes the entries used or added since load (games still in the library)."""
+        if self.path is None or not self._seen:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": HEADER_CACHE_VERSION, "entries": self._seen}), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+@traced("read_headers")
+def read_headers(
+    items: list[tuple[Path, str | None, tuple]],
+    cache: HeaderCache,
+    workers: int = HEADER_WORKERS,
+) -> list[RomHeader | None]:
+    """Headers for (target, archive_member, fingerprint) items; cache misses are read in parallel."""
+    out: list[RomHeader | None] = [None] * len(items)
+    misses: list[int] = []
+    for i, (target, member, fp) in enumerate(items):
+        hit, header = cache.get(target, member, fp)
+        if hit:
+            out[i] = header
+        else:
+            misses.append(i)
+    if misses:
+        # Mostly waiting on the disk (a slow mount under WSL), so threads overlap well.
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="rom-header") as pool:
+            results = pool.map(lambda i: read_header(items[i][0], items[i][1]), misses)
+            for i, header in zip(misses, results):
+                out[i] = header
+                target, member, fp = items[i]
+                if None not in fp:
+                    cache.put(target, member, fp, header)
+    return out
@@ -1,10 +1,16 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Iterable
 
 from ..core.models import Game
-from .covers import find_cover
+from ..paths import CACHE_DIR, DATS_DIR
+from .archive_cache import ARCHIVE_EXTS, list_members
+from .covers import CoverIndex, find_cover
+from .rom_files import FolderDigests, fingerprint
+from .rom_headers import HEADER_CACHE, HeaderCache, RomHeader, read_header, read_headers
+from ..tracing import traced
 
 # Files we never treat as "the game"
 IGNORE_EXTS = {
@@ -23,6 +29,19 @@ EXTS_PS1 = {".cue"}                        # cue is the entry point
 EXTS_WIIU = set()                          # folder-based
 EXTS_PS3 = {".iso"}                        # optional; installed games handled separately
 
+# PARAM.SFO categories of installed RPCS3 entries that are games: HDD (PSN)
+# games and disc games. GD (patches / install data), AT/AV (apps), SD (saves)
+# and the like are skipped.
+PS3_GAME_CATEGORIES = {"HG", "DG"}
+
+# Cartridge ROMs may also sit zipped in the game folder; the member is indexed
+# and extracted at launch (archive_cache). Disc platforms never look in zips.
+EXTS_CARTRIDGE = {".nes", ".sfc", ".smc", ".gba", ".gb", ".gbc", ".z64", ".n64", ".v64"}
+DISC_PLATFORMS = {
+    "ps1", "playstation", "playstation1", "ps2", "ps3", "gamecube", "wii",
+    "wiiu", "wii-u", "xbox", "xbox360", "xbox-360",
+}
+
 @dataclass(frozen=True)
 class ScanConfig:
     roms_root: Path
@@ -33,6 +52,13 @@ class ScanConfig:
     rpcs3_dev_hdd0_game: Path | None = None  # e.g. /mnt/e/.../RPCS3/dev_hdd0/game
     ps3_platform_name: str = "ps3"
 
+    # Folder-game digests carried between scans (rom_files.FolderDigests); None: not persisted
+    digest_cache: Path | None = CACHE_DIR / "folder_digests.json"
+    # Parsed ROM headers by fingerprint (rom_headers.HeaderCache); None: not persisted
+    header_cache: Path | None = HEADER_CACHE
+    # No-Intro / Redump DATs that sync identifies games against (dat_index); None: off
+    dats_dir: Path | None = DATS_DIR
+
 
 def _iter_game_dirs(platform_dir: Path) -> Iterable[Path]:
     for p in sorted(platform_dir.iterdir()):
@@ -40,26 +66,33 @@ def _iter_game_dirs(platform_dir: Path) -> Iterable[Path]:
             yield p
 
 
-def _pick_first_file_with_exts(game_dir: Path, exts: set[str]) -> Path | None:
-    # Prefer deterministic ordering
-    candidates: list[Path] = []
-    for p in sorted(game_dir.iterdir()):
-        if not p.is_file():
+def _list_dir(game_dir: Path) -> list[os.DirEntry]:
+    # One listing per game folder, sorted for deterministic picks; DirEntry
+    # answers is_file() from the listing itself on most filesystems.
+    with os.scandir(game_dir) as it:
+        return sorted(it, key=lambda e: e.name)
+
+
+def _pick_first_file_with_exts(game_dir: Path, exts: set[str], entries: list[os.DirEntry] | None = None) -> Path | None:
+    if entries is None:
+        entries = _list_dir(game_dir)
+    for e in entries:
+        if not e.is_file():
             continue
-        ext = p.suffix.lower()
+        ext = os.path.splitext(e.name)[1].lower()
         if ext in IGNORE_EXTS:
             continue
         if ext in exts:
-            candidates.append(p)
-    return candidates[0] if candidates else None
+            return game_dir / e.name
+    return None
 
 
-def _pick_launch_target(platform: str, game_dir: Path) -> Path | None:
+def _pick_launch_target(platform: str, game_dir: Path, entries: list[os.DirEntry] | None = None) -> Path | None:
     p = platform.lower()
 
     # PS1: use .cue
     if p in {"ps1", "playstation", "playstation1"}:
-        return _pick_first_file_with_exts(game_dir, EXTS_PS1)
+        return _pick_first_file_with_exts(game_dir, EXTS_PS1, entries)
 
     # WiiU: folder game, detect via meta/meta.xml OR code/*.rpx
     if p in {"wiiu", "wii-u"}:
@@ -76,21 +109,21 @@ def _pick_launch_target(platform: str, game_dir: Path) -> Path | None:
 
     # Wii: prefer .wbfs in folder; ignore .wbf1
     if p == "wii":
-        return _pick_first_file_with_exts(game_dir, EXTS_WII)
+        return _pick_first_file_with_exts(game_dir, EXTS_WII, entries)
 
     # GameCube
     if p == "gamecube":
-        return _pick_first_file_with_exts(game_dir, EXTS_GAMECUBE)
+        return _pick_first_file_with_exts(game_dir, EXTS_GAMECUBE, entries)
 
     # PS2
     if p == "ps2":
-        return _pick_first_file_with_exts(game_dir, EXTS_PS2)
+        return _pick_first_file_with_exts(game_dir, EXTS_PS2, entries)
 
     # Xbox / 360
     if p == "xbox":
-        return _pick_first_file_with_exts(game_dir, EXTS_XBOX)
+        return _pick_first_file_with_exts(game_dir, EXTS_XBOX, entries)
     if p in {"xbox360", "xbox-360"}:
-        return _pick_first_file_with_exts(game_dir, EXTS_XBOX)
+        return _pick_first_file_with_exts(game_dir, EXTS_XBOX, entries)
 
     # PS3 folder games (RPCS3 style): look for PS3_GAME/USRDIR/EBOOT.BIN
     if p == "ps3":
@@ -98,18 +131,68 @@ def _pick_launch_target(platform: str, game_dir: Path) -> Path | None:
         if eboot.exists():
             return eboot
         # optional iso
-        return _pick_first_file_with_exts(game_dir, EXTS_PS3)
+        return _pick_first_file_with_exts(game_dir, EXTS_PS3, entries)
 
     # Default: find first supported ROM-like file
-    return _pick_first_file_with_exts(game_dir, EXTS_DEFAULT)
+    return _pick_first_file_with_exts(game_dir, EXTS_DEFAULT, entries)
+
+
+def _pick_archive_member(game_dir: Path, entries: list[os.DirEntry] | None = None) -> tuple[Path, str] | None:
+    if entries is None:
+        entries = _list_dir(game_dir)
+    for e in entries:
+        if not e.is_file() or os.path.splitext(e.name)[1].lower() not in ARCHIVE_EXTS:
+            continue
+        p = game_dir / e.name
+        members = sorted(m for m in list_members(p) if Path(m).suffix.lower() in EXTS_CARTRIDGE)
+        if members:
+            return p, members[0]
+    return None
+
+
+def _fingerprint(
+    game_dir: Path,
+    launch_target: Path,
+    entries: list[os.DirEntry] | None,
+    digests: FolderDigests,
+) -> tuple[int | None, int | None]:
+    # Folder games (a launch folder, or an executable deep inside the game
+    # folder like WiiU code/*.rpx and PS3 EBOOT.BIN) change anywhere in the tree.
+    if launch_target == game_dir or launch_target.parent != game_dir:
+        return fingerprint(launch_target, folder=game_dir, digests=digests)
+    listing = [e.name for e in entries] if entries is not None else None
+    return fingerprint(launch_target, listing)
+
+
+def _installed_sfo(title_id_dir: Path, cache: HeaderCache) -> RomHeader | None:
+    # Cached on the SFO's own stat: the category decides whether the folder is
+    # worth fingerprinting at all, so this runs before anything else touches it.
+    sfo = title_id_dir / "PARAM.SFO"
+    try:
+        st = sfo.stat()
+    except OSError:
+        return None
+    fp = (int(st.st_mtime), st.st_size)
+    hit, header = cache.get(sfo, None, fp)
+    if not hit:
+        header = read_header(sfo)
+        cache.put(sfo, None, fp, header)
+    return header
 
 
+@traced("scan_roms")
 def scan_roms(config: ScanConfig) -> list[Game]:
     games: list[Game] = []
 
     if not config.roms_root.exists():
         return games
 
+    digests = FolderDigests(config.digest_cache)
+    header_cache = HeaderCache(config.header_cache)
+    # (platform, game_dir, launch_target, archive_member, fingerprint); headers
+    # and covers are resolved for all of them once the walk is done.
+    found: list[tuple[str, Path, Path, str | None, tuple[int | None, int | None]]] = []
+
     # Platforms are directories under ROMS/
     for platform_dir in sorted(config.roms_root.iterdir()):
         if not platform_dir.is_dir():
@@ -127,38 +210,77 @@ def scan_roms(config: ScanConfig) -> list[Game]:
             if platform.lower() == "ps3" and name_lower in {"exdata", "packages"}:
                 continue
 
-            launch_target = _pick_launch_target(platform, game_dir)
+            try:
+                entries = _list_dir(game_dir)
+            except OSError:
+                continue
+            launch_target = _pick_launch_target(platform, game_dir, entries)
+            archive_member = None
+            if not launch_target and platform.lower() not in DISC_PLATFORMS:
+                picked = _pick_archive_member(game_dir, entries)
+                if picked:
+                    launch_target, archive_member = picked
             if not launch_target:
                 continue
 
-            cover = find_cover(platform, game_dir.name, config.images_root, config.placeholder_cover)
+            fp = _fingerprint(game_dir, launch_target, entries, digests)
+            found.append((platform, game_dir, launch_target, archive_member, fp))
 
-            games.append(Game(
-                platform=platform,
-                title=game_dir.name,
-                game_dir=game_dir,
-                launch_target=launch_target,
-                cover_path=cover,
-            ))
+    headers = read_headers([(target, member, fp) for _, _, target, member, fp in found], header_cache)
 
     # Optional: installed PS3 games in RPCS3 dev_hdd0/game/<TITLEID>/USRDIR/EBOOT.BIN
+    installed: list[tuple[str, Path, Path, str | None, tuple[int | None, int | None]]] = []
     if config.rpcs3_dev_hdd0_game and config.rpcs3_dev_hdd0_game.exists():
         ps3_platform = config.ps3_platform_name
         for title_id_dir in sorted(config.rpcs3_dev_hdd0_game.iterdir()):
             if not title_id_dir.is_dir():
                 continue
+            sfo = _installed_sfo(title_id_dir, header_cache)
+            if sfo is not None and sfo.category and sfo.category not in PS3_GAME_CATEGORIES:
+                continue  # patches, DLC and save/app data sit here too; nothing to descend into
+            if sfo is None or not sfo.serial:
+                # Missing or unreadable SFO: the game stays, under its folder name (the title ID).
+                sfo = replace(sfo or RomHeader(format="sfo"), serial=title_id_dir.name)
             eboot = title_id_dir / "USRDIR" / "EBOOT.BIN"
             if not eboot.exists():
                 continue
 
-            cover = find_cover(ps3_platform, title_id_dir.name, config.images_root, config.placeholder_cover)
-
-            games.append(Game(
-                platform=ps3_platform,
-                title=title_id_dir.name,
-                game_dir=title_id_dir,
-                launch_target=eboot,
-                cover_path=cover,
-            ))
+            fp = _fingerprint(title_id_dir, eboot, None, digests)
+            installed.append((ps3_platform, title_id_dir, eboot, None, fp))
+            headers.append(sfo)
+    found.extend(installed)
+
+    digests.save()
+    header_cache.save()
+
+    covers = CoverIndex(config.images_root)
+    for (platform, game_dir, launch_target, archive_member, (mtime, size)), header in zip(found, headers):
+        serial = header.serial if header else None
+        title = game_dir.name
+        placeholder = config.placeholder_cover
+        if header is not None and header.format == "sfo" and game_dir.parent == config.rpcs3_dev_hdd0_game:
+            # Installed games live in title-ID folders; the SFO has the real name,
+            # and the game's own icon beats the generic placeholder.
+            title = header.title or title
+            icon = game_dir / "ICON0.PNG"
+            if icon.is_file():
+                placeholder = icon
+        cover = find_cover(
+            platform, title, config.images_root, placeholder,
+            serial=serial, index=covers,
+        )
+        games.append(Game(
+            platform=platform,
+            title=title,
+            game_dir=game_dir,
+            launch_target=launch_target,
+            cover_path=cover,
+            archive_member=archive_member,
+            mtime=mtime,
+            size=size,
+            serial=serial,
+            region=header.region if header else None,
+            internal_title=header.title if header else None,
+        ))
 
     return games
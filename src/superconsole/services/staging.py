@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from ..paths import ROMS_DIR
+from ..tracing import traced
+from .rom_files import constituent_files
+
+# Optional local staging for big disc images that live on a slow mount
+# (/mnt/e through WSL): the launch target and its companion files (cue bins,
+# wbf chunks) are copied to a fast local directory in the background, and
+# launch_game hands the emulator the staged copy once it is complete and
+# still matches the source. Copies are queued from prefetch() (at startup and
+# after a game exits), never at launch, so they don't compete with a running
+# emulator for the slow disk.
+#
+# Off unless SUPERCONSOLE_STAGING_DIR is set. Entries past the budget are
+# evicted one-off games first, then least recently used.
+
+log = logging.getLogger(__name__)
+
+STAGING_DIR = os.environ.get("SUPERCONSOLE_STAGING_DIR", "")
+STAGING_GB = float(os.environ.get("SUPERCONSOLE_STAGING_GB", "64"))
+STAGING_MIN_MB = float(os.environ.get("SUPERCONSOLE_STAGING_MIN_MB", "64"))  # smaller games load fine as is
+PREFETCH_GAMES = int(os.environ.get("SUPERCONSOLE_STAGING_PREFETCH", "5"))
+
+MANIFEST = "manifest.json"
+
+
+def _fingerprint(files: list[Path]) -> list[list]:
+    out = []
+    for f in files:
+        st = f.stat()
+        out.append([f.name, st.st_size, st.st_mtime_ns])
+    return out
+
+
+class StagingCache:
+    def __init__(self, root: Path, budget_bytes: int, min_bytes: int = 0):
+        self.root = root
+        self.budget = budget_bytes
+        self.min_bytes = min_bytes
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[Path] = queue.Queue()
+        self._queued: set[Path] = set()
+        self._worker: threading.Thread | None = None
+        self._manifest: dict[str, dict] | None = None
+
+    # -- manifest ---------------------------------------------------------
+
+    def _load(self) -> dict[str, dict]:
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads((self.root / MANIFEST).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def _save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / (MANIFEST + ".tmp")
+        tmp.write_text(json.dumps(self._manifest or {}, indent=1), encoding="utf-8")
+        os.replace(tmp, self.root / MANIFEST)
+
+    @staticmethod
+    def _key(source: Path) -> str:
+        return hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:20]
+
+    # -- lookups ----------------------------------------------------------
+
+    def staged_path(self, source: Path, touch: bool = True) -> Path | None:
+        """The staged copy of `source` if it is complete and still current.
+
+        `touch` counts the lookup as a use (launches do; read-ahead doesn't).
+        """
+        key = self._key(source)
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None:
+                return None
+            staged = self.root / key / source.name
+            try:
+                current = _fingerprint(constituent_files(source))
+            except OSError:
+                return None
+            if current != entry["fingerprint"] or not staged.is_file():
+                return None
+            if not touch:
+                return staged
+            entry["last_used"] = time.time()
+            entry["uses"] = entry.get("uses", 0) + 1
+            self._save()
+            return staged
+
+    # -- copying ----------------------------------------------------------
+
+    def stage_async(self, source: Path) -> None:
+        with self._lock:
+            if source in self._queued:
+                return
+            self._queued.add(source)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="rom-staging", daemon=True)
+                self._worker.start()
+        self._queue.put(source)
+
+    def _run(self) -> None:
+        while True:
+            source = self._queue.get()
+            try:
+                self.stage(source)
+            except Exception:
+                log.exception("Staging failed for %s", source)
+            finally:
+                with self._lock:
+                    self._queued.discard(source)
+
+    @traced("stage_rom")
+    def stage(self, source: Path) -> Path | None:
+        files = constituent_files(source)
+        if source.suffix.lower() == ".cue" and len(files) < 2:
+            return None  # tracks we couldn't resolve; a partial copy won't boot
+        fingerprint = _fingerprint(files)
+        key = self._key(source)
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is not None and entry["fingerprint"] == fingerprint:
+                return self.root / key / source.name  # already staged and current
+        size = sum(f[1] for f in fingerprint)
+        if size < self.min_bytes or size > self.budget:
+            return None
+        self.root.mkdir(parents=True, exist_ok=True)
+        try:
+            if os.stat(files[0]).st_dev == os.stat(self.root).st_dev:
+                return None  # same filesystem: nothing to gain
+        except OSError:
+            return None
+
+        with self._lock:
+            self._load().pop(key, None)  # stale copy, if any, is replaced below
+            self._evict(size)
+        t0 = time.perf_counter()
+        tmp = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.root))
+        try:
+            for f in files:
+                shutil.copy2(f, tmp / f.name)
+            final = self.root / key
+            shutil.rmtree(final, ignore_errors=True)
+            os.replace(tmp, final)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        with self._lock:
+            self._load()[key] = {
+                "source": str(source),
+                "size": size,
+                "fingerprint": fingerprint,
+                "staged_at": time.time(),
+                "last_used": time.time(),
+                "uses": 0,
+            }
+            self._save()
+        log.info("Staged %s (%d MB) in %.1fs", source.name, size >> 20, time.perf_counter() - t0)
+        return self.root / key / source.name
+
+    def _evict(self, incoming: int) -> None:
+        manifest = self._load()
+        total = sum(e["size"] for e in manifest.values())
+        # Games played more than once outlive one-offs; LRU within each group.
+        order = sorted(manifest.items(), key=lambda kv: (kv[1].get("uses", 0) > 1, kv[1]["last_used"]))
+        for key, entry in order:
+            if total + incoming <= self.budget:
+                break
+            shutil.rmtree(self.root / key, ignore_errors=True)
+            del manifest[key]
+            total -= entry["size"]
+            log.info("Unstaged %s", Path(entry["source"]).name)
+        self._save()
+
+    # -- prefetch ---------------------------------------------------------
+
+    def prefetch(self, db_path: Path, roms_root: Path = ROMS_DIR, limit: int = PREFETCH_GAMES) -> None:
+        """Queues the games most likely to be launched next (recent and frequent)."""
+        con = sqlite3.connect(db_path)
+        try:
+            rows = con.execute(
+                """
+                SELECT launch_target FROM games
+                WHERE hidden = 0 AND launch_type = 'file' AND archive_member IS NULL
+                  AND last_played IS NOT NULL
+                ORDER BY play_count * 1.0 / (julianday('now') - julianday(last_played) + 1) DESC
+                LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        finally:
+            con.close()
+        for (launch_target,) in rows:
+            p = Path(launch_target)
+            self.stage_async(p if p.is_absolute() else roms_root / p)
+
+
+_cache: StagingCache | None = None
+
+
+def staging_cache() -> StagingCache | None:
+    """The configured cache, or None when staging is off."""
+    global _cache
+    if not STAGING_DIR:
+        return None
+    if _cache is None:
+        _cache = StagingCache(Path(STAGING_DIR), int(STAGING_GB * (1 << 30)), int(STAGING_MIN_MB * (1 << 20)))
+    return _cache
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import subprocess
+import threading
+from functools import lru_cache
+from pathlib import Path, PureWindowsPath
+from typing import Iterable
+
+from ..tracing import traced
+
+# WSL <-> Windows path translation without a process per path.
+# Windows drives are mounted through drvfs/9p (/mnt/c, /mnt/e, ...); /proc/mounts
+# says which Windows root each mount point maps to, so most conversions are string
+# work. Paths on the Linux filesystem are reached from Windows through the
+# distro's \\wsl$\<distro> share, also string work when WSL_DISTRO_NAME is set.
+# Only without it does anything fall back to `wslpath` (one shell running it per
+# leftover path).
+
+log = logging.getLogger(__name__)
+
+_DRVFS_TYPES = {"drvfs", "9p", "virtiofs"}
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+_DRIVE_ROOT = re.compile(r"^[A-Za-z]:\\?")
+
+_lock = threading.Lock()
+_to_windows_cache: dict[str, str] = {}  # guarded by _lock
+
+
+@lru_cache(maxsize=1)
+def is_wsl() -> bool:
+    if os.environ.get("WSL_DISTRO_NAME"):
+        return True
+    try:
+        return "microsoft" in Path("/proc/version").read_text().lower()
+    except OSError:
+        return False
+
+
+def _unescape(field: str) -> str:
+    # /proc/mounts escapes space, tab, newline and backslash as \ooo
+    return _OCTAL_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _windows_root(device: str, options: str) -> str | None:
+    if _DRIVE_ROOT.match(device):
+        return device
+    # WSL2 9p mounts: device is "drvfs" or "C:\", the real root is in path=...
+    for opt in re.split(r"[;,]", options):
+        if opt.startswith("path="):
+            return opt[len("path="):]
+    return None
+
+
+@lru_cache(maxsize=1)
+def mount_table() -> tuple[tuple[str, str], ...]:
+    """(linux mount point, windows root) pairs, longest mount point first."""
+    mounts: list[tuple[str, str]] = []
+    try:
+        lines = Path("/proc/mounts").read_text().splitlines()
+    except OSError:
+        return ()
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 4 or fields[2] not in _DRVFS_TYPES:
+            continue
+        root = _windows_root(_unescape(fields[0]), _unescape(fields[3]))
+        if root:
+            mounts.append((_unescape(fields[1]).rstrip("/") or "/", root))
+    mounts.sort(key=lambda m: len(m[0]), reverse=True)
+    return tuple(mounts)
+
+
+def _translate(linux_path: str) -> str | None:
+    for mount_point, root in mount_table():
+        if linux_path == mount_point or linux_path.startswith(mount_point + "/"):
+            rel = linux_path[len(mount_point):].strip("/")
+            win = PureWindowsPath(root.rstrip("\\") + "\\")
+            return str(win / rel.replace("/", "\\")) if rel else str(win)
+    return None
+
+
+def _distro_path(linux_path: str) -> str | None:
+    # What `wslpath -w` gives for a path on the Linux side: the distro's share.
+    distro = os.environ.get("WSL_DISTRO_NAME")
+    if not distro or not linux_path.startswith("/"):
+        return None
+    return "\\\\wsl$\\" + distro + linux_path.replace("/", "\\").rstrip("\\")
+
+
+def _wslpath_shell(paths: list[str]) -> list[str]:
+    """
+    One shell that runs `wslpath -w` for each path in turn (still a process per
+    path, but only one fork from here); falls back to the input on failure.
+    """
+    try:
+        result = subprocess.run(
+            ["sh", "-c", 'for p do wslpath -w "$p" || echo "$p"; done', "sh", *paths],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        out = result.stdout.splitlines()
+        if len(out) == len(paths):
+            return out
+    except Exception:
+        log.debug("wslpath fallback failed", exc_info=True)
+    return list(paths)
+
+
+@traced("wsl_paths.to_windows_paths")
+def to_windows_paths(paths: Iterable[Path | str]) -> list[str]:
+    """Windows forms of `paths` (memoized); symlinks are resolved first."""
+    keys = [os.fspath(p) for p in paths]
+    with _lock:
+        found = {key: _to_windows_cache[key] for key in keys if key in _to_windows_cache}
+    if len(found) == len(set(keys)):
+        return [found[key] for key in keys]
+
+    missing: dict[str, str] = {}  # key -> resolved path for wslpath
+    for key in keys:
+        if key in found or key in missing:
+            continue
+        try:
+            resolved = str(Path(key).resolve(strict=False))
+        except OSError:
+            resolved = key
+        win = _translate(resolved) or _distro_path(resolved)
+        if win is None:
+            missing[key] = resolved
+        else:
+            found[key] = win
+    if missing:
+        found.update(zip(missing, _wslpath_shell(list(missing.values()))))
+
+    with _lock:
+        for key, value in found.items():
+            if not value.startswith("/"):  # untranslated ones are retried next time
+                _to_windows_cache[key] = value
+    return [found[key] for key in keys]
+
+
+def to_windows_path(path: Path | str) -> str:
+    return to_windows_paths([path])[0]
+
+
+def to_wsl_path(windows_path: str) -> str | None:
+    """Reverse lookup for a Windows path on a mounted drive (e.g. %USERPROFILE%)."""
+    wanted = PureWindowsPath(windows_path)
+    for mount_point, root in mount_table():
+        root_path = PureWindowsPath(root.rstrip("\\") + "\\")
+        try:
+            rel = wanted.relative_to(root_path)
+        except ValueError:
+            continue
+        parts = [p for p in rel.parts]
+        return "/".join([mount_point.rstrip("/"), *parts]) if parts else mount_point
+    return None
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+# Startup timeline: process start -> imports done -> window -> first frame ->
+# library visible. Each run logs one line and appends a JSON record to
+# data/logs/startup.jsonl so regressions show up over time.
+
+log = logging.getLogger(__name__)
+
+_marks: list[tuple[str, float]] = []
+_done = False
+
+
+def _process_start() -> float:
+    """perf_counter() value at process start; falls back to now if the OS won't say."""
+    now = time.perf_counter()
+    try:
+        # /proc/self/stat field 22 is the start time in clock ticks since boot
+        fields = Path("/proc/self/stat").read_text().rsplit(")", 1)[1].split()
+        started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        uptime = float(Path("/proc/uptime").read_text().split()[0])
+        age = uptime - started
+        if 0 <= age < 600:
+            return now - age
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    return now
+
+
+PROCESS_START = _process_start()
+
+
+def mark(name: str) -> None:
+    """Records `name` once; later marks with the same name are ignored."""
+    if _done or any(n == name for n, _ in _marks):
+        return
+    _marks.append((name, time.perf_counter()))
+
+
+def elapsed_ms(t: float) -> float:
+    return (t - PROCESS_START) * 1000.0
+
+
+def finish(log_file: Path | None = None) -> dict[str, float]:
+    """Logs the timeline (ms since process start) and appends it to `log_file`."""
+    global _done
+    if _done:
+        return {}
+    _done = True
+    timeline = {name: round(elapsed_ms(t), 1) for name, t in _marks}
+    log.info("Startup timeline (ms since process start): %s",
+             ", ".join(f"{k} {v:.0f}" for k, v in timeline.items()))
+    if log_file is not None:
+        try:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            with log_file.open("a", encoding="utf-8") as f:
+                f.write(json.dumps({"at": time.strftime("%Y-%m-%dT%H:%M:%S"), **timeline}) + "\n")
+        except OSError:
+            log.warning("Could not append startup timeline to %s", log_file)
+    return timeline
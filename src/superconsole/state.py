@@ -16,6 +16,7 @@ class AppState(EventDispatcher):
     platforms = ListProperty([]) # available platforms
     current_platform = StringProperty("") # current platform view
     current_games = ListProperty([]) # games for current platform
+    games_loading = BooleanProperty(False) # current platform page is still loading
     favorites = ListProperty([])
     recent_played = ListProperty([])
     recent_added = ListProperty([])
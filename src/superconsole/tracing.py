@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+# Span tracing in Chrome trace format (open in chrome://tracing or ui.perfetto.dev).
+# Off by default: `span()` hands back a shared no-op context and `traced()` wrappers
+# fall straight through, so instrumented hot paths (find_cover) cost one flag check.
+#
+# Enable with SUPERCONSOLE_TRACE=<file> (or =1 for data/logs/trace-<time>.json),
+# or `--trace` on the command line. The file is written at exit.
+
+log = logging.getLogger(__name__)
+
+_enabled = False
+_output: Path | None = None
+_events: list[tuple] = []          # (name, cat, ts_us, dur_us, tid, args); list.append is thread-safe
+_thread_names: dict[int, str] = {}
+_origin = time.perf_counter()
+_NOOP = nullcontext()
+
+
+def default_trace_path() -> Path:
+    from .paths import DATA_DIR
+    return DATA_DIR / "logs" / f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json"
+
+
+def enable(output: Path | None = None) -> None:
+    global _enabled, _output
+    if _enabled:
+        return
+    _enabled = True
+    _output = output or default_trace_path()
+    atexit.register(write_trace)
+    log.info("Tracing enabled, writing to %s at exit", _output)
+
+
+def enable_from_env() -> None:
+    value = os.environ.get("SUPERCONSOLE_TRACE", "").strip()
+    if not value or value == "0":
+        return
+    enable(None if value == "1" else Path(value))
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _record(name: str, cat: str, t0: float, t1: float, args: dict | None) -> None:
+    tid = threading.get_ident()
+    if tid not in _thread_names:
+        _thread_names[tid] = threading.current_thread().name
+    _events.append((name, cat, (t0 - _origin) * 1e6, (t1 - t0) * 1e6, tid, args))
+
+
+@contextmanager
+def _span(name: str, cat: str, args: dict | None):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, cat, t0, time.perf_counter(), args)
+
+
+def span(name: str, cat: str = "app", **args):
+    """`with span("scan_roms"): ...` — a no-op unless tracing is enabled."""
+    if not _enabled:
+        return _NOOP
+    return _span(name, cat, args or None)
+
+
+def traced(name: str | None = None, cat: str = "app"):
+    """Decorator form of span(); the enabled check happens per call."""
+    def deco(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(label, cat, t0, time.perf_counter(), None)
+        return wrapper
+    return deco
+
+
+def write_trace(path: Path | None = None) -> Path | None:
+    path = path or _output
+    if path is None or not _events:
+        return None
+    pid = os.getpid()
+    events = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": tname}}
+        for tid, tname in list(_thread_names.items())
+    ]
+    for name, cat, ts, dur, tid, args in list(_events):
+        event = {"name": name, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+                 "ts": round(ts, 1), "dur": round(dur, 1)}
+        if args:
+            event["args"] = args
+        events.append(event)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+    log.info("Trace written: %s (%d spans)", path, len(_events))
+    return path
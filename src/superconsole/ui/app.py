@@ -5,28 +5,24 @@ from pathlib import Path
 
 from kivy.app import App
 from kivy.clock import Clock
-from kivy.core.window import Window
-from kivy.uix.popup import Popup
+from kivy.core.window import Window, Keyboard
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.screenmanager import ScreenManager, FadeTransition
 
 from ..state import AppState
 from ..actions import set_status
-from ..services.rom_scanner import scan_roms, ScanConfig
-from ..paths import ROMS_DIR, IMAGES_DIR, PROJECT_ROOT
+from ..paths import ROMS_DIR, IMAGES_DIR, PROJECT_ROOT, DB_PATH, PLACEHOLDER_COVER
 
 from .screens.home import HomeScreen
 from .screens.library import LibraryScreen
 from .widgets import LoadingOverlay, COLORS, apply_bg, HoverButton
+from .frame_monitor import frame_monitor
+from .game_mode import GameRunningMode
 
 import time
-import subprocess
-import shutil
 import logging
-from ..services.index_cache import cache_path, load_games, save_games
-from ..services.covers import find_cover  # uses your exact match version
-from ..core.models import Game
+from ..services.covers import find_cover, warm_covers  # uses your exact match version
 from ..services.library_db import (
     connect,
     init_db,
@@ -35,15 +31,27 @@ from ..services.library_db import (
     list_favorites,
     list_recently_played,
     list_recently_added,
+    list_games_by_ids,
     update_cover_paths,
     mark_played,
+    library_generation,
+    record_play_sessions,
+    record_launch_stats,
 )
-from ..services.library_sync import sync_library
-from ..services.game_launcher import launch_game, is_wsl, get_emulator_exe
+from ..services.library_snapshot import LibrarySnapshot, snapshot_path, load_snapshot, save_snapshot
+from ..services.library_state import hydrate_rows, load_all_state, resolve_cover_path, title_sort_key
+from ..services import env_probe
+from .. import startup
 
+# The launcher, sync/scanner, index cache and helper-process code are imported
+# inside the methods that use them: none of it is needed before the first frame.
 
 
-PLACEHOLDER = PROJECT_ROOT / "src" / "superconsole" / "ui" / "assets" / "default_cover.png"
+PLACEHOLDER = PLACEHOLDER_COVER
+FRAME_TRACE_DIR = PROJECT_ROOT / "data" / "logs"
+STARTUP_LOG = FRAME_TRACE_DIR / "startup.jsonl"
+_KEY_NAMES = {code: name for name, code in Keyboard.keycodes.items()}
+PREFETCH_COVERS = 15  # roughly one screen of cards (5 columns x 3 rows)
 
 
 class SuperConsoleApp(App):
@@ -51,7 +59,7 @@ class SuperConsoleApp(App):
         super().__init__(**kwargs)
         self.state = state
         self.sm = ScreenManager(transition=FadeTransition())
-        self.db_path = PROJECT_ROOT / "data" / "db" / "superconsole.sqlite3"
+        self.db_path = DB_PATH
         self.db = connect(self.db_path)
         init_db(self.db)
         self._scan_log_event = None
@@ -61,52 +69,15 @@ class SuperConsoleApp(App):
         self._hotkey_proc = None
         self._exit_popup = None
         self._platform_cache = {}
-
-    def _hydrate_rows(self, rows, updates: dict[int, str]) -> list[dict[str, str]]:
-        games = []
-        for r in rows:
-            cover_path = r["cover_path"]
-            if not cover_path:
-                cover = find_cover(
-                    r["platform"],
-                    Path(r["game_dir"]).name,
-                    IMAGES_DIR,
-                    PLACEHOLDER,
-                )
-                cover_path = self._resolve_cover_path(str(cover))
-                updates[r["id"]] = cover_path
-            else:
-                cover_path = self._resolve_cover_path(cover_path)
-            games.append({
-                "id": r["id"],
-                "title": r["title"],
-                "cover_path": cover_path,
-                "platform": r["platform"],
-                "launch_target": r["launch_target"],
-                "launch_type": r["launch_type"],
-                "favorite": r["favorite"],
-                "last_played": r["last_played"],
-                "date_added": r["date_added"],
-            })
-        return games
-
-    def _load_all_state(self, con):
-        updates: dict[int, str] = {}
-        rows = list_games(con)
-        games = self._hydrate_rows(rows, updates)
-        platforms = list_platforms(con)
-        favorites = self._hydrate_rows(list_favorites(con), updates)
-        recent_played = self._hydrate_rows(list_recently_played(con), updates)
-        recent_added = self._hydrate_rows(list_recently_added(con), updates)
-        platform_games = {}
-        for platform in platforms:
-            platform_games[platform] = self._hydrate_rows(list_games(con, platform=platform), updates)
-
-        if updates:
-            update_cover_paths(con, [(gid, path) for gid, path in updates.items()])
-
-        return len(rows), games, platforms, favorites, recent_played, recent_added, platform_games
-
+        self._platform_loads: set[str] = set()
+        self._warmed_platforms: set[str] = set()
+        self._snapshot_path = snapshot_path(PROJECT_ROOT)
+        self._snapshot: LibrarySnapshot | None = None  # the one applied at startup, if any
+        self._game_mode = GameRunningMode()
+        self._game_mode_left_window = False
+        self._session = None  # supervisor Session for the running emulator
+
+    @frame_monitor.timed("_apply_db_state")
     def _apply_db_state(
         self,
         count: int,
@@ -129,11 +100,94 @@ class SuperConsoleApp(App):
             set_status(self.state, "First run: building library...")
             self._rescan_to_db()
 
+    def _load_and_snapshot(self, con, write_in_background: bool = False):
+        """Full DB load; writes a fresh snapshot tagged with the generation it reflects."""
+        generation = library_generation(con)
+        loaded = load_all_state(con)
+        # _load_all_state may persist resolved cover paths (one bump); anything beyond
+        # that means another writer raced us and the snapshot would be mislabelled.
+        after = library_generation(con)
+        if after - generation <= 1:
+            if write_in_background:
+                threading.Thread(target=self._write_snapshot, args=(after, loaded), daemon=True).start()
+            else:
+                self._write_snapshot(after, loaded)
+        return loaded
+
+    def _write_snapshot(self, generation: int, loaded) -> None:
+        count, games, platforms, favorites, recent_played, recent_added, platform_games = loaded
+        try:
+            save_snapshot(self._snapshot_path, LibrarySnapshot(
+                generation=generation,
+                images_root=str(IMAGES_DIR),
+                count=count,
+                games=games,
+                platforms=platforms,
+                favorites=favorites,
+                recent_played=recent_played,
+                recent_added=recent_added,
+                platform_games=platform_games,
+            ))
+        except Exception:
+            logging.getLogger(__name__).warning("Failed to write library snapshot", exc_info=True)
+
+    def _apply_snapshot(self) -> int | None:
+        """
+        Applies the on-disk snapshot if it matches the DB generation.
+        Runs on the main thread before the first frame; returns the generation
+        it applied, or None if the caller has to load from the DB.
+        """
+        log = logging.getLogger(__name__)
+        try:
+            generation = library_generation(self.db)
+        except Exception:
+            return None
+        snap = load_snapshot(self._snapshot_path, generation, IMAGES_DIR)
+        if snap is None or snap.count == 0:
+            return None
+        self._apply_db_state(
+            snap.count, snap.games, snap.platforms, snap.favorites,
+            snap.recent_played, snap.recent_added, snap.platform_games,
+        )
+        log.info("Applied library snapshot (%d ROMs, generation %d)", snap.count, generation)
+        self._snapshot = snap
+        return generation
+
+    def _refresh_home_lists(self, con) -> tuple[list[dict], list[dict]] | None:
+        """
+        Worker-thread check of the two lists play/favorite bookkeeping changes
+        (those writes don't bump the generation). Returns (favorites,
+        recent_played) when they differ from the applied snapshot, after
+        rewriting the snapshot with them; None when it is still exact.
+        """
+        snap = self._snapshot
+        if snap is None:
+            return None
+        updates: dict[int, str] = {}
+        favorites = hydrate_rows(list_favorites(con), updates)
+        recent_played = hydrate_rows(list_recently_played(con), updates)
+        if updates:
+            update_cover_paths(con, [(gid, path) for gid, path in updates.items()])
+        if favorites == snap.favorites and recent_played == snap.recent_played and not updates:
+            return None
+        self._write_snapshot(library_generation(con), (
+            snap.count, snap.games, snap.platforms, favorites, recent_played,
+            snap.recent_added, snap.platform_games,
+        ))
+        return favorites, recent_played
+
     def _load_from_db(self):
-        count, games, platforms, favorites, recent_played, recent_added, platform_games = self._load_all_state(self.db)
+        count, games, platforms, favorites, recent_played, recent_added, platform_games = self._load_and_snapshot(
+            self.db, write_in_background=True,
+        )
         self._apply_db_state(count, games, platforms, favorites, recent_played, recent_added, platform_games)
 
-    def _load_from_db_async(self):
+    def _load_from_db_async(self, known_generation: int | None = None):
+        """
+        Loads the library off the main thread. With `known_generation` (a snapshot
+        was already applied) this only revalidates: if the DB hasn't changed since,
+        only the favorites and recently played lists are re-read.
+        """
         log = logging.getLogger(__name__)
 
         def worker():
@@ -141,13 +195,26 @@ class SuperConsoleApp(App):
             init_db(con)
             error = None
             try:
-                count, games, platforms, favorites, recent_played, recent_added, platform_games = self._load_all_state(con)
+                if known_generation is not None and library_generation(con) == known_generation:
+                    log.info("Library snapshot is current; skipping DB reload")
+                    try:
+                        lists = self._refresh_home_lists(con)
+                    except Exception:
+                        log.exception("Failed to refresh favorites / recently played")
+                        lists = None
+                    if lists is not None:
+                        def apply_lists(_dt):
+                            self.state.favorites, self.state.recent_played = lists
+                        Clock.schedule_once(apply_lists, 0)
+                    return
+                count, games, platforms, favorites, recent_played, recent_added, platform_games = self._load_and_snapshot(con)
             except Exception as exc:
                 error = exc
                 count, games, platforms, favorites, recent_played, recent_added, platform_games = 0, [], [], [], [], [], {}
             finally:
                 con.close()
 
+            @frame_monitor.timed("apply:db_load")
             def apply(_dt):
                 if error:
                     log.exception("Failed to load DB", exc_info=error)
@@ -156,6 +223,7 @@ class SuperConsoleApp(App):
                     self._apply_db_state(count, games, platforms, favorites, recent_played, recent_added, platform_games)
                 if self._startup_overlay:
                     self._startup_overlay.hide()
+                self._mark_library_visible()
 
             Clock.schedule_once(apply, 0)
 
@@ -164,7 +232,7 @@ class SuperConsoleApp(App):
 
 
     def build(self):
-        Window.title = "SuperConsole (Ubuntu)" if is_wsl() else "SuperConsole"
+        startup.mark("window")
         self.sm.add_widget(HomeScreen(self.state, on_rescan=self._rescan_to_db, name="home"))
         self.sm.add_widget(LibraryScreen(self.state, name="platform"))
 
@@ -174,12 +242,25 @@ class SuperConsoleApp(App):
         self.state.bind(route=self._on_route)
         Window.bind(on_key_down=self._on_key_down)
         Window.bind(on_request_close=self._on_request_close)
-
-        # Show startup overlay and load DB in background
-        self._startup_overlay = LoadingOverlay(text="Loading library...")
-        Clock.schedule_once(lambda *_: self._startup_overlay.show(), 0)
-        Clock.schedule_once(lambda *_: self._load_from_db_async(), 0)
-        Clock.schedule_once(lambda *_: self._start_hotkey_helper(), 0)
+        frame_monitor.start()  # F3 toggles the overlay, F4 dumps a trace
+
+        # Apply the library snapshot before the first frame if it is still current,
+        # then revalidate against the DB in the background. Without a usable
+        # snapshot, show the startup overlay and do the full load.
+        generation = self._apply_snapshot()
+        if generation is not None:
+            Clock.schedule_once(lambda *_: self._load_from_db_async(known_generation=generation), 0)
+        else:
+            self._startup_overlay = LoadingOverlay(text="Loading library...")
+            Clock.schedule_once(lambda *_: self._startup_overlay.show(), 0)
+            Clock.schedule_once(lambda *_: self._load_from_db_async(), 0)
+        Clock.schedule_once(lambda *_: self._set_window_title(), 0)
+        # Give the first frames the disk before staging copies start.
+        Clock.schedule_once(lambda *_: self._prefetch_staging(), 10)
+        # The hotkey helper needs the AutoHotkey path, so it starts once the probe is done.
+        env_probe.start_background_probe(on_done=lambda _facts: self._start_hotkey_helper())
+        Window.bind(on_flip=self._on_first_flip)
+        Window.bind(focus=self._on_window_focus)
         Clock.schedule_once(lambda *_: self._maximize_window(), 0)
 
         # Do NOT auto-rescan on every startup
@@ -187,6 +268,37 @@ class SuperConsoleApp(App):
         log.info("Screens registered: %s", list(self.sm.screen_names))
         return self.sm
 
+    def _set_window_title(self) -> None:
+        from ..services.wsl_paths import is_wsl
+        Window.title = "SuperConsole (Ubuntu)" if is_wsl() else "SuperConsole"
+
+    def _on_first_flip(self, *_):
+        Window.unbind(on_flip=self._on_first_flip)
+        startup.mark("first_frame")
+        if self.state.rom_count:
+            # snapshot already applied in build(): the library was on that first frame
+            startup.mark("library_visible")
+            startup.finish(STARTUP_LOG)
+
+    def _on_window_focus(self, _window, focused: bool) -> None:
+        # Only for untracked launches (WSL without PowerShell); otherwise the
+        # supervisor reports the exit.
+        if not self._game_mode.active or self._session is not None:
+            return
+        if not focused:
+            self._game_mode_left_window = True
+        elif self._game_mode_left_window:
+            self._game_mode.leave()
+            self._prefetch_staging()  # the untracked game is taken to be over
+
+    def _mark_library_visible(self) -> None:
+        def _on_flip(*_):
+            Window.unbind(on_flip=_on_flip)
+            startup.mark("library_visible")
+            startup.finish(STARTUP_LOG)
+        Window.bind(on_flip=_on_flip)
+
+    @frame_monitor.timed("_on_route")
     def _on_route(self, *_):
         route = self.state.route
         if route.startswith("platform:"):
@@ -222,7 +334,7 @@ class SuperConsoleApp(App):
                 cover_path = str(cover)
             games.append({
                 "title": item.get("title", ""),
-                "cover_path": self._resolve_cover_path(cover_path),
+                "cover_path": resolve_cover_path(cover_path),
                 "platform": item.get("platform", ""),
                 "launch_target": item.get("launch_target", ""),
                 "launch_type": "dir" if item.get("launch_is_dir") else "file",
@@ -257,6 +369,7 @@ class SuperConsoleApp(App):
         self._start_scan_log_timer(log, t0)
 
         def worker():
+            from ..services.rom_scanner import scan_roms, ScanConfig
             cfg = ScanConfig(
                 roms_root=ROMS_DIR,
                 images_root=IMAGES_DIR,
@@ -271,6 +384,7 @@ class SuperConsoleApp(App):
             except Exception as e:
                 log.warning("Failed to save cache: %s", e)
 
+            @frame_monitor.timed("apply:rom_scan")
             def apply(_dt):
                 self.state.roms = [
                     {
@@ -294,17 +408,15 @@ class SuperConsoleApp(App):
 
         threading.Thread(target=worker, daemon=True).start()
 
-    def _resolve_cover_path(self, cover_path: str | None) -> str:
-        if not cover_path:
-            return str(PLACEHOLDER)
-        p = Path(cover_path)
-        if not p.is_absolute():
-            return str(IMAGES_DIR / p)
-        return str(p)
-
+    @frame_monitor.timed("launch_game")
     def launch_game(self, game: dict[str, str]) -> None:
-        import logging
+        from ..services.game_launcher import launch_game, is_wsl, get_emulator_exe, exit_is_observable
+        from ..services.emulator_supervisor import supervisor
+        from ..services.launch_timing import LaunchTiming
         log = logging.getLogger(__name__)
+        timing = LaunchTiming(game["platform"], game.get("id"))
+        # Usually already under way from the hover; a no-op then.
+        self.readahead_game(game)
         try:
             if not is_wsl() and hasattr(Window, "minimize"):
                 Window.minimize()
@@ -313,49 +425,176 @@ class SuperConsoleApp(App):
                 try:
                     mark_played(self.db, game["id"])
                     updates: dict[int, str] = {}
-                    recent_played = self._hydrate_rows(list_recently_played(self.db), updates)
+                    recent_played = hydrate_rows(list_recently_played(self.db), updates)
                     if updates:
                         update_cover_paths(self.db, [(gid, path) for gid, path in updates.items()])
                     self.state.recent_played = recent_played
                 except Exception:
                     log.exception("Failed to mark played: %s", game.get("title", ""))
-            proc = launch_game(game["platform"], game["launch_target"])
+            timing.mark("mark_played")
+            proc = launch_game(
+                game["platform"], game["launch_target"],
+                timing=timing, archive_member=game.get("archive_member"),
+            )
             self._emulator_proc = proc
-            if not is_wsl() and proc is not None:
-                def _restore(_dt):
-                    try:
-                        if hasattr(Window, "restore"):
-                            Window.restore()
-                        if hasattr(Window, "raise_window"):
-                            Window.raise_window()
-                    except Exception:
-                        pass
+            self._game_mode.enter()
+            if exit_is_observable(proc):
+                self._session = supervisor.track(
+                    proc,
+                    game["platform"],
+                    game_id=game.get("id"),
+                    title=game.get("title", ""),
+                    exe_name=self._emulator_exe.name,
+                    on_exit=lambda session: Clock.schedule_once(lambda _dt: self._on_emulator_exit(session), 0),
+                    timing=timing,
+                )
+            else:
+                # cmd.exe start returns immediately, so there is no process to wait
+                # on; coming back to the launcher window ends game mode instead.
+                self._session = None
+                self._game_mode_left_window = False
+                self._record_launch_stats([timing.row()])
+        except Exception:
+            log.exception("Failed to launch game: %s", game.get("title", ""))
 
-                def _wait():
-                    try:
-                        proc.wait()
-                    finally:
-                        Clock.schedule_once(_restore, 0)
+    def readahead_game(self, game: dict[str, str]) -> None:
+        """Card focused or pressed: start pulling its ROM into the OS cache."""
+        from ..services.readahead import readahead
+        try:
+            readahead.request(game["launch_target"], game.get("archive_member"))
+        except Exception:
+            logging.getLogger(__name__).debug("Read-ahead request failed", exc_info=True)
+
+    def _on_emulator_exit(self, session) -> None:
+        if session is self._session:
+            self._session = None
+            self._emulator_proc = None
+            self._game_mode.leave()
+            self._restore_window()
+        self._flush_play_sessions()
+        self._prefetch_staging()
+
+    def _prefetch_staging(self) -> None:
+        from ..services.staging import staging_cache
+        cache = staging_cache()
+        # Untracked WSL launches have no session, but game mode is on while they run.
+        if cache is None or self._session is not None or self._game_mode.active:
+            return
+
+        def worker():
+            try:
+                cache.prefetch(self.db_path)
+            except Exception:
+                logging.getLogger(__name__).exception("Staging prefetch failed")
+
+        threading.Thread(target=worker, daemon=True).start()
 
-                threading.Thread(target=_wait, daemon=True).start()
+    def _flush_play_sessions(self) -> None:
+        from ..services.emulator_supervisor import supervisor
+        finished = supervisor.drain_finished()
+        if not finished:
+            return
+        try:
+            record_play_sessions(self.db, [
+                {
+                    "game_id": s.game_id,
+                    "platform": s.platform,
+                    "started_at": s.started_at,
+                    "ended_at": s.ended_at,
+                    "seconds": int(s.seconds),
+                    "exit_code": s.exit_code,
+                }
+                for s in finished
+            ])
         except Exception:
-            log.exception("Failed to launch game: %s", game.get("title", ""))
+            logging.getLogger(__name__).exception("Failed to record play sessions")
+        self._record_launch_stats([
+            s.timing.row(s.first_event_at, s.first_event) for s in finished if s.timing is not None
+        ])
+
+    def _record_launch_stats(self, rows: list[dict]) -> None:
+        try:
+            record_launch_stats(self.db, rows)
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to record launch stats")
+
+    def _restore_window(self) -> None:
+        try:
+            if hasattr(Window, "restore"):
+                Window.restore()
+            if hasattr(Window, "raise_window"):
+                Window.raise_window()
+        except Exception:
+            pass
 
+    @frame_monitor.timed("_load_platform_games")
     def _load_platform_games(self, platform: str) -> None:
+        cached = self._platform_cache.get(platform)
+        if cached is not None:
+            self.state.games_loading = False
+            self.state.current_games = cached
+            return
+
+        # Cold platform: show the skeleton grid now, fill it in when the loader is done.
+        self.state.current_games = []
+        self.state.games_loading = True
+        self._fetch_platform_async(platform)
+
+    def prefetch_platform(self, platform: str) -> None:
+        """Called when a platform's nav button is hovered: load its page and warm its first covers."""
         if platform in self._platform_cache:
-            self.state.current_games = self._platform_cache[platform]
+            if platform not in self._warmed_platforms:
+                self._warmed_platforms.add(platform)
+                covers = [g["cover_path"] for g in self._platform_cache[platform][:PREFETCH_COVERS]]
+                threading.Thread(target=warm_covers, args=(covers,), daemon=True).start()
             return
+        self._fetch_platform_async(platform)
 
-        updates: dict[int, str] = {}
-        rows = list_games(self.db, platform=platform)
-        games = self._hydrate_rows(rows, updates)
-        if updates:
-            update_cover_paths(self.db, [(gid, path) for gid, path in updates.items()])
-        self._platform_cache[platform] = games
-        self.state.current_games = games
+    def _fetch_platform_async(self, platform: str) -> None:
+        if platform in self._platform_loads:
+            return  # already in flight; its apply() picks up whoever is waiting
+        self._platform_loads.add(platform)
+        log = logging.getLogger(__name__)
+
+        def worker():
+            games = None
+            con = connect(self.db_path)
+            try:
+                updates: dict[int, str] = {}
+                games = hydrate_rows(list_games(con, platform=platform), updates)
+                if updates:
+                    update_cover_paths(con, [(gid, path) for gid, path in updates.items()])
+            except Exception:
+                log.exception("Failed to load platform: %s", platform)
+            finally:
+                con.close()
+
+            @frame_monitor.timed("apply:platform_load")
+            def apply(_dt):
+                self._platform_loads.discard(platform)
+                if games is not None:
+                    self._platform_cache[platform] = games
+                if self.state.current_platform == platform and self.state.games_loading:
+                    self.state.current_games = games or []
+                    self.state.games_loading = False
+
+            Clock.schedule_once(apply, 0)
+
+            # first screen of thumbnails, after the page data is on its way
+            if games:
+                self._warmed_platforms.add(platform)
+                warm_covers([g["cover_path"] for g in games[:PREFETCH_COVERS]])
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def _on_key_down(self, _window, keycode, _scancode, _codepoint, modifiers):
-        key_name = keycode[1] if isinstance(keycode, tuple) else keycode
+        key_name = keycode[1] if isinstance(keycode, tuple) else _KEY_NAMES.get(keycode, keycode)
+        if key_name == "f3":
+            frame_monitor.toggle_overlay()
+            return True
+        if key_name == "f4":
+            self._dump_frame_trace()
+            return True
         if key_name in {"escape", "esc"}:
             self._confirm_exit()
             return True
@@ -367,6 +606,7 @@ class SuperConsoleApp(App):
     def _confirm_exit(self) -> None:
         if self._exit_popup and self._exit_popup.parent:
             return
+        from kivy.uix.popup import Popup
         content = BoxLayout(orientation="vertical", padding=12, spacing=10)
         apply_bg(content, COLORS["panel"])
         content.add_widget(Label(text="Are you sure you want to exit?", color=(1, 1, 1, 1)))
@@ -404,20 +644,38 @@ class SuperConsoleApp(App):
         self._exit_popup = popup
         popup.open()
 
+    def _dump_frame_trace(self) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        try:
+            frame_monitor.dump(FRAME_TRACE_DIR / f"frame_trace-{stamp}.json")
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to write frame trace")
+
+    def on_stop(self):
+        self._flush_play_sessions()
+        # Keep the numbers from a session where someone was looking at the overlay.
+        if frame_monitor.overlay_used:
+            self._dump_frame_trace()
+
     def _on_request_close(self, *_args, **_kwargs):
         self._confirm_exit()
         return True
 
     def _terminate_emulator(self) -> None:
-        import logging
         import subprocess
+        from ..services.wsl_paths import is_wsl
+        from ..services.emulator_supervisor import supervisor
 
         log = logging.getLogger(__name__)
         if not self._emulator_exe:
             return
 
-        exe_name = self._emulator_exe.name
+        # Tracked launches are killed by PID; the exit callback then restores
+        # the window. Blanket taskkill /IM is only for untracked WSL launches.
+        if self._session is not None and supervisor.terminate(self._session):
+            return
 
+        exe_name = self._emulator_exe.name
         if is_wsl():
             try:
                 subprocess.Popen(["cmd.exe", "/c", "taskkill", "/IM", exe_name, "/F"])
@@ -435,17 +693,12 @@ class SuperConsoleApp(App):
                 pass
 
         self._emulator_proc = None
-
-        try:
-            if hasattr(Window, "restore"):
-                Window.restore()
-            if hasattr(Window, "raise_window"):
-                Window.raise_window()
-        except Exception:
-            pass
+        self._game_mode.leave()
+        self._restore_window()
 
     def _start_hotkey_helper(self) -> None:
-        import logging
+        import subprocess
+        from ..services.wsl_paths import is_wsl
         log = logging.getLogger(__name__)
         script = PROJECT_ROOT / "scripts" / "superconsole_hotkeys.ahk"
         if not script.exists():
@@ -459,14 +712,7 @@ class SuperConsoleApp(App):
                 return
             try:
                 log.info("Running AutoHotkey script...")
-                check = subprocess.run(
-                    ["cmd.exe", "/c", "where", "AutoHotkey.exe"],
-                    capture_output=True,
-                    text=True,
-                )
-                ahk_exe = "AutoHotkey.exe"
-                if check.returncode != 0:
-                    ahk_exe = r"C:\Program Files\AutoHotkey\v2\AutoHotkey.exe"
+                ahk_exe = env_probe.facts().autohotkey
                 self._hotkey_proc = subprocess.Popen(
                     ["cmd.exe", "/c", "start", "", ahk_exe, script_win]
                 )
@@ -475,11 +721,7 @@ class SuperConsoleApp(App):
                 log.exception("Failed to start AutoHotkey helper from WSL.")
             return
 
-        exe = (
-            shutil.which("AutoHotkey.exe")
-            or shutil.which("AutoHotkey")
-            or r"C:\Program Files\AutoHotkey\v2\AutoHotkey.exe"
-        )
+        exe = env_probe.facts().autohotkey
         if not exe:
             log.warning("AutoHotkey.exe not found on PATH.")
             return
@@ -491,16 +733,10 @@ class SuperConsoleApp(App):
             log.exception("Failed to start AutoHotkey helper.")
 
     def _wsl_to_windows_path(self, path: Path) -> str | None:
-        try:
-            result = subprocess.run(
-                ["wslpath", "-w", str(path)],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return result.stdout.strip()
-        except Exception:
-            return None
+        from ..services.wsl_paths import to_windows_path
+        converted = to_windows_path(path)
+        # to_windows_path hands the input back when nothing could translate it
+        return None if converted.startswith("/") else converted
 
     def _maximize_window(self) -> None:
         try:
@@ -518,8 +754,12 @@ class SuperConsoleApp(App):
         log = logging.getLogger(__name__)
         t0 = time.time()
         self._start_scan_log_timer(log, t0)
+        # The cache belongs to the main thread; the worker patches a copy.
+        platform_cache = dict(self._platform_cache)
 
         def worker():
+            from ..services.rom_scanner import ScanConfig
+            from ..services.library_sync import sync_library
             cfg = ScanConfig(
                 roms_root=ROMS_DIR,
                 images_root=IMAGES_DIR,
@@ -527,24 +767,97 @@ class SuperConsoleApp(App):
             )
             con = connect(self.db_path)
             init_db(con)
+            patch = None
             try:
-                count = sync_library(con, cfg)
+                changes = sync_library(con, cfg)
+                if not changes.empty:
+                    patch = self._prepare_changes(con, changes, platform_cache)
             finally:
                 con.close()
 
+            @frame_monitor.timed("apply:rescan")
             def apply(_dt):
                 self.state.scan_in_progress = False
-                self._load_from_db()
+                if patch is not None:
+                    self._apply_changes(patch)
                 self._stop_scan_log_timer()
                 elapsed = time.time() - t0
                 log.info("Rescanning roms....%.1fs", elapsed)
-                log.info("Scan Complete")
-                set_status(self.state, f"Ready ({count} ROMs)")
+                log.info(
+                    "Scan Complete (+%d ~%d -%d)",
+                    len(changes.added), len(changes.updated), len(changes.removed),
+                )
+                set_status(self.state, f"Ready ({changes.count} ROMs)")
 
             Clock.schedule_once(apply, 0)
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _prepare_changes(self, con, changes, old_cache: dict[str, list[dict]]) -> dict:
+        """
+        Worker-thread half of applying a sync: hydrates only the changed rows and
+        builds patched copies of the library views, so the main thread just swaps
+        references in _apply_changes. `old_cache` is a copy of _platform_cache
+        taken on the main thread; platforms missing from it are loaded whole.
+        """
+        updates: dict[int, str] = {}
+        changed = hydrate_rows(list_games_by_ids(con, changes.added + changes.updated), updates)
+        platforms = list_platforms(con)
+        favorites = hydrate_rows(list_favorites(con), updates)
+        recent_played = hydrate_rows(list_recently_played(con), updates)
+        recent_added = hydrate_rows(list_recently_added(con), updates)
+
+        dropped = set(changes.removed) | set(changes.updated)
+        changed_by_platform: dict[str, list[dict]] = {}
+        for game in changed:
+            changed_by_platform.setdefault(game["platform"], []).append(game)
+
+        # Only platforms that lost or gained rows get a new list; the rest keep theirs.
+        platform_games: dict[str, list[dict]] = {}
+        for platform in platforms:
+            old = old_cache.get(platform)
+            if old is None:
+                # Never loaded (or the load failed): patching [] would list only the changes.
+                platform_games[platform] = hydrate_rows(list_games(con, platform=platform), updates)
+                continue
+            new = changed_by_platform.get(platform, [])
+            if not new and not any(g.get("id") in dropped for g in old):
+                platform_games[platform] = old
+                continue
+            kept = [g for g in old if g.get("id") not in dropped]
+            platform_games[platform] = sorted(kept + new, key=title_sort_key)
+        if updates:
+            update_cover_paths(con, [(gid, path) for gid, path in updates.items()])
+
+        games = sorted(
+            (g for rows in platform_games.values() for g in rows),
+            key=title_sort_key,
+        )
+        loaded = (len(games), games, platforms, favorites, recent_played, recent_added, platform_games)
+        self._write_snapshot(library_generation(con), loaded)
+        return {
+            "loaded": loaded,
+            "changed_platforms": {
+                p for p in platform_games if platform_games[p] is not old_cache.get(p)
+            } | (set(old_cache) - set(platform_games)),
+        }
+
+    @frame_monitor.timed("_apply_changes")
+    def _apply_changes(self, patch: dict) -> None:
+        count, games, platforms, favorites, recent_played, recent_added, platform_games = patch["loaded"]
+        self.state.rom_count = count
+        self.state.roms = games
+        # ListProperty only dispatches when the value differs, so unchanged home
+        # lists and an unchanged nav bar are left alone.
+        self.state.platforms = platforms
+        self.state.favorites = favorites
+        self.state.recent_played = recent_played
+        self.state.recent_added = recent_added
+        self._platform_cache = platform_games
+        current = self.state.current_platform
+        if current and current in patch["changed_platforms"]:
+            self.state.current_games = platform_games.get(current, [])
+
     def _start_scan_log_timer(self, log, start_time: float) -> None:
         def _tick(_dt):
             elapsed = time.time() - start_time
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.label import Label
+
+
+log = logging.getLogger(__name__)
+
+STALL_MS = float(os.environ.get("SUPERCONSOLE_STALL_MS", "50"))  # frames slower than this are stalls
+HISTORY_FRAMES = 1200  # ~20 s at 60 fps
+MAX_STALLS = 500
+
+
+class FrameMonitor:
+    """
+    Records frame times from the Kivy Clock and attributes slow frames to the
+    main-thread section (rebuild, loader callback, ...) that ran longest in them.
+
+    Sections are marked with `section(name)` / `timed(name)`; outside the main
+    thread they are ignored, since only main-thread work stalls frames.
+    """
+
+    def __init__(self, stall_ms: float = STALL_MS):
+        self.stall_ms = stall_ms
+        self.frames: deque[tuple[float, float]] = deque(maxlen=HISTORY_FRAMES)  # (start s, ms)
+        self.stalls: deque[dict] = deque(maxlen=MAX_STALLS)
+        self._sections: deque[tuple[str, float, float]] = deque(maxlen=HISTORY_FRAMES * 4)  # (name, start s, ms)
+        self._frame_sections: list[tuple[str, float]] = []
+        self._main_ident = threading.main_thread().ident
+        self._origin = time.perf_counter()
+        self._last: float | None = None
+        self._event = None
+        self._suspended = False
+        self._overlay: Label | None = None
+        self._overlay_place = None
+        self._overlay_refresh = 0.0
+        self.overlay_used = False
+
+    # --- recording ---
+
+    def start(self) -> None:
+        if self._event is None:
+            self._event = Clock.schedule_interval(self._on_frame, 0)
+
+    def stop(self) -> None:
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+            self._last = None
+            self._frame_sections.clear()
+
+    def suspend(self) -> None:
+        """Stops recording until resume(), if it was recording at all."""
+        if self._event is not None:
+            self._suspended = True
+            self.stop()
+
+    def resume(self) -> None:
+        if self._suspended:
+            self._suspended = False
+            self.start()
+
+    def _on_frame(self, _dt) -> None:
+        now = time.perf_counter()
+        if self._last is None:
+            self._last = now
+            return
+        frame_ms = (now - self._last) * 1000.0
+        self.frames.append((self._last - self._origin, frame_ms))
+
+        if frame_ms >= self.stall_ms:
+            cause, cause_ms = ("(unattributed)", 0.0)
+            if self._frame_sections:
+                cause, cause_ms = max(self._frame_sections, key=lambda s: s[1])
+            self.stalls.append({
+                "t": round(self._last - self._origin, 3),
+                "frame_ms": round(frame_ms, 1),
+                "cause": cause,
+                "cause_ms": round(cause_ms, 1),
+            })
+            log.debug("UI stall %.1f ms (%s %.1f ms)", frame_ms, cause, cause_ms)
+
+        self._frame_sections.clear()
+        self._last = now
+        if self._overlay is not None and now - self._overlay_refresh > 0.25:
+            self._overlay_refresh = now
+            self._overlay.text = self.summary()
+
+    @contextmanager
+    def section(self, name: str):
+        if threading.get_ident() != self._main_ident:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - t0) * 1000.0
+            self._frame_sections.append((name, ms))
+            self._sections.append((name, t0 - self._origin, ms))
+
+    def timed(self, name: str):
+        """Decorator form of section()."""
+        def deco(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.section(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return deco
+
+    # --- reporting ---
+
+    def summary(self) -> str:
+        times = sorted(ms for _t, ms in self.frames)
+        if not times:
+            return "no frames yet"
+        avg = sum(times) / len(times)
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        lines = [
+            f"{1000.0 / avg:5.1f} fps  avg {avg:5.1f} ms  p95 {p95:5.1f} ms  max {times[-1]:6.1f} ms",
+            f"stalls >= {self.stall_ms:.0f} ms: {len(self.stalls)}",
+        ]
+        for stall in list(self.stalls)[-3:]:
+            lines.append(f"  {stall['frame_ms']:6.1f} ms  {stall['cause']} ({stall['cause_ms']:.1f} ms)")
+        return "\n".join(lines)
+
+    def toggle_overlay(self) -> None:
+        if self._overlay is not None:
+            Window.unbind(size=self._overlay_place)
+            Window.remove_widget(self._overlay)
+            self._overlay = None
+            self._overlay_place = None
+            return
+        # widgets.py imports this module, so the overlay styles itself
+        overlay = Label(
+            text=self.summary(),
+            color=(1, 1, 1, 1),
+            font_size="12sp",
+            size_hint=(None, None),
+            size=(460, 96),
+            halign="left",
+            valign="top",
+            padding=(8, 6),
+        )
+        overlay.bind(size=overlay.setter("text_size"))
+        with overlay.canvas.before:
+            Color(0, 0, 0, 0.7)
+            bg = Rectangle(pos=overlay.pos, size=overlay.size)
+
+        def _place(*_):
+            overlay.pos = (8, Window.height - overlay.height - 8)
+            bg.pos = overlay.pos
+
+        Window.bind(size=_place)
+        _place()
+        Window.add_widget(overlay)
+        self._overlay = overlay
+        self._overlay_place = _place
+        self.overlay_used = True
+
+    def dump(self, path: Path) -> Path:
+        """Writes frames, sections and stalls as a Chrome trace (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        tid = self._main_ident or 0
+        events = [
+            {"name": "frame", "cat": "frame", "ph": "X", "pid": pid, "tid": tid,
+             "ts": round(t * 1e6), "dur": round(ms * 1000)}
+            for t, ms in self.frames
+        ]
+        events += [
+            {"name": name, "cat": "ui", "ph": "X", "pid": pid, "tid": tid,
+             "ts": round(t * 1e6), "dur": round(ms * 1000)}
+            for name, t, ms in self._sections
+        ]
+        events += [
+            {"name": "stall", "cat": "stall", "ph": "i", "s": "t", "pid": pid, "tid": tid,
+             "ts": round(stall["t"] * 1e6), "args": stall}
+            for stall in self.stalls
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+        log.info("Frame trace written: %s (%d frames, %d stalls)", path, len(self.frames), len(self.stalls))
+        return path
+
+
+frame_monitor = FrameMonitor()
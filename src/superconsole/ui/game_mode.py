@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+import os
+
+from kivy.cache import Cache
+from kivy.clock import Clock
+
+from .frame_monitor import frame_monitor
+from .widgets import LoadingSpinner, hover_tracker
+
+# "Game running" mode: while an emulator is up, the launcher should cost as
+# little CPU/GPU as possible. Entered from launch_game, left when the emulator
+# exits (or the user comes back to the launcher window).
+
+log = logging.getLogger(__name__)
+
+IDLE_FPS = float(os.environ.get("SUPERCONSOLE_IDLE_FPS", "5"))
+RELEASE_TEXTURES = os.environ.get("SUPERCONSOLE_RELEASE_TEXTURES", "0") == "1"
+# On by default only on Windows: an unprivileged POSIX process can raise its nice
+# value but usually not lower it again, and then it would stay lowered all session.
+LOWER_PRIORITY = os.environ.get("SUPERCONSOLE_LOWER_PRIORITY", "1" if os.name == "nt" else "0") == "1"
+
+_BELOW_NORMAL_PRIORITY_CLASS = 0x4000
+_POSIX_NICE_STEP = 10
+
+
+def _can_restore_nice(previous: int) -> bool:
+    # RLIMIT_NICE caps how low the nice value may be set: 20 - soft limit.
+    if os.geteuid() == 0:
+        return True
+    import resource
+    soft, _hard = resource.getrlimit(resource.RLIMIT_NICE)
+    return soft == resource.RLIM_INFINITY or 20 - soft <= previous
+
+
+def _lower_priority():
+    """Lowers this process's priority; returns what _restore_priority needs, or None."""
+    try:
+        if os.name == "nt":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetCurrentProcess()
+            previous = kernel32.GetPriorityClass(handle)
+            if previous and kernel32.SetPriorityClass(handle, _BELOW_NORMAL_PRIORITY_CLASS):
+                return previous
+            return None
+        previous = os.getpriority(os.PRIO_PROCESS, 0)
+        if not _can_restore_nice(previous):
+            log.debug("Not lowering launcher priority: RLIMIT_NICE wouldn't let it back")
+            return None
+        os.setpriority(os.PRIO_PROCESS, 0, min(19, previous + _POSIX_NICE_STEP))
+        return previous
+    except Exception:
+        log.debug("Could not lower launcher priority", exc_info=True)
+        return None
+
+
+def _restore_priority(previous) -> None:
+    if previous is None:
+        return
+    try:
+        if os.name == "nt":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), previous)
+            return
+        os.setpriority(os.PRIO_PROCESS, 0, previous)
+    except PermissionError:
+        # Unprivileged POSIX processes can't raise their priority back (RLIMIT_NICE).
+        log.info("Launcher priority stays lowered (no permission to restore it)")
+    except Exception:
+        log.debug("Could not restore launcher priority", exc_info=True)
+
+
+class GameRunningMode:
+    def __init__(self):
+        self.active = False
+        self._saved_fps = None
+        self._saved_priority = None
+
+    def enter(self) -> None:
+        if self.active:
+            return
+        self.active = True
+
+        # Clock._max_fps is what the Kivy loop sleeps against between frames.
+        if hasattr(Clock, "_max_fps"):
+            self._saved_fps = Clock._max_fps
+            Clock._max_fps = IDLE_FPS
+        LoadingSpinner.pause_all()
+        hover_tracker.suspend()
+        frame_monitor.suspend()  # throttled idle frames aren't stalls
+        if RELEASE_TEXTURES:
+            # Covers reload from disk on demand when the grids redraw.
+            Cache.remove("kv.image")
+            Cache.remove("kv.texture")
+        if LOWER_PRIORITY:
+            self._saved_priority = _lower_priority()
+        log.info("Game running: launcher idling at %.0f fps", IDLE_FPS)
+
+    def leave(self) -> None:
+        if not self.active:
+            return
+        self.active = False
+
+        if self._saved_fps is not None:
+            Clock._max_fps = self._saved_fps
+            self._saved_fps = None
+        frame_monitor.resume()
+        hover_tracker.resume()
+        LoadingSpinner.resume_all()
+        _restore_priority(self._saved_priority)
+        self._saved_priority = None
+        log.info("Game finished: launcher back to full rate")
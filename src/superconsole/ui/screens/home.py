@@ -1,6 +1,7 @@
 from __future__ import annotations
 import logging
 
+from kivy.clock import Clock
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
@@ -8,15 +9,27 @@ from kivy.uix.scrollview import ScrollView
 from kivy.graphics import Color, Line
 
 from ...actions import set_route
+from ..frame_monitor import frame_monitor
 from ..widgets import (
     COLORS,
     apply_bg,
     SectionHeader,
     LoadingOverlay,
     build_game_grid,
+    sync_game_grid,
     HoverButton,
+    nav_button,
+    nav_button_pool,
 )
 
+
+def _section_signature(items) -> tuple:
+    # What a section's cards actually show; other fields don't need a rebuild.
+    return tuple(
+        (g.get("id"), g.get("title"), g.get("cover_path"), g.get("launch_target"))
+        for g in items
+    )
+
 class HomeScreen(Screen):
     def __init__(self, state, on_rescan=None, **kwargs):
         super().__init__(**kwargs)
@@ -24,6 +37,9 @@ class HomeScreen(Screen):
         self.on_rescan = on_rescan
         self.log = logging.getLogger(__name__)
         self.nav_bar = None
+        self._section_widgets = {}   # section name -> (SectionHeader, grid)
+        self._section_signatures = {}
+        self._empty_label = None
 
         root = BoxLayout(orientation="vertical", padding=16, spacing=10)
         apply_bg(root, COLORS["bg"])
@@ -94,9 +110,11 @@ class HomeScreen(Screen):
         self.add_widget(root)
         self.overlay = LoadingOverlay()
 
-        self.state.bind(favorites=self._rebuild_sections)
-        self.state.bind(recent_played=self._rebuild_sections)
-        self.state.bind(recent_added=self._rebuild_sections)
+        # _apply_db_state sets all three lists in a row; coalesce into one rebuild per frame
+        self._rebuild_trigger = Clock.create_trigger(self._rebuild_sections)
+        self.state.bind(favorites=self._rebuild_trigger)
+        self.state.bind(recent_played=self._rebuild_trigger)
+        self.state.bind(recent_added=self._rebuild_trigger)
         self.state.bind(status_text=self._on_status)
         self.state.bind(rom_count=self._on_rom_count)
         self.state.bind(scan_in_progress=self._on_scan_state)
@@ -125,36 +143,47 @@ class HomeScreen(Screen):
         if self.on_rescan:
             self.on_rescan(force=True)
 
+    @frame_monitor.timed("HomeScreen._rebuild_sections")
     def _rebuild_sections(self, *_):
-        self.sections.clear_widgets()
-        favorites = list(self.state.favorites)
-        recent_played = list(self.state.recent_played)
-        recent_added = list(self.state.recent_added)
-
-        if not favorites and not recent_played and not recent_added:
-            empty = Label(
-                text="No games found. Run a scan to build your library.",
-                color=COLORS["muted"],
-                size_hint_y=None,
-                height=24,
+        sections = [
+            (name, items)
+            for name, items in (
+                ("Favorites", list(self.state.favorites)),
+                ("Recently Played", list(self.state.recent_played)),
+                ("Recently Added", list(self.state.recent_added)),
             )
-            self.sections.add_widget(empty)
+            if items
+        ]
+
+        if not sections:
+            if self._empty_label is None:
+                self._empty_label = Label(
+                    text="No games found. Run a scan to build your library.",
+                    color=COLORS["muted"],
+                    size_hint_y=None,
+                    height=24,
+                )
+            self.sections.clear_widgets()
+            self.sections.add_widget(self._empty_label)
             return
 
-        if favorites:
-            fav_header = SectionHeader("Favorites")
-            self.sections.add_widget(fav_header)
-            self.sections.add_widget(build_game_grid(favorites, on_select=self._on_game_press))
-
-        if recent_played:
-            played_header = SectionHeader("Recently Played")
-            self.sections.add_widget(played_header)
-            self.sections.add_widget(build_game_grid(recent_played, on_select=self._on_game_press))
-
-        if recent_added:
-            added_header = SectionHeader("Recently Added")
-            self.sections.add_widget(added_header)
-            self.sections.add_widget(build_game_grid(recent_added, on_select=self._on_game_press))
+        # Sections whose cards would look the same keep their widgets untouched.
+        wanted = []
+        for name, items in sections:
+            signature = _section_signature(items)
+            widgets = self._section_widgets.get(name)
+            if widgets is None:
+                widgets = (SectionHeader(name), build_game_grid(items, on_select=self._on_game_press, on_focus=self._on_game_focus))
+                self._section_widgets[name] = widgets
+            elif self._section_signatures.get(name) != signature:
+                sync_game_grid(widgets[1], items, on_select=self._on_game_press, on_focus=self._on_game_focus)
+            self._section_signatures[name] = signature
+            wanted.extend(widgets)
+
+        if list(reversed(self.sections.children)) != wanted:
+            self.sections.clear_widgets()
+            for widget in wanted:
+                self.sections.add_widget(widget)
 
     def _on_game_press(self, game: dict[str, str]) -> None:
         from kivy.app import App
@@ -162,33 +191,41 @@ class HomeScreen(Screen):
         if hasattr(app, "launch_game"):
             app.launch_game(game)
 
+    def _on_game_focus(self, game: dict[str, str]) -> None:
+        from kivy.app import App
+        app = App.get_running_app()
+        if hasattr(app, "readahead_game"):
+            app.readahead_game(game)
+
     def _rebuild_nav(self, *_):
         if not self.nav_bar:
             return
-        self.nav_bar.clear_widgets()
+        # Buttons go back to the shared pool and come out re-labelled.
+        nav_button_pool.release_children(self.nav_bar)
 
-        home_btn = HoverButton(
-            text="Home",
-            size_hint=(None, 1),
-            width=110,
-            color=COLORS["text"],
+        home_btn = nav_button(
+            "Home",
             base_color=COLORS["accent"],
             hover_color=COLORS["tab_active"],
+            on_press=lambda *_: self._log_and_route("Home", "home"),
         )
-        home_btn.bind(on_press=lambda *_: self._log_and_route("Home", "home"))
         self.nav_bar.add_widget(home_btn)
 
         for platform in self.state.platforms:
-            btn = HoverButton(
-                text=platform.title(),
-                size_hint=(None, 1),
-                width=110,
-                color=COLORS["text"],
+            btn = nav_button(
+                platform.title(),
                 base_color=COLORS["panel"],
                 hover_color=COLORS["tab_active"],
+                on_press=lambda _b, p=platform: self._log_and_route(p, f"platform:{p}"),
+                on_hover=lambda p=platform: self._prefetch_platform(p),
             )
-            btn.bind(on_press=lambda _b, p=platform: self._log_and_route(p, f"platform:{p}"))
             self.nav_bar.add_widget(btn)
 
+    def _prefetch_platform(self, platform: str) -> None:
+        from kivy.app import App
+        app = App.get_running_app()
+        if hasattr(app, "prefetch_platform"):
+            app.prefetch_platform(platform)
+
     def _sync_nav_line(self, nav_frame):
         self._nav_line.points = [nav_frame.x, nav_frame.y, nav_frame.right, nav_frame.y]
@@ -8,6 +8,7 @@ from kivy.uix.scrollview import ScrollView
 from kivy.graphics import Color, Line
 
 from ...actions import set_route
+from ..frame_monitor import frame_monitor
 from ..widgets import (
     COLORS,
     apply_bg,
@@ -15,7 +16,10 @@ from ..widgets import (
     SearchInput,
     LoadingOverlay,
     build_game_grid,
-    HoverButton,
+    build_skeleton_grid,
+    sync_game_grid,
+    nav_button,
+    nav_button_pool,
 )
 
 class LibraryScreen(Screen):
@@ -23,6 +27,9 @@ class LibraryScreen(Screen):
         super().__init__(**kwargs)
         self.state = state
         self._search_text = ""
+        self._grid = None
+        self._grid_header = None
+        self._skeleton = None
         self.log = logging.getLogger(__name__)
         self.nav_bar = None
 
@@ -101,6 +108,7 @@ class LibraryScreen(Screen):
         self.overlay = LoadingOverlay()
 
         self.state.bind(current_games=self._rebuild_sections)
+        self.state.bind(games_loading=self._rebuild_sections)
         self.state.bind(current_platform=self._update_title)
         self.state.bind(platforms=self._rebuild_nav)
         self.state.bind(scan_in_progress=self._on_scan_state)
@@ -112,8 +120,12 @@ class LibraryScreen(Screen):
         self._search_text = value.strip()
         self._rebuild_sections()
 
+    @frame_monitor.timed("LibraryScreen._rebuild_sections")
     def _rebuild_sections(self, *_):
-        self.sections.clear_widgets()
+        if self.state.games_loading:
+            self._show_skeleton()
+            return
+
         games = list(self.state.current_games)
         self.count.text = f"{len(games)} games"
 
@@ -122,21 +134,11 @@ class LibraryScreen(Screen):
                 g for g in games
                 if self._search_text.lower() in g.get("title", "").lower()
             ]
-            header = SectionHeader("Search Results")
-            self.sections.add_widget(header)
-            if filtered:
-                self.sections.add_widget(build_game_grid(filtered, on_select=self._on_game_press))
-            else:
-                empty = Label(
-                    text="No matches.",
-                    color=COLORS["muted"],
-                    size_hint_y=None,
-                    height=24,
-                )
-                self.sections.add_widget(empty)
+            self._show_grid("Search Results", filtered, empty_text="No matches.")
             return
 
         if not games:
+            self.sections.clear_widgets()
             empty = Label(
                 text="No games found.",
                 color=COLORS["muted"],
@@ -146,9 +148,42 @@ class LibraryScreen(Screen):
             self.sections.add_widget(empty)
             return
 
-        header = SectionHeader("All Games")
-        self.sections.add_widget(header)
-        self.sections.add_widget(build_game_grid(games, on_select=self._on_game_press))
+        self._show_grid("All Games", games)
+
+    def _show_skeleton(self) -> None:
+        self.count.text = "Loading..."
+        if self._skeleton is None:
+            self._skeleton = build_skeleton_grid()
+        self.sections.clear_widgets()
+        self.sections.add_widget(self._skeleton)
+
+    def _show_grid(self, title: str, items, empty_text: str | None = None) -> None:
+        # The header and grid persist across rebuilds so unchanged cards are reused.
+        if self._grid_header is None:
+            self._grid_header = SectionHeader(title)
+        self._grid_header.label.text = title
+
+        if not items:
+            self.sections.clear_widgets()
+            self.sections.add_widget(self._grid_header)
+            empty = Label(
+                text=empty_text or "",
+                color=COLORS["muted"],
+                size_hint_y=None,
+                height=24,
+            )
+            self.sections.add_widget(empty)
+            return
+
+        if self._grid is None:
+            self._grid = build_game_grid(items, on_select=self._on_game_press, on_focus=self._on_game_focus)
+        else:
+            sync_game_grid(self._grid, items, on_select=self._on_game_press, on_focus=self._on_game_focus)
+
+        if list(reversed(self.sections.children)) != [self._grid_header, self._grid]:
+            self.sections.clear_widgets()
+            self.sections.add_widget(self._grid_header)
+            self.sections.add_widget(self._grid)
 
     def _on_game_press(self, game: dict[str, str]) -> None:
         from kivy.app import App
@@ -156,6 +191,12 @@ class LibraryScreen(Screen):
         if hasattr(app, "launch_game"):
             app.launch_game(game)
 
+    def _on_game_focus(self, game: dict[str, str]) -> None:
+        from kivy.app import App
+        app = App.get_running_app()
+        if hasattr(app, "readahead_game"):
+            app.readahead_game(game)
+
     def _on_scan_state(self, *_):
         if self.state.scan_in_progress:
             self.overlay.show()
@@ -173,31 +214,33 @@ class LibraryScreen(Screen):
     def _rebuild_nav(self, *_):
         if not self.nav_bar:
             return
-        self.nav_bar.clear_widgets()
+        # Buttons go back to the shared pool and come out re-labelled.
+        nav_button_pool.release_children(self.nav_bar)
 
-        home_btn = HoverButton(
-            text="Home",
-            size_hint=(None, 1),
-            width=110,
-            color=COLORS["text"],
+        home_btn = nav_button(
+            "Home",
             base_color=COLORS["panel"],
             hover_color=COLORS["tab_active"],
+            on_press=lambda *_: self._log_and_route("Home", "home"),
         )
-        home_btn.bind(on_press=lambda *_: self._log_and_route("Home", "home"))
         self.nav_bar.add_widget(home_btn)
 
         for platform in self.state.platforms:
             is_active = platform == self.state.current_platform
-            btn = HoverButton(
-                text=platform.title(),
-                size_hint=(None, 1),
-                width=110,
-                color=COLORS["text"],
+            btn = nav_button(
+                platform.title(),
                 base_color=COLORS["accent"] if is_active else COLORS["panel"],
                 hover_color=COLORS["tab_active"],
+                on_press=lambda _b, p=platform: self._log_and_route(p, f"platform:{p}"),
+                on_hover=lambda p=platform: self._prefetch_platform(p),
             )
-            btn.bind(on_press=lambda _b, p=platform: self._log_and_route(p, f"platform:{p}"))
             self.nav_bar.add_widget(btn)
 
+    def _prefetch_platform(self, platform: str) -> None:
+        from kivy.app import App
+        app = App.get_running_app()
+        if hasattr(app, "prefetch_platform"):
+            app.prefetch_platform(platform)
+
     def _sync_nav_line(self, nav_frame):
         self._nav_line.points = [nav_frame.x, nav_frame.y, nav_frame.right, nav_frame.y]
@@ -14,6 +14,9 @@ from kivy.properties import NumericProperty
 from kivy.uix.modalview import ModalView
 from kivy.uix.button import Button
 from kivy.core.window import Window
+from weakref import WeakSet
+
+from .frame_monitor import frame_monitor
 
 
 CARD_HEIGHT = 230
@@ -33,6 +36,43 @@ COLORS = {
 }
 
 
+class HoverTracker:
+    """
+    One Window.mouse_pos binding shared by every hover-aware widget, instead of
+    one binding per card/button. suspend() detaches it entirely (game running).
+    """
+
+    def __init__(self):
+        self._widgets: WeakSet = WeakSet()
+        self._bound = False
+        self._suspended = False
+
+    def add(self, widget) -> None:
+        self._widgets.add(widget)
+        if not self._bound and not self._suspended:
+            Window.bind(mouse_pos=self._on_mouse_pos)
+            self._bound = True
+
+    def suspend(self) -> None:
+        self._suspended = True
+        if self._bound:
+            Window.unbind(mouse_pos=self._on_mouse_pos)
+            self._bound = False
+
+    def resume(self) -> None:
+        self._suspended = False
+        if not self._bound:
+            Window.bind(mouse_pos=self._on_mouse_pos)
+            self._bound = True
+
+    def _on_mouse_pos(self, window, pos):
+        for widget in list(self._widgets):
+            widget._on_mouse_pos(window, pos)
+
+
+hover_tracker = HoverTracker()
+
+
 def apply_bg(widget, color):
     with widget.canvas.before:
         bg_color = Color(*color)
@@ -82,7 +122,7 @@ class TabButton(ButtonBehavior, BoxLayout):
 
 
 class GameCard(ButtonBehavior, BoxLayout):
-    def __init__(self, title: str, cover_source: str, on_press=None, **kwargs):
+    def __init__(self, title: str, cover_source: str, on_press=None, on_hover=None, **kwargs):
         super().__init__(
             orientation="vertical",
             size_hint=(1, None),
@@ -92,6 +132,8 @@ class GameCard(ButtonBehavior, BoxLayout):
             **kwargs,
         )
         self._on_press = on_press
+        self._on_hover = on_hover
+        self._hovered = False
         with self.canvas.before:
             self._bg_color = Color(*COLORS["card"])
             self._bg_rect = Rectangle(pos=self.pos, size=self.size)
@@ -123,13 +165,30 @@ class GameCard(ButtonBehavior, BoxLayout):
         self.add_widget(self.cover)
         self.add_widget(self.title)
         self.bind(pos=self._sync_canvas, size=self._sync_canvas)
-        Window.bind(mouse_pos=self._on_mouse_pos)
+        hover_tracker.add(self)
 
     def _sync_canvas(self, *_):
         self._bg_rect.pos = self.pos
         self._bg_rect.size = self.size
         self._border.rectangle = (self.x, self.y, self.width, self.height)
 
+    def update(self, title: str, cover_source: str, on_press=None, on_hover=None) -> None:
+        # Only touch properties that changed; a new source reloads the texture.
+        if self.title.text != title:
+            self.title.text = title
+        if self.cover_image.source != cover_source:
+            self.cover_image.source = cover_source
+        self._on_press = on_press
+        self._on_hover = on_hover
+
+    def recycle(self) -> None:
+        # Called by the pool: drop the handlers (they hold the game dict) and hover state.
+        self._on_press = None
+        self._on_hover = None
+        self._hovered = False
+        self.game_key = None
+        self._bg_color.rgba = COLORS["card"]
+
     def on_press(self):
         if self._on_press:
             self._on_press()
@@ -139,6 +198,70 @@ class GameCard(ButtonBehavior, BoxLayout):
             return
         inside = self.collide_point(*self.to_widget(*pos))
         self._bg_color.rgba = COLORS["panel_alt"] if inside else COLORS["card"]
+        if inside and not self._hovered and self._on_hover:
+            self._on_hover()
+        self._hovered = inside
+
+
+class WidgetPool:
+    """
+    Free list of detached widgets of one kind, shared by all screens.
+    Rebuilds release widgets here and acquire them back instead of
+    constructing new ones (and their canvas instructions) every time.
+    """
+
+    def __init__(self, factory, limit: int = 2048):
+        self._factory = factory
+        self._limit = limit
+        self._free: list = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self):
+        if self._free:
+            self.reused += 1
+            return self._free.pop()
+        self.created += 1
+        return self._factory()
+
+    def release(self, widget) -> None:
+        if widget.parent is not None:
+            widget.parent.remove_widget(widget)
+        if hasattr(widget, "recycle"):
+            widget.recycle()
+        if len(self._free) < self._limit:
+            self._free.append(widget)
+
+    def release_all(self, widgets) -> None:
+        for widget in list(widgets):
+            self.release(widget)
+
+    def release_children(self, parent) -> None:
+        """Empties `parent` in one clear_widgets() and pools what it held."""
+        widgets = list(parent.children)
+        parent.clear_widgets()
+        self.release_all(widgets)
+
+
+class SkeletonCard(BoxLayout):
+    """Placeholder card shown while a platform page loads."""
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            orientation="vertical",
+            size_hint=(1, None),
+            height=CARD_HEIGHT,
+            padding=8,
+            spacing=6,
+            **kwargs,
+        )
+        apply_bg(self, COLORS["card"])
+        cover = Widget(size_hint=(1, 0.78))
+        apply_bg(cover, COLORS["cover"])
+        title = Widget(size_hint_y=None, height=28)
+        apply_bg(title, COLORS["panel_alt"])
+        self.add_widget(cover)
+        self.add_widget(title)
 
 
 class SectionHeader(BoxLayout):
@@ -212,9 +335,28 @@ class LoadingSpinner(Widget):
 
     def start(self):
         self._anim.start(self)
+        LoadingSpinner._running.add(self)
 
     def stop(self):
         self._anim.cancel(self)
+        LoadingSpinner._running.discard(self)
+
+    # spinners that are spinning (running) and ones pause_all() stopped (paused)
+    _running: WeakSet = WeakSet()
+    _paused: WeakSet = WeakSet()
+
+    @classmethod
+    def pause_all(cls) -> None:
+        for spinner in list(cls._running):
+            spinner._anim.cancel(spinner)
+            cls._paused.add(spinner)
+
+    @classmethod
+    def resume_all(cls) -> None:
+        for spinner in list(cls._paused):
+            if spinner in cls._running:
+                spinner._anim.start(spinner)
+        cls._paused.clear()
 
 
 class LoadingOverlay(ModalView):
@@ -258,7 +400,28 @@ class LoadingOverlay(ModalView):
             self.dismiss()
 
 
-def build_game_grid(items: list[dict[str, str]], cols: int = 5, on_select=None) -> GridLayout:
+def build_skeleton_grid(count: int = 15, cols: int = 5) -> GridLayout:
+    grid = GridLayout(
+        cols=cols,
+        spacing=12,
+        padding=[10, 8],
+        size_hint_y=None,
+        row_force_default=True,
+        row_default_height=CARD_HEIGHT,
+    )
+    grid.bind(minimum_height=grid.setter("height"))
+    for _ in range(count):
+        grid.add_widget(SkeletonCard())
+    return grid
+
+
+def _item_key(item: dict[str, str]):
+    # DB rows have an id; cache-only items fall back to their launch target.
+    return item.get("id") or (item.get("platform", ""), item.get("launch_target", ""))
+
+
+@frame_monitor.timed("build_game_grid")
+def build_game_grid(items: list[dict[str, str]], cols: int = 5, on_select=None, on_focus=None) -> GridLayout:
     grid = GridLayout(
         cols=cols,
         spacing=12,
@@ -268,25 +431,109 @@ def build_game_grid(items: list[dict[str, str]], cols: int = 5, on_select=None)
         row_default_height=CARD_HEIGHT,
     )
     grid.bind(minimum_height=grid.setter("height"))
+    sync_game_grid(grid, items, on_select=on_select, on_focus=on_focus)
+    return grid
+
+
+@frame_monitor.timed("sync_game_grid")
+def sync_game_grid(grid: GridLayout, items: list[dict[str, str]], on_select=None, on_focus=None) -> None:
+    """
+    Points an existing grid at `items`. Cards of games that are still there
+    (matched by id) stay as they are; the rest go back to the card pool and
+    new games take cards from it. on_focus(item) fires when the pointer enters
+    a card.
+    """
+    wanted = {_item_key(item) for item in items}
+    existing = {}
+    dropped: list[GameCard] = []
+    for card in grid.children:
+        key = getattr(card, "game_key", None)
+        if key in wanted and key not in existing:
+            existing[key] = card
+        else:
+            dropped.append(card)
+
+    cards: list[GameCard] = []
     for item in items:
+        key = _item_key(item)
         handler = None
         if on_select:
             handler = lambda i=item: on_select(i)
-        grid.add_widget(GameCard(item.get("title", ""), item.get("cover_path", ""), on_press=handler))
-    return grid
+        focus = (lambda i=item: on_focus(i)) if on_focus else None
+        card = existing.pop(key, None)
+        if card is None:
+            card = card_pool.acquire()
+            card.game_key = key
+        card.update(item.get("title", ""), item.get("cover_path", ""), on_press=handler, on_hover=focus)
+        cards.append(card)
+
+    # grid.children is in reverse add order
+    if not dropped and list(reversed(grid.children)) == cards:
+        return
+    # Detach everything at once (one remove_widget per card is O(n) each),
+    # then pool the dropped cards, already parentless.
+    grid.clear_widgets()
+    card_pool.release_all(dropped)
+    for card in cards:
+        grid.add_widget(card)
 
 
 class HoverButton(Button):
-    def __init__(self, base_color, hover_color, **kwargs):
+    def __init__(self, base_color, hover_color, on_hover=None, **kwargs):
         super().__init__(**kwargs)
         self._base_color = base_color
         self._hover_color = hover_color
+        self._on_hover = on_hover
+        self._hovered = False
+        self._action = None
         self.background_normal = ""
         self.background_color = base_color
-        Window.bind(mouse_pos=self._on_mouse_pos)
+        hover_tracker.add(self)
+
+    def configure(self, text: str, base_color, hover_color, on_press=None, on_hover=None) -> None:
+        """Re-targets a pooled button; on_press here replaces any earlier one."""
+        self.text = text
+        self._base_color = base_color
+        self._hover_color = hover_color
+        self.background_color = base_color
+        self._on_hover = on_hover
+        if self._action is not None:
+            self.unbind(on_press=self._action)
+        self._action = on_press
+        if on_press is not None:
+            self.bind(on_press=on_press)
+
+    def recycle(self) -> None:
+        self.configure("", self._base_color, self._hover_color)
+        self._hovered = False
 
     def _on_mouse_pos(self, _window, pos):
         if not self.get_root_window():
             return
         inside = self.collide_point(*self.to_widget(*pos))
         self.background_color = self._hover_color if inside else self._base_color
+        # on_hover fires once per pointer entry, not on every mouse move
+        if inside and not self._hovered and self._on_hover:
+            self._on_hover()
+        self._hovered = inside
+
+
+NAV_BUTTON_WIDTH = 110
+
+card_pool = WidgetPool(lambda: GameCard("", ""))
+nav_button_pool = WidgetPool(
+    lambda: HoverButton(
+        size_hint=(None, 1),
+        width=NAV_BUTTON_WIDTH,
+        color=COLORS["text"],
+        base_color=COLORS["panel"],
+        hover_color=COLORS["tab_active"],
+    ),
+    limit=256,
+)
+
+
+def nav_button(text: str, base_color, hover_color, on_press=None, on_hover=None) -> HoverButton:
+    btn = nav_button_pool.acquire()
+    btn.configure(text, base_color, hover_color, on_press=on_press, on_hover=on_hover)
+    return btn